@@ -63,14 +63,12 @@ async def main():
     print("-" * 70)
     print("Transcribing and monitoring confidence in real-time...\n")
 
-    await platform.start_live_session(session, audio)
+    session_task = await platform.start_live_session(session, audio)
 
-    # Wait for session to complete
-    # In a real application, this would run until manually stopped
-    await asyncio.sleep(35)
-
-    # Stop the session
-    await platform.stop_live_session()
+    # Join the session: returns once the audio stream is exhausted and every
+    # agent has caught up. In a real application, this would run until
+    # manually stopped with platform.stop_live_session()
+    await session_task
 
     print("\n⏹️  SESSION ENDED")
     print("=" * 70)
@@ -17,11 +17,12 @@ Key Features:
 __version__ = "0.1.0"
 
 # Primary platform interface
-from pacing.platform import PacingPlatform, OperatingMode
+from pacing.platform import PacingPlatform, OperatingMode, PlatformStatus
 
 # Core data models
 from pacing.models.data_models import (
     TranscriptionResult,
+    WordTiming,
     PatientGraph,
     Event,
     EventType,
@@ -32,6 +33,7 @@ from pacing.models.data_models import (
     InterventionType,
     RiskReport,
     SessionMetadata,
+    SessionContext,
 )
 
 # Simulation engine
@@ -52,6 +54,12 @@ from pacing.impl.defaults.mock_transcriber import (
 from pacing.impl.defaults.mock_audio import MockAudioProvider
 from pacing.impl.defaults.mock_risk_model import MockBayesianModel, MockSimulationModel
 
+# Audio and transcription processing
+from pacing.core.audio_interfaces import pcm16_to_float32
+from pacing.impl.audio.vad import VADFilteredAudioProvider
+from pacing.impl.transcription.batching import BatchedTranscriber
+from pacing.impl.transcription.local_agreement import LocalAgreement2
+
 # Key agents
 from pacing.impl.agents.uncertainty_auditor import UncertaintyAuditor
 
@@ -59,8 +67,10 @@ __all__ = [
     # Platform
     "PacingPlatform",
     "OperatingMode",
+    "PlatformStatus",
     # Data Models
     "TranscriptionResult",
+    "WordTiming",
     "PatientGraph",
     "Event",
     "EventType",
@@ -71,6 +81,7 @@ __all__ = [
     "InterventionType",
     "RiskReport",
     "SessionMetadata",
+    "SessionContext",
     # Simulation
     "SimulationContext",
     "Mutation",
@@ -84,6 +95,11 @@ __all__ = [
     "MockAudioProvider",
     "MockBayesianModel",
     "MockSimulationModel",
+    # Audio and Transcription Processing
+    "pcm16_to_float32",
+    "VADFilteredAudioProvider",
+    "BatchedTranscriber",
+    "LocalAgreement2",
     # Agents
     "UncertaintyAuditor",
 ]
@@ -8,7 +8,11 @@ and perform specialized tasks (guidance, auditing, scribe extraction, etc.).
 from abc import ABC, abstractmethod
 from typing import List, Optional, Any
 
-from pacing.models.data_models import TranscriptionResult, ExtractedEntity
+from pacing.models.data_models import (
+    TranscriptionResult,
+    ExtractedEntity,
+    SessionContext,
+)
 
 
 class ISidecarAgent(ABC):
@@ -33,9 +37,15 @@ class ISidecarAgent(ABC):
     - Extracted data (entities) is retained; raw transcriptions may be ephemeral
     """
 
+    # Upper bound (in milliseconds) on a single on_transcription_update call.
+    # Session streams cancel updates that exceed it; None disables the bound.
+    timeout_ms: Optional[float] = None
+
     @abstractmethod
     async def on_transcription_update(
-        self, transcription: TranscriptionResult, context: Optional[dict] = None
+        self,
+        transcription: TranscriptionResult,
+        context: Optional[SessionContext] = None,
     ) -> None:
         """
         Process a new transcription update.
@@ -45,7 +55,8 @@ class ISidecarAgent(ABC):
 
         Args:
             transcription: The new transcription result
-            context: Optional context (e.g., session metadata, patient ID)
+            context: Session identifiers (session, patient, clinician); the
+                same immutable object for every update of a session
 
         Notes:
             - This method should be non-blocking and fast
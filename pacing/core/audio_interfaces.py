@@ -5,10 +5,63 @@ These interfaces define how audio is captured and streamed into the system.
 Implementations can range from microphone input to file playback to network streams.
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
 from typing import AsyncIterator, Iterator
 import numpy as np
 
+# Marks the end of the sync iterator when bridged to async
+_END_OF_STREAM = object()
+
+# Full scale of 16-bit PCM, the audio wire format
+PCM16_SCALE = 32768.0
+
+
+def pcm16_to_float32(chunk: np.ndarray) -> np.ndarray:
+    """
+    Convert int16 PCM samples to float32 in [-1, 1).
+
+    Transcribers call this right before handing audio to a model that wants
+    floats, so the rest of the audio path moves half the bytes. Float input is
+    passed through unchanged (no copy).
+
+    >>> pcm16_to_float32(np.array([0, 16384, -32768], dtype=np.int16)).tolist()
+    [0.0, 0.5, -1.0]
+    >>> floats = np.zeros(3, dtype=np.float32)
+    >>> pcm16_to_float32(floats) is floats
+    True
+    """
+    if chunk.dtype.kind == "f":
+        return chunk.astype(np.float32, copy=False)
+    # One fused cast + scale, no int -> float64 intermediate
+    return np.multiply(chunk, 1.0 / PCM16_SCALE, dtype=np.float32)
+
+
+def float32_to_pcm16(chunk: np.ndarray) -> np.ndarray:
+    """
+    Convert float samples in [-1, 1) to int16 PCM (inverse of pcm16_to_float32).
+
+    Out-of-range samples are clipped to full scale. int16 input is passed
+    through unchanged (no copy).
+
+    Raises:
+        TypeError: If the samples are neither int16 nor floating point
+
+    >>> floats = np.array([0.0, 0.5, -1.0, 1.0], dtype=np.float32)
+    >>> float32_to_pcm16(floats).tolist()
+    [0, 16384, -32768, 32767]
+    >>> pcm = np.zeros(3, dtype=np.int16)
+    >>> float32_to_pcm16(pcm) is pcm
+    True
+    """
+    if chunk.dtype == np.int16:
+        return chunk
+    if chunk.dtype.kind != "f":
+        raise TypeError(f"Expected int16 or float audio, got {chunk.dtype}")
+    scaled = np.rint(np.multiply(chunk, PCM16_SCALE, dtype=np.float32))
+    return np.clip(scaled, -PCM16_SCALE, PCM16_SCALE - 1).astype(np.int16)
+
 
 class IAudioProvider(ABC):
     """
@@ -25,8 +78,18 @@ class IAudioProvider(ABC):
     1. Starting and stopping audio capture
     2. Yielding audio chunks at a consistent sample rate
     3. Handling audio device configuration
+
+    Audio travels through the platform as int16 PCM (as captured by most
+    microphones), half the bandwidth of float32. Conversion to float happens
+    only inside transcribers that need it (see pcm16_to_float32). Providers
+    may still yield float32 samples in [-1, 1); the session converts them
+    to int16 on arrival (see float32_to_pcm16).
     """
 
+    # Max chunks buffered between the capture thread and the event loop
+    # (see the default get_audio_chunks_async implementation)
+    async_queue_size: int = 4
+
     @abstractmethod
     def start_stream(self) -> None:
         """
@@ -53,7 +116,7 @@ class IAudioProvider(ABC):
         Yield audio data chunks as they become available.
 
         Yields:
-            np.ndarray: Audio samples (typically float32 or int16)
+            np.ndarray: Audio samples, int16 PCM (preferred) or float32 in [-1, 1)
 
         Notes:
             - The sample rate should be consistent and queryable via get_sample_rate()
@@ -74,11 +137,51 @@ class IAudioProvider(ABC):
         Example:
             async for chunk in audio_provider.get_audio_chunks_async():
                 await transcriber.transcribe_chunk(chunk)
+
+        Notes:
+            The default implementation runs the blocking get_audio_chunks()
+            iterator in a worker thread that feeds a bounded queue
+            (``async_queue_size`` chunks), so capture overlaps with downstream
+            transcription and agent work instead of blocking the event loop.
+            The bound provides backpressure when consumers fall behind.
+            Subclasses with a native async source should override this.
         """
-        # Default implementation wraps synchronous version
-        # Subclasses should override for true async behavior
-        for chunk in self.get_audio_chunks():
-            yield chunk
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.async_queue_size)
+        stop = threading.Event()
+
+        def _put(item) -> None:
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def _pump() -> None:
+            try:
+                for chunk in self.get_audio_chunks():
+                    if stop.is_set():
+                        return
+                    _put(chunk)
+            except BaseException as error:  # Forwarded to the consumer
+                if not stop.is_set():
+                    _put(error)
+                return
+            if not stop.is_set():
+                _put(_END_OF_STREAM)
+
+        producer = loop.run_in_executor(None, _pump)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+            await producer
+        finally:
+            # Consumer stopped early: tell the producer to quit and free any
+            # put() it may be blocked on
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
 
     @abstractmethod
     def get_sample_rate(self) -> int:
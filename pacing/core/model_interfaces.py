@@ -7,7 +7,7 @@ Bayesian networks or machine learning models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from pacing.models.data_models import PatientGraph, RiskReport
 
@@ -58,6 +58,18 @@ class IRiskModel(ABC):
         """
         pass
 
+    def prepare(self) -> None:
+        """
+        One-time setup, called once when the model is installed in a platform.
+
+        Notes:
+            - Do per-model work that does not depend on the patient here rather
+              than in calculate_risk: load weights, build lookup tables, or
+              specialize feature extraction (e.g., precompile an extractor over
+              PatientGraph.to_soa columns)
+            - The default does nothing
+        """
+
     def get_model_version(self) -> str:
         """
         Get the version identifier for this model.
@@ -136,3 +148,51 @@ class ISimulationModel(IRiskModel):
             print(f"Risk reduction: {delta['delta']:.2%}")
         """
         pass
+
+    def calculate_risk_batch(
+        self,
+        graphs: List[PatientGraph],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[RiskReport]:
+        """
+        Calculate risk for several patient graphs at once.
+
+        Args:
+            graphs: Patient graphs to score (e.g., scenario variants of one patient)
+            options: Optional configuration, applied to every graph
+
+        Returns:
+            List[RiskReport]: One report per graph, in input order
+
+        Notes:
+            - The default scores graphs one at a time with calculate_risk
+            - Override to evaluate the batch in one pass (e.g., stack features
+              into a matrix and score it with a single matrix product)
+        """
+        return [self.calculate_risk(graph, options) for graph in graphs]
+
+    def calculate_risk_deltas(
+        self,
+        baseline: PatientGraph,
+        modified: List[PatientGraph],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare several modified scenarios against one baseline.
+
+        Args:
+            baseline: The current/actual patient state
+            modified: Hypothetical patient states
+            options: Optional configuration
+
+        Returns:
+            List[dict]: One calculate_risk_delta result per modified graph
+
+        Notes:
+            - The default calls calculate_risk_delta per scenario, which may
+              re-score the baseline each time; batch-capable models override
+              this to score the baseline once
+        """
+        return [
+            self.calculate_risk_delta(baseline, graph, options) for graph in modified
+        ]
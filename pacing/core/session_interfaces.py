@@ -29,6 +29,9 @@ class ISessionStream(ABC):
     - It enforces privacy boundaries (agents don't see raw audio)
     - It's observable (agents subscribe to it)
     - It's composable (add/remove agents dynamically)
+    - Agents are dispatched concurrently: a broadcast costs max(agent_i),
+      not sum(agent_i), and a slow or failing agent must not stall the others
+      (bounded by ISidecarAgent.timeout_ms where set)
     """
 
     @abstractmethod
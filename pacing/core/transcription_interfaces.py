@@ -6,8 +6,9 @@ various speech-to-text services (Deepgram, Whisper, Google Speech, etc.) or
 mock transcribers for testing.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 import numpy as np
 
 from pacing.models.data_models import TranscriptionResult
@@ -39,7 +40,7 @@ class ITranscriber(ABC):
         Transcribe a single audio chunk.
 
         Args:
-            audio_chunk: Audio samples (typically float32 or int16)
+            audio_chunk: int16 PCM audio samples
             sample_rate: Sample rate in Hz
             is_final: Whether this is the final chunk in a sequence
 
@@ -47,12 +48,48 @@ class ITranscriber(ABC):
             TranscriptionResult: The transcription with confidence score
 
         Notes:
+            - Models that take float input should convert with
+              pcm16_to_float32 right before the model call
             - For streaming transcription, is_final=False produces partial results
             - Implementations should handle silence gracefully
             - Empty audio should return empty text with high confidence
         """
         pass
 
+    async def transcribe_batch(
+        self,
+        audio_chunks: List[np.ndarray],
+        sample_rate: int,
+        is_final: bool = False,
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe several independent audio chunks in one call.
+
+        Backends with a native batched API (e.g., a GPU model that takes a
+        list of inputs) should override this so that encoder and launch
+        overhead is amortized across the batch. The default implementation
+        runs transcribe_chunk() concurrently for each chunk.
+
+        Args:
+            audio_chunks: Audio chunks to transcribe
+            sample_rate: Sample rate in Hz (shared by all chunks)
+            is_final: Whether these are final chunks in their sequences
+
+        Returns:
+            List[TranscriptionResult]: One result per chunk, in input order
+        """
+        if len(audio_chunks) == 1:
+            # Nothing to overlap: skip wrapping the coroutine in a gather task
+            return [await self.transcribe_chunk(audio_chunks[0], sample_rate, is_final)]
+        return list(
+            await asyncio.gather(
+                *[
+                    self.transcribe_chunk(chunk, sample_rate, is_final)
+                    for chunk in audio_chunks
+                ]
+            )
+        )
+
     async def transcribe_stream(
         self, audio_stream: AsyncIterator[np.ndarray], sample_rate: int
     ) -> AsyncIterator[TranscriptionResult]:
@@ -79,6 +116,84 @@ class ITranscriber(ABC):
             if result.text:  # Only yield non-empty transcriptions
                 yield result
 
+    async def transcribe_stream_batched(
+        self,
+        audio_stream: AsyncIterator[np.ndarray],
+        sample_rate: int,
+        max_batch_duration_ms: float = 500.0,
+        max_wait_ms: Optional[float] = None,
+    ) -> AsyncIterator[TranscriptionResult]:
+        """
+        Transcribe a stream, coalescing consecutive chunks into fewer calls.
+
+        Like transcribe_stream(), but chunks are buffered and submitted as one
+        concatenated transcribe_chunk() call once they span
+        ``max_batch_duration_ms``, so per-call overhead (model launch, network
+        round-trip) is paid per batch rather than per chunk. The next chunk is
+        read while a batch is being transcribed.
+
+        Args:
+            audio_stream: Async iterator of audio chunks
+            sample_rate: Sample rate in Hz
+            max_batch_duration_ms: Audio duration that triggers a submission
+            max_wait_ms: Max time the first buffered chunk may wait for the
+                batch to fill; a partial batch is submitted when it expires
+                (None waits for the duration or the end of the stream)
+
+        Yields:
+            TranscriptionResult: Non-empty transcriptions, one per batch
+
+        Notes:
+            - The last (possibly partial) batch is submitted with is_final=True
+            - Larger batches mean fewer calls but later results; max_wait_ms
+              bounds the added latency when audio arrives slowly
+        """
+        loop = asyncio.get_running_loop()
+        target_samples = max(1, int(sample_rate * max_batch_duration_ms / 1000))
+        max_wait = None if max_wait_ms is None else max_wait_ms / 1000.0
+        iterator = audio_stream.__aiter__()
+
+        chunks: List[np.ndarray] = []
+        n_samples = 0
+        deadline: Optional[float] = None
+        pending: Optional[asyncio.Future] = None
+        exhausted = False
+        try:
+            while not exhausted:
+                # Keep one read in flight; a timeout flushes the buffer without
+                # cancelling it (that would close the audio generator)
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+                if done:
+                    try:
+                        chunk = pending.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        chunks.append(chunk)
+                        n_samples += len(chunk)
+                        if deadline is None and max_wait is not None:
+                            deadline = loop.time() + max_wait
+                    pending = None
+                    if not exhausted and n_samples < target_samples:
+                        continue
+
+                if not chunks:
+                    continue
+                audio = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+                chunks, n_samples, deadline = [], 0, None
+                result = await self.transcribe_chunk(
+                    audio, sample_rate, is_final=exhausted
+                )
+                if result.text:  # Only yield non-empty transcriptions
+                    yield result
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     @abstractmethod
     def supports_speaker_diarization(self) -> bool:
         """
@@ -101,3 +216,13 @@ class ITranscriber(ABC):
             "version": "unknown",
             "language": "en-US",
         }
+
+    async def aclose(self) -> None:
+        """
+        Release background tasks or connections held by the transcriber.
+
+        The session stream calls this when a session stops. The default does
+        nothing; transcribers that start workers or open sockets override it.
+        Implementations should be safe to call more than once.
+        """
+        pass
@@ -0,0 +1,115 @@
+"""
+Multi-keyword substring matching for agents that gate on vocabularies.
+
+A KeywordMatcher compiles its keywords once and then answers two questions
+about a text, each in a single scan instead of one ``in`` test per keyword:
+does any keyword occur (stopping at the first hit), and which keywords occur,
+including keywords that overlap or sit inside one another.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable
+
+_END = ""  # Trie key marking that a keyword ends at this node
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, dict]:
+    """Nested dict trie: one key per next character, _END where a word ends."""
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    return root
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """
+    Render a trie as a regex whose alternations share common prefixes.
+
+    Sibling branches start with different characters, so the engine commits to
+    at most one of them at each step instead of retrying every keyword. A node
+    where a keyword ends makes its continuation an optional greedy group, so the
+    longest keyword through the trie is preferred.
+
+    >>> _trie_pattern(_build_trie(["dose", "dosage", "mg"]))
+    '(?:dos(?:age|e)|mg)'
+    >>> _trie_pattern(_build_trie(["dose", "dosed"]))
+    'dose(?:d)?'
+    """
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    if _END in node:
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class KeywordMatcher:
+    """
+    Find which of a fixed set of keywords occur in a text.
+
+    Matching is plain, case-sensitive substring matching; callers normalize
+    case themselves (e.g., lowercase both keywords and text).
+
+    The keywords are compiled as a prefix trie rendered into one regex, so
+    keywords sharing a prefix ("dose"/"dosage", "mg"/"methadone") are walked
+    together rather than tried one after another.
+
+    ``find_all`` scans with a zero-width lookahead so a match is tried at every
+    position, longest keyword first. Keywords that are prefixes of the longest
+    match at a position are added from a table built once, which is how every
+    overlapping occurrence is reported in one pass (the role output links play
+    in an Aho-Corasick automaton).
+
+    >>> matcher = KeywordMatcher(["dose", "overdose", "mg"])
+    >>> matcher.contains("an overdose of 5mg")
+    True
+    >>> sorted(matcher.find_all("an overdose of 5mg"))
+    ['dose', 'mg', 'overdose']
+    >>> matcher.contains("nothing here")
+    False
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Substrings to look for (empty strings are ignored)
+        """
+        self.keywords: FrozenSet[str] = frozenset(k for k in keywords if k)
+
+        # The trie prefers the longest keyword at a position; the shorter ones
+        # it hides are recovered via _prefixes
+        alternation = _trie_pattern(_build_trie(self.keywords))
+        if alternation:
+            self._scanner = re.compile(alternation)
+            self._finder = re.compile(f"(?=({alternation}))")
+        else:
+            # An empty alternation would match everywhere; (?!) never matches
+            self._scanner = self._finder = re.compile("(?!)")
+
+        # Keyword -> every keyword that is a prefix of it (itself included)
+        self._prefixes = {
+            keyword: tuple(k for k in self.keywords if keyword.startswith(k))
+            for keyword in self.keywords
+        }
+
+    def contains(self, text: str) -> bool:
+        """Return True if any keyword occurs in text, stopping at the first."""
+        return self._scanner.search(text) is not None
+
+    def find_all(self, text: str) -> FrozenSet[str]:
+        """Return every keyword occurring in text, overlapping ones included."""
+        found = set()
+        for match in self._finder.finditer(text):
+            found.update(self._prefixes[match.group(1)])
+        return frozenset(found)
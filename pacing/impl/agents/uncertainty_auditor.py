@@ -5,12 +5,56 @@ This agent monitors transcription confidence scores and flags low-confidence
 segments for human verification, implementing a human-in-the-loop safety mechanism.
 """
 
-import uuid
-from typing import Optional, List
+import bisect
+import heapq
+import itertools
+import logging
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 
 from pacing.core.agent_interfaces import ISidecarAgent
-from pacing.models.data_models import TranscriptionResult, ReviewQueueItem
+from pacing.impl.agents.keyword_matcher import KeywordMatcher
+from pacing.models.data_models import (
+    TranscriptionResult,
+    ReviewQueueItem,
+    SessionContext,
+)
+
+# Per-flag messages go through logging (lazily formatted, filtered by level)
+# rather than print, which would take the stdout lock on every flagged update
+logger = logging.getLogger(__name__)
+
+# Review priority for low-confidence segments by confidence band: scores
+# below 0.50 get 5, below 0.60 get 3, and the rest under the threshold get 2.
+# Looked up with one bisect over the sorted band bounds.
+_LOW_CONFIDENCE_BOUNDS = (0.50, 0.60)
+_LOW_CONFIDENCE_PRIORITIES = (5, 3, 2)
+_MEDICAL_TERM_PRIORITY = 4  # High priority for medication names
+
+# Medical terms that should be flagged even with decent confidence
+DEFAULT_MEDICAL_TERMS = frozenset(
+    {
+        "buprenorphine",
+        "naloxone",
+        "methadone",
+        "suboxone",
+        "opioid",
+        "benzodiazepine",
+        "fentanyl",
+        "morphine",
+        "mg",
+        "milligram",
+        "dose",
+        "dosage",
+        "prescription",
+    }
+)
+
+
+# Shared by every auditor: the defaults are compiled once at import, and a
+# matcher without keywords stands in when medical-term flagging is off
+_DEFAULT_TERM_MATCHER = KeywordMatcher(DEFAULT_MEDICAL_TERMS)
+_NO_TERM_MATCHER = KeywordMatcher(())
 
 
 class UncertaintyAuditor(ISidecarAgent):
@@ -31,6 +75,8 @@ class UncertaintyAuditor(ISidecarAgent):
     - confidence_threshold: Below this, segment is flagged (default: 0.70)
     - priority_rules: Customize prioritization logic
     - max_queue_size: Maximum review queue size before warning
+    - medical_terms: Terms flagged regardless of confidence (matched as
+      lowercase substrings; fixed at construction)
 
     Privacy Note:
     - The auditor stores transcriptions (text) for review, not raw audio
@@ -42,6 +88,7 @@ class UncertaintyAuditor(ISidecarAgent):
         confidence_threshold: float = 0.70,
         max_queue_size: int = 100,
         auto_flag_medical_terms: bool = True,
+        medical_terms: Optional[Iterable[str]] = None,
     ):
         """
         Initialize the Uncertainty Auditor.
@@ -50,38 +97,53 @@ class UncertaintyAuditor(ISidecarAgent):
             confidence_threshold: Confidence below this triggers flagging (0.0-1.0)
             max_queue_size: Maximum items in review queue before warning
             auto_flag_medical_terms: Automatically flag medical/substance terms
+            medical_terms: Terms to flag (defaults to DEFAULT_MEDICAL_TERMS)
         """
         if not 0.0 <= confidence_threshold <= 1.0:
             raise ValueError("confidence_threshold must be between 0.0 and 1.0")
 
         self.confidence_threshold = confidence_threshold
         self.max_queue_size = max_queue_size
-        self.auto_flag_medical_terms = auto_flag_medical_terms
 
-        self.review_queue: List[ReviewQueueItem] = []
+        # Min-heap of (-priority, insertion order, item): O(log n) inserts,
+        # highest priority first and FIFO within a priority when sorted
+        self._review_heap: List[Tuple[int, int, ReviewQueueItem]] = []
+        self._review_counter = itertools.count()
+        # Item ids are "<session id>-<n>": unique within this auditor (the
+        # counter never resets) without an entropy read per flagged segment
+        self._item_ids = itertools.count()
+        # Sorted snapshot of the heap, rebuilt only after the queue changes
+        self._sorted_queue: Optional[Tuple[ReviewQueueItem, ...]] = None
+        # Warn once per excursion over max_queue_size, not on every flag
+        self._queue_size_warned = False
         self.total_transcriptions_processed = 0
         self.total_flagged = 0
         self.current_session_id: Optional[str] = None
 
-        # Medical terms that should be flagged even with decent confidence
-        self.medical_terms = {
-            "buprenorphine",
-            "naloxone",
-            "methadone",
-            "suboxone",
-            "opioid",
-            "benzodiazepine",
-            "fentanyl",
-            "morphine",
-            "mg",
-            "milligram",
-            "dose",
-            "dosage",
-            "prescription",
-        }
+        if medical_terms is None:
+            self.medical_terms = DEFAULT_MEDICAL_TERMS
+            self._term_matcher = _DEFAULT_TERM_MATCHER
+        else:
+            self.medical_terms = frozenset(term.lower() for term in medical_terms)
+            self._term_matcher = KeywordMatcher(self.medical_terms)
+        # Sets _term_scan: the matcher, or one that never matches when disabled
+        self.auto_flag_medical_terms = auto_flag_medical_terms
+
+    @property
+    def auto_flag_medical_terms(self) -> bool:
+        """Whether segments mentioning medical terms are flagged."""
+        return self._term_scan is not _NO_TERM_MATCHER
+
+    @auto_flag_medical_terms.setter
+    def auto_flag_medical_terms(self, enabled: bool) -> None:
+        # Chosen here rather than tested per update: most segments contain
+        # no term and cost one scan, and none at all when disabled
+        self._term_scan = self._term_matcher if enabled else _NO_TERM_MATCHER
 
     async def on_transcription_update(
-        self, transcription: TranscriptionResult, context: Optional[dict] = None
+        self,
+        transcription: TranscriptionResult,
+        context: Optional[SessionContext] = None,
     ) -> None:
         """
         Process a transcription and flag if confidence is low.
@@ -92,46 +154,61 @@ class UncertaintyAuditor(ISidecarAgent):
         """
         self.total_transcriptions_processed += 1
 
-        # Skip empty transcriptions
-        if not transcription.text or not transcription.text.strip():
-            return
+        flag = self._evaluate(
+            transcription.text_lower, transcription.confidence_score
+        )
 
-        # Check if this segment should be flagged
-        should_flag = False
-        reason = ""
-        priority = 1
+        # If flagged, add to review queue
+        if flag is not None:
+            reason, priority = flag
+            self._add_to_review_queue(transcription, reason, priority, context)
+
+    def _evaluate(
+        self, text: str, confidence_score: float
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Decide whether a transcription segment needs human review.
+
+        This is the per-update hot path: a pure function of its inputs and the
+        auditor configuration, with the cheap confidence comparison first and
+        the text scan only for segments that pass it.
+
+        Args:
+            text: Transcribed text, lowercased (TranscriptionResult.text_lower)
+            confidence_score: Acoustic confidence (0.0-1.0)
+
+        Returns:
+            Optional[Tuple[str, int]]: (reason, priority) if the segment should
+            be flagged, else None
+        """
+        # Skip empty transcriptions
+        if not text or text.isspace():
+            return None
 
         # Primary criterion: low confidence
-        if transcription.confidence_score < self.confidence_threshold:
-            should_flag = True
-            reason = f"Low confidence score: {transcription.confidence_score:.2%}"
+        if confidence_score < self.confidence_threshold:
             # Higher priority for very low confidence
-            if transcription.confidence_score < 0.50:
-                priority = 5
-            elif transcription.confidence_score < 0.60:
-                priority = 3
-            else:
-                priority = 2
+            priority = _LOW_CONFIDENCE_PRIORITIES[
+                bisect.bisect_right(_LOW_CONFIDENCE_BOUNDS, confidence_score)
+            ]
+            return f"Low confidence score: {confidence_score:.2%}", priority
 
         # Secondary criterion: medical terms (even if confidence is acceptable)
-        if self.auto_flag_medical_terms and not should_flag:
-            text_lower = transcription.text.lower()
-            found_terms = [term for term in self.medical_terms if term in text_lower]
-            if found_terms:
-                should_flag = True
-                reason = f"Contains medical terms: {', '.join(found_terms)}"
-                priority = 4  # High priority for medication names
-
-        # If flagged, add to review queue
-        if should_flag:
-            self._add_to_review_queue(transcription, reason, priority, context)
+        if not self._term_scan.contains(text):
+            return None
+        # Rare path: list every term present (including overlapping ones)
+        found_terms = sorted(self._term_scan.find_all(text))
+        return (
+            f"Contains medical terms: {', '.join(found_terms)}",
+            _MEDICAL_TERM_PRIORITY,
+        )
 
     def _add_to_review_queue(
         self,
         transcription: TranscriptionResult,
         reason: str,
         priority: int,
-        context: Optional[dict] = None,
+        context: Optional[SessionContext] = None,
     ) -> None:
         """
         Add an item to the review queue.
@@ -142,30 +219,35 @@ class UncertaintyAuditor(ISidecarAgent):
             priority: Priority level (1-5)
             context: Additional context
         """
-        item = ReviewQueueItem(
-            item_id=str(uuid.uuid4()),
+        session_id = self.current_session_id or "nosession"
+        # Priorities come from this module's 1-5 constants; skip validation
+        item = ReviewQueueItem.model_construct(
+            item_id=f"{session_id}-{next(self._item_ids)}",
             transcription=transcription,
             reason=reason,
             priority=priority,
         )
 
-        self.review_queue.append(item)
+        heapq.heappush(
+            self._review_heap, (-priority, next(self._review_counter), item)
+        )
+        self._sorted_queue = None
         self.total_flagged += 1
 
-        # Sort queue by priority (highest first)
-        self.review_queue.sort(key=lambda x: x.priority, reverse=True)
-
-        # Warn if queue is getting large
-        if len(self.review_queue) > self.max_queue_size:
-            print(
-                f"[UncertaintyAuditor] WARNING: Review queue size ({len(self.review_queue)}) "
-                f"exceeds max ({self.max_queue_size}). Consider reviewing items."
+        # Warn when the queue grows past its max (again after it is cleared)
+        if len(self._review_heap) > self.max_queue_size and not self._queue_size_warned:
+            self._queue_size_warned = True
+            logger.warning(
+                "Review queue size (%d) exceeds max (%d). Consider reviewing items.",
+                len(self._review_heap),
+                self.max_queue_size,
             )
 
-        # Log for demonstration
-        print(
-            f'[UncertaintyAuditor] Flagged: "{transcription.text}" '
-            f"[Priority: {priority}, Reason: {reason}]"
+        logger.debug(
+            "Flagged: %r [Priority: %d, Reason: %s]",
+            transcription.text,
+            priority,
+            reason,
         )
 
     def on_session_start(self, session_id: str, metadata: dict) -> None:
@@ -209,20 +291,42 @@ class UncertaintyAuditor(ISidecarAgent):
             "agent_name": self.get_agent_name(),
             "status": "active",
             "confidence_threshold": self.confidence_threshold,
-            "review_queue_size": len(self.review_queue),
+            "review_queue_size": len(self._review_heap),
             "total_processed": self.total_transcriptions_processed,
             "total_flagged": self.total_flagged,
             "current_session": self.current_session_id,
         }
 
-    def get_review_queue(self) -> List[ReviewQueueItem]:
+    @property
+    def review_queue(self) -> Tuple[ReviewQueueItem, ...]:
+        """Items in the review queue, highest priority first."""
+        return self.get_review_queue()
+
+    def get_review_queue(self) -> Tuple[ReviewQueueItem, ...]:
         """
         Get all items in the review queue.
 
+        The tuple is immutable and shared between calls until the queue
+        changes, so frequent polling does not copy or re-sort the queue.
+
+        Returns:
+            Tuple[ReviewQueueItem, ...]: Items sorted by priority (highest
+            first), oldest first within a priority
+        """
+        if self._sorted_queue is None:
+            self._sorted_queue = tuple(
+                item for _, _, item in sorted(self._review_heap)
+            )
+        return self._sorted_queue
+
+    def get_review_queue_snapshot(self) -> List[ReviewQueueItem]:
+        """
+        Get a new list of the review queue items, for callers that modify it.
+
         Returns:
-            List[ReviewQueueItem]: Items sorted by priority (highest first)
+            List[ReviewQueueItem]: Items in get_review_queue order
         """
-        return self.review_queue.copy()
+        return list(self.get_review_queue())
 
     def get_unreviewed_items(self) -> List[ReviewQueueItem]:
         """
@@ -231,7 +335,16 @@ class UncertaintyAuditor(ISidecarAgent):
         Returns:
             List[ReviewQueueItem]: Unreviewed items
         """
-        return [item for item in self.review_queue if not item.reviewed]
+        return list(self.iter_unreviewed_items())
+
+    def iter_unreviewed_items(self) -> Iterator[ReviewQueueItem]:
+        """
+        Iterate over unreviewed items without building a list.
+
+        Yields:
+            ReviewQueueItem: Unreviewed items, in get_review_queue order
+        """
+        return (item for item in self.get_review_queue() if not item.reviewed)
 
     def mark_reviewed(self, item_id: str, reviewer_notes: Optional[str] = None) -> bool:
         """
@@ -244,7 +357,7 @@ class UncertaintyAuditor(ISidecarAgent):
         Returns:
             bool: True if item was found and marked, False otherwise
         """
-        for item in self.review_queue:
+        for _, _, item in self._review_heap:
             if item.item_id == item_id:
                 item.reviewed = True
                 item.reviewer_notes = reviewer_notes
@@ -260,9 +373,14 @@ class UncertaintyAuditor(ISidecarAgent):
         Returns:
             int: Number of items removed
         """
-        initial_size = len(self.review_queue)
-        self.review_queue = [item for item in self.review_queue if not item.reviewed]
-        removed = initial_size - len(self.review_queue)
+        initial_size = len(self._review_heap)
+        self._review_heap = [
+            entry for entry in self._review_heap if not entry[2].reviewed
+        ]
+        heapq.heapify(self._review_heap)
+        self._sorted_queue = None
+        self._queue_size_warned = len(self._review_heap) > self.max_queue_size
+        removed = initial_size - len(self._review_heap)
 
         if removed > 0:
             print(f"[UncertaintyAuditor] Cleared {removed} reviewed items from queue")
@@ -273,19 +391,23 @@ class UncertaintyAuditor(ISidecarAgent):
         """
         Get comprehensive statistics about auditor performance.
 
+        Queue counts are computed on each call (one pass, no sort), since
+        review items are mutable and can be marked reviewed directly.
+
         Returns:
             dict: Statistics including flagging rates, priority distribution, etc.
         """
-        unreviewed = self.get_unreviewed_items()
-
-        priority_counts = {}
-        for item in self.review_queue:
+        priority_counts: Dict[int, int] = {}
+        unreviewed = 0
+        for _, _, item in self._review_heap:
             priority_counts[item.priority] = priority_counts.get(item.priority, 0) + 1
+            if not item.reviewed:
+                unreviewed += 1
 
         return {
-            "total_in_queue": len(self.review_queue),
-            "unreviewed": len(unreviewed),
-            "reviewed": len(self.review_queue) - len(unreviewed),
+            "total_in_queue": len(self._review_heap),
+            "unreviewed": unreviewed,
+            "reviewed": len(self._review_heap) - unreviewed,
             "priority_distribution": priority_counts,
             "session_stats": {
                 "transcriptions_processed": self.total_transcriptions_processed,
@@ -0,0 +1 @@
+"""Audio preprocessing stages that wrap an IAudioProvider."""
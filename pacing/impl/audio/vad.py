@@ -0,0 +1,183 @@
+"""
+Voice-activity filtering for audio providers.
+
+Silent audio carries no transcribable content, yet every chunk handed to a
+transcriber costs a model call and grows any rolling audio buffer. The
+VADFilteredAudioProvider drops silent chunks and groups speech into segments
+before they ever reach the speech-to-text engine.
+"""
+
+from typing import AsyncIterator, Iterator, List, Optional
+import numpy as np
+
+from pacing.core.audio_interfaces import IAudioProvider
+
+
+class _SpeechSegmenter:
+    """
+    Energy-based voice activity detector with segment accumulation.
+
+    A chunk is speech when its RMS is within ``threshold_db`` of a decaying
+    peak RMS. Speech chunks accumulate until a silent chunk arrives after at
+    least ``min_segment_samples`` of speech, or until ``max_segment_samples``
+    forces a split.
+    """
+
+    def __init__(
+        self,
+        threshold_db: float,
+        min_segment_samples: int,
+        max_segment_samples: int,
+        peak_decay: float,
+    ):
+        # Compare rms >= ratio * peak instead of taking a log per chunk
+        self._ratio = 10.0 ** (threshold_db / 20.0)
+        self._min_samples = min_segment_samples
+        self._max_samples = max_segment_samples
+        self._peak_decay = peak_decay
+        self._peak = 0.0
+        self._pending: List[np.ndarray] = []
+        self._pending_samples = 0
+
+    def is_speech(self, chunk: np.ndarray) -> bool:
+        """Update the peak tracker and classify a chunk."""
+        if chunk.size == 0:
+            return False
+        samples = chunk.astype(np.float32, copy=False)
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        self._peak = max(rms, self._peak * self._peak_decay)
+        return rms > 0.0 and rms >= self._ratio * self._peak
+
+    def push(self, chunk: np.ndarray) -> List[np.ndarray]:
+        """Feed one chunk; return any segments that are ready."""
+        ready = []
+        if self.is_speech(chunk):
+            self._pending.append(chunk)
+            self._pending_samples += len(chunk)
+            while self._pending_samples >= self._max_samples:
+                segment = self._take()
+                ready.append(segment[: self._max_samples])
+                rest = segment[self._max_samples :]
+                if len(rest):
+                    self._pending = [rest]
+                    self._pending_samples = len(rest)
+        elif self._pending_samples >= self._min_samples:
+            ready.append(self._take())
+        return ready
+
+    def flush(self) -> Optional[np.ndarray]:
+        """Return whatever speech is still pending (end of stream)."""
+        return self._take() if self._pending_samples else None
+
+    def _take(self) -> np.ndarray:
+        segment = (
+            self._pending[0]
+            if len(self._pending) == 1
+            else np.concatenate(self._pending)
+        )
+        self._pending = []
+        self._pending_samples = 0
+        return segment
+
+
+class VADFilteredAudioProvider(IAudioProvider):
+    """
+    Audio provider wrapper that drops silence and emits speech segments.
+
+    Wraps any IAudioProvider. Chunks whose energy falls more than
+    ``silence_threshold_db`` below the recent peak are discarded; speech is
+    accumulated into segments of at least ``min_segment_sec`` (closed at the
+    next pause) and at most ``max_segment_sec`` (force-split).
+
+    Example:
+        audio = VADFilteredAudioProvider(MicrophoneProvider())
+        await platform.start_live_session(session, audio)
+
+    Notes:
+        - Providers that never produce silence (e.g., MockAudioProvider's
+          constant noise) pass through, just regrouped into longer segments
+        - Segments are emitted at pause boundaries, which keeps the
+          transcriber's context aligned with utterances
+    """
+
+    def __init__(
+        self,
+        provider: IAudioProvider,
+        silence_threshold_db: float = -35.0,
+        min_segment_sec: float = 1.5,
+        max_segment_sec: float = 10.0,
+        peak_decay: float = 0.999,
+    ):
+        """
+        Initialize the VAD wrapper.
+
+        Args:
+            provider: The audio provider to filter
+            silence_threshold_db: Chunks below peak RMS by more than this are silent
+            min_segment_sec: Minimum speech duration before a pause closes a segment
+            max_segment_sec: Segments are force-split at this duration
+            peak_decay: Per-chunk decay factor of the peak RMS tracker
+        """
+        if not 0.0 < min_segment_sec <= max_segment_sec:
+            raise ValueError("Require 0 < min_segment_sec <= max_segment_sec")
+
+        self.provider = provider
+        self.silence_threshold_db = silence_threshold_db
+        self.min_segment_sec = min_segment_sec
+        self.max_segment_sec = max_segment_sec
+        self.peak_decay = peak_decay
+
+    def _new_segmenter(self) -> _SpeechSegmenter:
+        sample_rate = self.get_sample_rate()
+        return _SpeechSegmenter(
+            threshold_db=self.silence_threshold_db,
+            min_segment_samples=int(self.min_segment_sec * sample_rate),
+            max_segment_samples=int(self.max_segment_sec * sample_rate),
+            peak_decay=self.peak_decay,
+        )
+
+    def start_stream(self) -> None:
+        """Start the wrapped stream."""
+        self.provider.start_stream()
+
+    def stop_stream(self) -> None:
+        """Stop the wrapped stream."""
+        self.provider.stop_stream()
+
+    def get_audio_chunks(self) -> Iterator[np.ndarray]:
+        """
+        Yield speech segments from the wrapped provider.
+
+        Yields:
+            np.ndarray: Speech segments (silence removed)
+        """
+        segmenter = self._new_segmenter()
+        for chunk in self.provider.get_audio_chunks():
+            yield from segmenter.push(chunk)
+        tail = segmenter.flush()
+        if tail is not None:
+            yield tail
+
+    async def get_audio_chunks_async(self) -> AsyncIterator[np.ndarray]:
+        """
+        Asynchronously yield speech segments from the wrapped provider.
+
+        Yields:
+            np.ndarray: Speech segments (silence removed)
+        """
+        segmenter = self._new_segmenter()
+        async for chunk in self.provider.get_audio_chunks_async():
+            for segment in segmenter.push(chunk):
+                yield segment
+        tail = segmenter.flush()
+        if tail is not None:
+            yield tail
+
+    def get_sample_rate(self) -> int:
+        """Get the wrapped provider's sample rate."""
+        return self.provider.get_sample_rate()
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if the wrapped provider is streaming."""
+        return self.provider.is_streaming
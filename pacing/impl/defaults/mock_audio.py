@@ -7,10 +7,25 @@ without requiring actual audio hardware.
 
 import asyncio
 import time
-from typing import Iterator, AsyncIterator, List
+from typing import Dict, Iterator, AsyncIterator, List
 import numpy as np
 
-from pacing.core.audio_interfaces import IAudioProvider
+from pacing.core.audio_interfaces import PCM16_SCALE, IAudioProvider
+
+# Upper bound on pre-generated noise (chunks); longer streams cycle the pool
+_MAX_NOISE_POOL_CHUNKS = 600
+
+
+def _scaled_noise(rng: np.random.Generator, shape, amplitude: float) -> np.ndarray:
+    """
+    Gaussian noise with standard deviation ``amplitude`` (of full scale) as int16.
+
+    Drawn directly as float32 and scaled in place: one float buffer and no
+    float64 intermediate, then a single conversion to the int16 wire format.
+    """
+    noise = rng.standard_normal(shape, dtype=np.float32)
+    noise *= np.float32(amplitude * PCM16_SCALE)
+    return noise.astype(np.int16)
 
 
 class MockAudioProvider(IAudioProvider):
@@ -47,10 +62,14 @@ class MockAudioProvider(IAudioProvider):
         self.total_duration_sec = total_duration_sec
         self._is_streaming = False
         self._chunk_size = int(sample_rate * chunk_duration_ms / 1000)
+        self._rng = np.random.default_rng()
+        self._noise_pool = np.empty((0, self._chunk_size), dtype=np.int16)
+        self._noise_idx = 0
 
     def start_stream(self) -> None:
         """Start the mock audio stream."""
         self._is_streaming = True
+        self._fill_noise_pool()
         print(f"[MockAudioProvider] Started streaming at {self.sample_rate}Hz")
 
     def stop_stream(self) -> None:
@@ -63,29 +82,33 @@ class MockAudioProvider(IAudioProvider):
         Generate mock audio chunks.
 
         Yields:
-            np.ndarray: Synthetic audio data (float32, normalized to [-1, 1])
+            np.ndarray: Synthetic audio data (int16 PCM)
         """
         if not self._is_streaming:
             raise RuntimeError("Stream not started. Call start_stream() first.")
 
-        start_time = time.time()
+        clock = time.monotonic
+        start_time = clock()
         chunk_interval = self.chunk_duration_ms / 1000.0
+        deadline = start_time
 
         while self._is_streaming:
-            elapsed = time.time() - start_time
+            elapsed = clock() - start_time
             if elapsed >= self.total_duration_sec:
                 break
 
-            # Generate a chunk of silence (could be enhanced with synthetic speech)
-            chunk = np.zeros(self._chunk_size, dtype=np.float32)
-
-            # Add very low amplitude noise to simulate realistic audio
-            chunk += np.random.normal(0, 0.001, self._chunk_size).astype(np.float32)
+            # Near-silence (could be enhanced with synthetic speech): very low
+            # amplitude noise to simulate realistic audio
+            chunk = self._noise_chunk()
 
             yield chunk
 
-            # Simulate real-time audio capture timing
-            time.sleep(chunk_interval)
+            # Simulate real-time capture against absolute deadlines, so time
+            # spent by the consumer does not accumulate as drift
+            deadline += chunk_interval
+            slack = deadline - clock()
+            if slack > 0:
+                time.sleep(slack)
 
     async def get_audio_chunks_async(self) -> AsyncIterator[np.ndarray]:
         """
@@ -97,22 +120,51 @@ class MockAudioProvider(IAudioProvider):
         if not self._is_streaming:
             raise RuntimeError("Stream not started. Call start_stream() first.")
 
-        start_time = asyncio.get_event_loop().time()
+        # Bound once: the loop's clock is read twice per chunk
+        clock = asyncio.get_running_loop().time
+        start_time = clock()
         chunk_interval = self.chunk_duration_ms / 1000.0
+        deadline = start_time
 
         while self._is_streaming:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = clock() - start_time
             if elapsed >= self.total_duration_sec:
                 break
 
             # Generate chunk
-            chunk = np.zeros(self._chunk_size, dtype=np.float32)
-            chunk += np.random.normal(0, 0.001, self._chunk_size).astype(np.float32)
+            chunk = self._noise_chunk()
 
             yield chunk
 
-            # Simulate real-time timing asynchronously
-            await asyncio.sleep(chunk_interval)
+            # Simulate real-time timing asynchronously (absolute deadlines;
+            # no sleep at all when the consumer is already behind)
+            deadline += chunk_interval
+            slack = deadline - clock()
+            if slack > 0:
+                await asyncio.sleep(slack)
+
+    def _fill_noise_pool(self) -> None:
+        """
+        Pre-generate the stream's noise in one RNG call.
+
+        Chunks are generated as float32 (no float64 intermediate) and converted
+        to int16 once; _noise_chunk then hands out read-only row views.
+        """
+        n_chunks = int(self.total_duration_sec * 1000 / self.chunk_duration_ms) + 1
+        n_chunks = max(1, min(n_chunks, _MAX_NOISE_POOL_CHUNKS))
+        self._noise_pool = _scaled_noise(
+            self._rng, (n_chunks, self._chunk_size), 0.001
+        )
+        self._noise_pool.flags.writeable = False
+        self._noise_idx = 0
+
+    def _noise_chunk(self) -> np.ndarray:
+        """Low-amplitude noise chunk (about -60 dBFS) as int16 PCM."""
+        if len(self._noise_pool) == 0:
+            self._fill_noise_pool()
+        chunk = self._noise_pool[self._noise_idx]
+        self._noise_idx = (self._noise_idx + 1) % len(self._noise_pool)
+        return chunk
 
     def get_sample_rate(self) -> int:
         """Get the sample rate."""
@@ -152,6 +204,9 @@ class ScriptedAudioProvider(IAudioProvider):
         self.chunk_duration_ms = chunk_duration_ms
         self._is_streaming = False
         self._chunk_size = int(sample_rate * chunk_duration_ms / 1000)
+        self._rng = np.random.default_rng()
+        # One read-only chunk per description, generated on first use
+        self._chunks: Dict[str, np.ndarray] = {}
 
     def start_stream(self) -> None:
         """Start playback."""
@@ -166,21 +221,31 @@ class ScriptedAudioProvider(IAudioProvider):
         if not self._is_streaming:
             raise RuntimeError("Stream not started.")
 
+        clock = time.monotonic
+        start_time = clock()
         for timestamp, description in self.script:
             if not self._is_streaming:
                 break
 
-            # Wait until timestamp
-            time.sleep(timestamp)
+            # Wait until timestamp (seconds from the start of playback)
+            slack = start_time + timestamp - clock()
+            if slack > 0:
+                time.sleep(slack)
 
-            # Generate appropriate audio based on description
+            yield self._chunk_for(description)
+
+    def _chunk_for(self, description: str) -> np.ndarray:
+        """The (shared, read-only) audio chunk for a script description."""
+        chunk = self._chunks.get(description)
+        if chunk is None:
             if description == "silence":
-                chunk = np.zeros(self._chunk_size, dtype=np.float32)
+                chunk = np.zeros(self._chunk_size, dtype=np.int16)
             else:
                 # Placeholder for actual audio generation
-                chunk = np.random.normal(0, 0.01, self._chunk_size).astype(np.float32)
-
-            yield chunk
+                chunk = _scaled_noise(self._rng, self._chunk_size, 0.01)
+            chunk.flags.writeable = False
+            self._chunks[description] = chunk
+        return chunk
 
     def get_sample_rate(self) -> int:
         """Get the sample rate."""
@@ -5,18 +5,187 @@ These implementations provide deterministic risk assessments based on simple
 rules, without requiring complex probabilistic inference.
 """
 
-from typing import Dict, Any, Optional
+import bisect
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Dict, Any, List, Optional, Tuple
 
 from pacing.core.model_interfaces import IRiskModel, ISimulationModel
 from pacing.models.data_models import (
+    Event,
+    Intervention,
     PatientGraph,
     RiskReport,
     RiskFactor,
+    SubstanceUse,
     SubstanceUseStatus,
     EventType,
 )
 
+# Members are compared by identity: hashing an Enum for a set lookup runs
+# Python code, which would dominate summarizing a large graph
+_TRAUMA, _JOB_CHANGE, _LEGAL_EVENT = (
+    EventType.TRAUMA,
+    EventType.JOB_CHANGE,
+    EventType.LEGAL_EVENT,
+)
+_ACTIVE_USE, _RELAPSE = SubstanceUseStatus.ACTIVE_USE, SubstanceUseStatus.RELAPSE
+
+# Layout of the feature vector produced by _rule_features
+_RECENT_USE, _NEGATIVE_EVENTS, _ACTIVE_INTERVENTIONS, _SOBRIETY_DAYS = range(4)
+_NO_USE_SOBRIETY_DAYS = 999  # No record = assume long sobriety
+
+# Look-back windows of the time-based rules, relative to the reference time
+_RECENT_USE_WINDOW = timedelta(days=30)
+_NEGATIVE_EVENT_WINDOW = timedelta(days=90)
+_TICK = timedelta(microseconds=1)  # datetime resolution
+
+
+@dataclass(frozen=True, slots=True)
+class _RuleInputs:
+    """
+    What the rules need from a graph, in a form that does not depend on time.
+
+    Built with one pass over each node list; evaluating the rules at any
+    reference time is then a few bisections (see _rule_features), so a graph
+    scored repeatedly costs O(log n) per call instead of a scan of its nodes.
+    """
+
+    negative_event_dates: List[datetime]  # Sorted
+    last_use: Optional[datetime]  # Latest active use or relapse record
+    last_record: Optional[datetime]  # Latest substance record of any status
+    last_record_sober: bool  # Whether that record is recovery or remission
+    intervention_starts: List[datetime]  # Sorted
+    # Sorted; an intervention counts as started but ended from this date on
+    intervention_stops: List[datetime]
+
+
+def _rule_inputs(graph: PatientGraph) -> _RuleInputs:
+    """Summarize a graph's nodes for _rule_features."""
+    return _RuleInputs(
+        _negative_event_dates(graph.events),
+        *_substance_summary(graph.substance_use_records),
+        *_intervention_bounds(graph.interventions),
+    )
+
+
+def _negative_event_dates(events: List[Event]) -> List[datetime]:
+    """Sorted dates of the events that count as negative (by type or impact)."""
+    dates = []
+    for event in events:
+        kind = event.event_type
+        if kind is _TRAUMA or kind is _JOB_CHANGE or kind is _LEGAL_EVENT:
+            dates.append(event.date)
+        elif event.impact_score is not None and event.impact_score < -0.3:
+            dates.append(event.date)
+    dates.sort()
+    return dates
+
+
+def _substance_summary(
+    records: List[SubstanceUse],
+) -> Tuple[Optional[datetime], Optional[datetime], bool]:
+    """(Latest use or relapse date, latest record date, whether it is sober)."""
+    if not records:
+        return None, None, False
+    latest = max(records, key=attrgetter("date"))  # The first listed among ties
+    last_use = max(
+        [
+            record.date
+            for record in records
+            if record.status is _ACTIVE_USE or record.status is _RELAPSE
+        ],
+        default=None,
+    )
+    sober = latest.status is not _ACTIVE_USE and latest.status is not _RELAPSE
+    return last_use, latest.date, sober
+
+
+def _intervention_bounds(
+    interventions: List[Intervention],
+) -> Tuple[List[datetime], List[datetime]]:
+    """
+    Sorted start dates, and sorted dates from which interventions have ended.
+
+    An intervention is active at ``now`` if ``start <= now`` and it has no end
+    or ``end >= now``. It has started and ended once both ``start <= now``
+    and ``end < now``, i.e., from ``max(start, end + 1 us)`` on, so the active
+    count at any time is the difference of two bisections.
+    """
+    starts = sorted([i.start_date for i in interventions])
+    stops = []
+    for intervention in interventions:
+        end = intervention.end_date
+        # Nothing ends after the latest representable date
+        if end is not None and end < datetime.max:
+            end += _TICK
+            start = intervention.start_date
+            stops.append(start if start > end else end)
+    stops.sort()
+    return starts, stops
+
+
+def _rule_features(inputs: _RuleInputs, now: datetime) -> Tuple[int, int, int, int]:
+    """
+    Evaluate every MockBayesianModel rule input as of ``now``.
+
+    Returns:
+        Tuple[int, int, int, int]: Indexed by _RECENT_USE (0/1),
+        _NEGATIVE_EVENTS (count in past 90 days), _ACTIVE_INTERVENTIONS
+        (count), and _SOBRIETY_DAYS (whole days since the latest record if it
+        is recovery or remission, 0 if it is use, 999 if there are no records)
+
+    >>> start = datetime(2024, 1, 1)
+    >>> graph = PatientGraph(patient_id="p1", interventions=[Intervention(
+    ...     intervention_id="i1", intervention_type="therapy", description="",
+    ...     start_date=start, end_date=start + timedelta(days=10),
+    ... )])
+    >>> inputs = _rule_inputs(graph)
+    >>> [_rule_features(inputs, start + timedelta(days=d)) for d in (-1, 10, 11)]
+    [(0, 0, 0, 999), (0, 0, 1, 999), (0, 0, 0, 999)]
+    """
+    negative_dates = inputs.negative_event_dates
+    last_use = inputs.last_use
+    if inputs.last_record is None:
+        sobriety_days = _NO_USE_SOBRIETY_DAYS
+    elif inputs.last_record_sober:
+        sobriety_days = (now - inputs.last_record).days
+    else:
+        sobriety_days = 0  # Active use
+    return (
+        # Substance use in past 30 days
+        int(last_use is not None and last_use >= now - _RECENT_USE_WINDOW),
+        # Negative life events in past 90 days
+        len(negative_dates)
+        - bisect.bisect_left(negative_dates, now - _NEGATIVE_EVENT_WINDOW),
+        # Interventions started and not yet ended
+        bisect.bisect_right(inputs.intervention_starts, now)
+        - bisect.bisect_right(inputs.intervention_stops, now),
+        sobriety_days,
+    )
+
+
+# Rule per feature: (factor name, contribution, trigger threshold, evidence).
+# A rule fires when its feature exceeds the threshold; the evidence template
+# is formatted with the feature value as ``value``.
+_FACTOR_RULES = (
+    ("Recent Substance Use", 0.25, 0, "Active use or relapse in past 30 days"),
+    (
+        "Recent Negative Life Events",
+        0.15,
+        0,
+        "{value} stressful events in past 90 days",
+    ),
+    ("Active Treatment", -0.20, 0, "{value} active interventions"),  # Protective
+    ("Extended Sobriety", -0.15, 180, "{value} days since last use"),  # 6+ months
+)
+
+
+# Memoized summary of one node list: (the list, a copy of it, its summary)
+_CachedSummary = Tuple[list, list, Any]
+
 
 class MockBayesianModel(IRiskModel):
     """
@@ -35,16 +204,38 @@ class MockBayesianModel(IRiskModel):
     3. Adjust based on recent negative events
     4. Adjust based on active interventions
     5. Clamp to [0.0, 1.0]
+
+    Graphs are scored as of the current time. What the rules need from a
+    graph does not depend on that time, so it is summarized once (sorted
+    dates and latest records, see _RuleInputs) and each call evaluates the
+    rules with a few bisections. Summaries are memoized per node list in a
+    small LRU cache: a baseline re-scored across What-If comparisons is
+    summarized once, and a scenario graph, which shares the lists it does not
+    write with the baseline, only summarizes the lists its mutations wrote.
+    An entry is reused only while the list still holds the same nodes (a
+    cheap identity comparison), so lists edited in place are summarized
+    again.
     """
 
-    def __init__(self, base_risk: float = 0.50):
+    def __init__(
+        self,
+        base_risk: float = 0.50,
+        cache_size: int = 1024,
+    ):
         """
         Initialize the mock model.
 
         Args:
             base_risk: Starting risk score (0.0-1.0)
+            cache_size: Node lists whose summaries are memoized (0 disables)
         """
         self.base_risk = base_risk
+        self.cache_size = cache_size
+        # (summarizer, id(list)) -> (list, its nodes when summarized, summary).
+        # The list is held so that its id is not reused by another object
+        self._summary_cache: "OrderedDict[Tuple[Any, int], _CachedSummary]" = (
+            OrderedDict()
+        )
 
     def calculate_risk(
         self, patient_data: PatientGraph, options: Optional[Dict[str, Any]] = None
@@ -59,60 +250,91 @@ class MockBayesianModel(IRiskModel):
         Returns:
             RiskReport: Risk assessment with contributing factors
         """
-        self.validate_input(patient_data)
+        return self.calculate_risk_batch([patient_data], options)[0]
 
-        risk_score = self.base_risk
-        factors = []
+    def calculate_risk_batch(
+        self,
+        graphs: List[PatientGraph],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[RiskReport]:
+        """
+        Calculate risk for several graphs as of one reference time.
 
-        # Factor 1: Recent substance use
-        recent_use = self._check_recent_substance_use(patient_data)
-        if recent_use:
-            risk_score += 0.25
-            factors.append(
-                RiskFactor(
-                    factor_name="Recent Substance Use",
-                    contribution=0.25,
-                    evidence=[f"Active use or relapse in past 30 days"],
-                )
-            )
-
-        # Factor 2: Negative life events
-        negative_events = self._check_negative_events(patient_data)
-        if negative_events:
-            risk_score += 0.15
-            factors.append(
-                RiskFactor(
-                    factor_name="Recent Negative Life Events",
-                    contribution=0.15,
-                    evidence=[
-                        f"{len(negative_events)} stressful events in past 90 days"
-                    ],
-                )
-            )
-
-        # Factor 3: Active interventions (protective)
-        active_interventions = self._check_active_interventions(patient_data)
-        if active_interventions:
-            risk_score -= 0.20
-            factors.append(
-                RiskFactor(
-                    factor_name="Active Treatment",
-                    contribution=-0.20,  # Negative = protective
-                    evidence=[f"{len(active_interventions)} active interventions"],
+        Args:
+            graphs: Patient graphs to score
+            options: Optional configuration
+
+        Returns:
+            List[RiskReport]: One report per graph, in input order
+        """
+        # One reference per batch, shared by every graph and rule
+        now = datetime.now()
+
+        # Evaluate each distinct graph once (a baseline often also appears
+        # among the scenarios), keyed by identity within this call
+        features_by_graph = {}
+        for graph in graphs:
+            if id(graph) not in features_by_graph:
+                self.validate_input(graph)
+                features_by_graph[id(graph)] = _rule_features(
+                    self._rule_inputs(graph), now
                 )
-            )
-
-        # Factor 4: Sobriety duration (protective)
-        days_sober = self._calculate_sobriety_days(patient_data)
-        if days_sober > 180:  # 6+ months
-            risk_score -= 0.15
-            factors.append(
-                RiskFactor(
-                    factor_name="Extended Sobriety",
-                    contribution=-0.15,
-                    evidence=[f"{days_sober} days since last use"],
+
+        return [
+            self._build_report(graph, features_by_graph[id(graph)])
+            for graph in graphs
+        ]
+
+    def _rule_inputs(self, graph: PatientGraph) -> _RuleInputs:
+        """The graph's rule inputs, from memoized summaries of its node lists."""
+        return _RuleInputs(
+            self._summary(_negative_event_dates, graph.events),
+            *self._summary(_substance_summary, graph.substance_use_records),
+            *self._summary(_intervention_bounds, graph.interventions),
+        )
+
+    def _summary(self, summarize, nodes: list) -> Any:
+        """``summarize(nodes)``, recomputed only if the list changed."""
+        if self.cache_size <= 0:
+            return summarize(nodes)
+
+        key = (summarize, id(nodes))
+        entry = self._summary_cache.get(key)
+        # List equality checks identity first, so an unchanged list compares
+        # in one C loop; a list edited in place compares unequal
+        if entry is not None and entry[0] is nodes and entry[1] == nodes:
+            self._summary_cache.move_to_end(key)
+            return entry[2]
+
+        summary = summarize(nodes)
+        self._summary_cache[key] = (nodes, list(nodes), summary)
+        self._summary_cache.move_to_end(key)
+        while len(self._summary_cache) > self.cache_size:
+            self._summary_cache.popitem(last=False)
+        return summary
+
+    def clear_cache(self) -> None:
+        """Forget all memoized node list summaries."""
+        self._summary_cache.clear()
+
+    def _build_report(
+        self, patient_data: PatientGraph, features: Tuple[int, int, int, int]
+    ) -> RiskReport:
+        """Score one graph's rule features and package them into a RiskReport."""
+        risk_score = self.base_risk
+        factors = []
+        for (name, contribution, threshold, evidence), value in zip(
+            _FACTOR_RULES, features
+        ):
+            if value > threshold:
+                risk_score += contribution
+                factors.append(
+                    RiskFactor(
+                        factor_name=name,
+                        contribution=contribution,
+                        evidence=[evidence.format(value=value)],
+                    )
                 )
-            )
 
         # Clamp risk to valid range
         risk_score = max(0.0, min(1.0, risk_score))
@@ -127,59 +349,6 @@ class MockBayesianModel(IRiskModel):
             model_version=self.get_model_version(),
         )
 
-    def _check_recent_substance_use(self, patient_data: PatientGraph) -> bool:
-        """Check for substance use in past 30 days."""
-        cutoff = datetime.now() - timedelta(days=30)
-        for record in patient_data.substance_use_records:
-            if record.date >= cutoff:
-                if record.status in [
-                    SubstanceUseStatus.ACTIVE_USE,
-                    SubstanceUseStatus.RELAPSE,
-                ]:
-                    return True
-        return False
-
-    def _check_negative_events(self, patient_data: PatientGraph) -> list:
-        """Find negative life events in past 90 days."""
-        cutoff = datetime.now() - timedelta(days=90)
-        negative_types = {EventType.TRAUMA, EventType.JOB_CHANGE, EventType.LEGAL_EVENT}
-
-        negative_events = []
-        for event in patient_data.events:
-            if event.date >= cutoff:
-                if event.event_type in negative_types:
-                    negative_events.append(event)
-                elif event.impact_score and event.impact_score < -0.3:
-                    negative_events.append(event)
-
-        return negative_events
-
-    def _check_active_interventions(self, patient_data: PatientGraph) -> list:
-        """Find currently active interventions."""
-        now = datetime.now()
-        active = []
-        for intervention in patient_data.interventions:
-            if intervention.start_date <= now:
-                if intervention.end_date is None or intervention.end_date >= now:
-                    active.append(intervention)
-        return active
-
-    def _calculate_sobriety_days(self, patient_data: PatientGraph) -> int:
-        """Calculate days since last substance use."""
-        if not patient_data.substance_use_records:
-            return 999  # No record = assume long sobriety
-
-        # Find most recent use
-        recent_use = max(patient_data.substance_use_records, key=lambda r: r.date)
-
-        if recent_use.status in [
-            SubstanceUseStatus.RECOVERY,
-            SubstanceUseStatus.REMISSION,
-        ]:
-            return (datetime.now() - recent_use.date).days
-        else:
-            return 0  # Active use
-
     def get_model_version(self) -> str:
         """Get model version."""
         return "mock-rule-based-v1.0"
@@ -223,9 +392,39 @@ class MockSimulationModel(MockBayesianModel, ISimulationModel):
         Returns:
             dict: Risk comparison with delta and explanation
         """
-        baseline_report = self.calculate_risk(baseline, options)
-        modified_report = self.calculate_risk(modified, options)
+        return self.calculate_risk_deltas(baseline, [modified], options)[0]
 
+    def calculate_risk_deltas(
+        self,
+        baseline: PatientGraph,
+        modified: List[PatientGraph],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Compare several modified scenarios against one baseline.
+
+        The baseline and all modified graphs are scored in a single batch.
+
+        Args:
+            baseline: Current patient state
+            modified: Hypothetical patient states
+            options: Optional configuration
+
+        Returns:
+            List[dict]: One risk comparison per modified graph
+        """
+        baseline_report, *modified_reports = self.calculate_risk_batch(
+            [baseline, *modified], options
+        )
+        return [
+            self._compare_reports(baseline_report, modified_report)
+            for modified_report in modified_reports
+        ]
+
+    def _compare_reports(
+        self, baseline_report: RiskReport, modified_report: RiskReport
+    ) -> Dict[str, Any]:
+        """Build a risk comparison from baseline and modified reports."""
         delta = modified_report.risk_score - baseline_report.risk_score
 
         # Identify which factors changed
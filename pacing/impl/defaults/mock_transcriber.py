@@ -6,14 +6,39 @@ confidence scores, without requiring actual speech-to-text services.
 """
 
 import asyncio
-import random
+import re
 from datetime import datetime
 from typing import List, Optional
 import numpy as np
 
 from pacing.core.transcription_interfaces import ITranscriber
+from pacing.impl.agents.keyword_matcher import KeywordMatcher
 from pacing.models.data_models import TranscriptionResult
 
+# Negations are often misheard; matched as whole words, so "nothing" and
+# "know" do not count
+_NEGATIONS = frozenset({"not", "no", "never", "didn't"})
+_WORD_PATTERN = re.compile(r"[\w']+")
+
+_RANDOM_BLOCK_SIZE = 4096  # Confidence draws generated per RNG call
+
+# AdaptiveConfidenceTranscriber's confidence multipliers
+_LONG_UTTERANCE_WORDS = 15  # More words than this is a long utterance
+_LONG_UTTERANCE_PENALTY = 0.90
+_DIFFICULT_TERM_PENALTY = 0.85
+_NEGATION_PENALTY = 0.90
+
+# Combined multiplier for every set of penalties, indexed by the flag bits
+# (long << 2) | (difficult term << 1) | negation
+_PENALTY_FACTORS = tuple(
+    (_LONG_UTTERANCE_PENALTY if flags & 4 else 1.0)
+    * (_DIFFICULT_TERM_PENALTY if flags & 2 else 1.0)
+    * (_NEGATION_PENALTY if flags & 1 else 1.0)
+    for flags in range(8)
+)
+_PENALTY_FACTOR_ARRAY = np.array(_PENALTY_FACTORS)
+_MIN_ADAPTIVE_CONFIDENCE = 0.40
+
 
 class MockTranscriber(ITranscriber):
     """
@@ -37,6 +62,8 @@ class MockTranscriber(ITranscriber):
         latency_ms: float = 50.0,
         base_confidence: float = 0.85,
         confidence_variance: float = 0.10,
+        seed: Optional[int] = None,
+        yield_each_chunk: bool = False,
     ):
         """
         Initialize the mock transcriber.
@@ -47,12 +74,29 @@ class MockTranscriber(ITranscriber):
             latency_ms: Simulated processing latency in milliseconds
             base_confidence: Base confidence score (0.0-1.0)
             confidence_variance: Random variance in confidence (+/-)
+            seed: Seed for the confidence draws (None for a random seed)
+            yield_each_chunk: With zero latency, still yield to the event loop
+                once per chunk (as a real async backend would)
         """
         self.script = script or self._default_script()
         self.latency_ms = latency_ms
         self.base_confidence = base_confidence
         self.confidence_variance = confidence_variance
-        self._script_index = 0
+        self.yield_each_chunk = yield_each_chunk
+        # Uniform [0, 1) draws, generated in blocks and handed out one by one
+        self._rng = np.random.default_rng(seed)
+        self._random_block: List[float] = []
+        self._random_idx = 0
+
+    @property
+    def script(self) -> List[str]:
+        """Lines returned in sequence; assigning a new script restarts it."""
+        return self._script
+
+    @script.setter
+    def script(self, script: List[str]) -> None:
+        self._script = script
+        self._script_lines = iter(script)
 
     def _default_script(self) -> List[str]:
         """
@@ -93,34 +137,45 @@ class MockTranscriber(ITranscriber):
         Returns:
             TranscriptionResult: Mock transcription with confidence score
         """
-        # Simulate processing latency
-        await asyncio.sleep(self.latency_ms / 1000.0)
+        # Simulate processing latency; with none, skip the event-loop round
+        # trip unless a cooperative yield was asked for
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000.0)
+        elif self.yield_each_chunk:
+            await asyncio.sleep(0)
 
-        # Get next text from script
-        if self._script_index < len(self.script):
-            text = self.script[self._script_index]
-            self._script_index += 1
-        else:
-            # Script exhausted, return empty
-            text = ""
+        # Get next text from script (empty once it is exhausted)
+        text = next(self._script_lines, "")
 
         # Generate confidence score with variance
-        confidence = self.base_confidence + random.uniform(
-            -self.confidence_variance, self.confidence_variance
+        confidence = self.base_confidence + self.confidence_variance * (
+            2.0 * self._next_random() - 1.0
         )
         confidence = max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
 
         # Occasionally generate low confidence to trigger auditor
-        if random.random() < 0.15:  # 15% chance
-            confidence = random.uniform(0.50, 0.70)
+        if self._next_random() < 0.15:  # 15% chance
+            confidence = 0.50 + 0.20 * self._next_random()
 
-        return TranscriptionResult(
+        # Every field is built here and confidence is in [0, 1] on both
+        # branches above, so per-chunk validation can be skipped
+        return TranscriptionResult.model_construct(
             text=text,
             timestamp=datetime.now(),
             confidence_score=confidence,
+            speaker_id=None,
             is_partial=not is_final,
         )
 
+    def _next_random(self) -> float:
+        """Next uniform [0, 1) draw, refilling the block when it runs out."""
+        if self._random_idx >= len(self._random_block):
+            self._random_block = self._rng.random(_RANDOM_BLOCK_SIZE).tolist()
+            self._random_idx = 0
+        value = self._random_block[self._random_idx]
+        self._random_idx += 1
+        return value
+
     def supports_speaker_diarization(self) -> bool:
         """Mock transcriber does not support speaker diarization."""
         return False
@@ -135,8 +190,8 @@ class MockTranscriber(ITranscriber):
         }
 
     def reset_script(self) -> None:
-        """Reset the script index to start from the beginning."""
-        self._script_index = 0
+        """Restart the script from the beginning."""
+        self._script_lines = iter(self.script)
 
 
 class AdaptiveConfidenceTranscriber(MockTranscriber):
@@ -160,6 +215,13 @@ class AdaptiveConfidenceTranscriber(MockTranscriber):
         "withdrawal",
     }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize as MockTranscriber; DIFFICULT_TERMS is compiled once here."""
+        super().__init__(*args, **kwargs)
+        self._difficult_term_matcher = KeywordMatcher(
+            term.lower() for term in self.DIFFICULT_TERMS
+        )
+
     async def transcribe_chunk(
         self, audio_chunk: np.ndarray, sample_rate: int, is_final: bool = False
     ) -> TranscriptionResult:
@@ -171,29 +233,70 @@ class AdaptiveConfidenceTranscriber(MockTranscriber):
             return result
 
         # Adjust confidence based on text characteristics
-        confidence = result.confidence_score
+        confidence = result.confidence_score * _PENALTY_FACTORS[self._penalties(result)]
+        confidence = max(_MIN_ADAPTIVE_CONFIDENCE, min(1.0, confidence))
+        return self._with_confidence(result, confidence)
 
-        # Penalty for length
-        word_count = len(result.text.split())
-        if word_count > 15:
-            confidence *= 0.90
+    async def transcribe_batch(
+        self,
+        audio_chunks: List[np.ndarray],
+        sample_rate: int,
+        is_final: bool = False,
+    ) -> List[TranscriptionResult]:
+        """
+        Transcribe several chunks, adjusting their confidences in one pass.
 
-        # Penalty for difficult terms
-        text_lower = result.text.lower()
-        if any(term in text_lower for term in self.DIFFICULT_TERMS):
-            confidence *= 0.85
+        The base results are produced as by MockTranscriber; the penalties of
+        the whole batch are then applied with one vectorized multiply and clip.
 
-        # Penalty for negations (often misheard)
-        if any(neg in text_lower for neg in ["not", "no", "never", "didn't"]):
-            confidence *= 0.90
+        Args:
+            audio_chunks: Audio chunks to transcribe
+            sample_rate: Sample rate in Hz (shared by all chunks)
+            is_final: Whether these are final chunks in their sequences
 
-        confidence = max(0.40, min(1.0, confidence))
+        Returns:
+            List[TranscriptionResult]: One result per chunk, in input order
+        """
+        results = await asyncio.gather(
+            *[
+                MockTranscriber.transcribe_chunk(self, chunk, sample_rate, is_final)
+                for chunk in audio_chunks
+            ]
+        )
+        texted = [i for i, result in enumerate(results) if result.text]
+        if not texted:
+            return list(results)
+
+        penalties = np.array([self._penalties(results[i]) for i in texted])
+        confidences = np.array([results[i].confidence_score for i in texted])
+        adjusted = np.clip(
+            confidences * _PENALTY_FACTOR_ARRAY[penalties],
+            _MIN_ADAPTIVE_CONFIDENCE,
+            1.0,
+        )
 
-        # Create new result with adjusted confidence
-        return TranscriptionResult(
-            text=result.text,
-            timestamp=result.timestamp,
-            confidence_score=confidence,
-            speaker_id=result.speaker_id,
-            is_partial=result.is_partial,
+        adjusted_results = list(results)
+        for i, confidence in zip(texted, adjusted.tolist()):
+            adjusted_results[i] = self._with_confidence(results[i], confidence)
+        return adjusted_results
+
+    def _penalties(self, result: TranscriptionResult) -> int:
+        """Flag bits of the penalties that apply to a result's text."""
+        text_lower = result.text_lower
+        return (
+            # Length
+            (len(result.text.split()) > _LONG_UTTERANCE_WORDS) << 2
+            # Difficult terms (one scan, stops at the first term)
+            | self._difficult_term_matcher.contains(text_lower) << 1
+            # Negations (often misheard)
+            | (not _NEGATIONS.isdisjoint(_WORD_PATTERN.findall(text_lower)))
         )
+
+    @staticmethod
+    def _with_confidence(
+        result: TranscriptionResult, confidence: float
+    ) -> TranscriptionResult:
+        """Copy of a result with an adjusted (already clamped) confidence."""
+        # model_copy skips validation (callers clamp, so the bounds hold) and
+        # carries over text_lower, already computed for the penalties
+        return result.model_copy(update={"confidence_score": confidence})
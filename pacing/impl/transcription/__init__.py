@@ -0,0 +1 @@
+"""Transcriber wrappers and streaming decode policies."""
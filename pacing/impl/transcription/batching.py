@@ -0,0 +1,182 @@
+"""
+Request batching for transcribers.
+
+When several sessions (or several pipeline stages) transcribe at the same time,
+each single-chunk call underutilizes the model. BatchedTranscriber coalesces
+calls that arrive within a short window and submits them together through the
+wrapped transcriber's transcribe_batch().
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from pacing.core.transcription_interfaces import ITranscriber
+from pacing.models.data_models import TranscriptionResult
+
+# Queued by aclose(): the worker submits what is ahead of it, then exits
+_STOP_BATCHING = object()
+
+
+class BatchedTranscriber(ITranscriber):
+    """
+    Transcriber wrapper that coalesces concurrent requests into batches.
+
+    Each transcribe_chunk() call is queued with a future. A background task
+    collects up to ``max_batch`` requests, waiting at most ``batch_window_ms``
+    after the first one, then resolves every future from a single
+    transcribe_batch() call on the wrapped transcriber.
+
+    Example:
+        transcriber = BatchedTranscriber(WhisperTranscriber(), batch_window_ms=20)
+        platform.set_transcriber(transcriber)
+
+    Notes:
+        - A lone request waits up to ``batch_window_ms`` before submission;
+          choose the window to match the latency budget
+        - Requests are only batched with others sharing the same sample rate
+          and is_final flag
+        - Call aclose() (the session stream does on stop) to end the
+          background task; a later request starts a new one
+    """
+
+    def __init__(
+        self,
+        transcriber: ITranscriber,
+        batch_window_ms: float = 20.0,
+        max_batch: int = 16,
+    ):
+        """
+        Initialize the batching wrapper.
+
+        Args:
+            transcriber: The transcriber that performs batched inference
+            batch_window_ms: Max time to wait for more requests after the first
+            max_batch: Max requests submitted in a single batch
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self.transcriber = transcriber
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._arrived: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the batching task on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._arrived = asyncio.Event()
+            self._worker = loop.create_task(
+                self._batch_loop(self._queue, self._arrived)
+            )
+        return self._queue
+
+    async def transcribe_chunk(
+        self, audio_chunk: np.ndarray, sample_rate: int, is_final: bool = False
+    ) -> TranscriptionResult:
+        """
+        Queue a chunk for batched transcription and wait for its result.
+
+        Args:
+            audio_chunk: Audio samples
+            sample_rate: Sample rate in Hz
+            is_final: Whether this is the final chunk in a sequence
+
+        Returns:
+            TranscriptionResult: The transcription for this chunk
+        """
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((audio_chunk, sample_rate, is_final, future))
+        self._arrived.set()
+        return await future
+
+    async def aclose(self) -> None:
+        """
+        Stop the batching task once every queued request has been submitted.
+
+        Callers already waiting on a result still receive it. Safe to call
+        more than once. The wrapped transcriber is left open: whoever created
+        it owns it (it may be shared, or wrapped again after this).
+        """
+        worker, queue, arrived = self._worker, self._queue, self._arrived
+        self._worker = self._queue = self._arrived = self._loop = None
+        if (
+            worker is not None
+            and not worker.done()
+            and worker.get_loop() is asyncio.get_running_loop()
+        ):
+            queue.put_nowait(_STOP_BATCHING)
+            arrived.set()
+            await worker
+
+    async def _batch_loop(self, queue: asyncio.Queue, arrived: asyncio.Event) -> None:
+        """Collect requests into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        window = self.batch_window_ms / 1000.0
+        stopping = False
+        while not stopping:
+            request = await queue.get()
+            if request is _STOP_BATCHING:
+                return
+            batch = [request]
+            deadline = loop.time() + window
+            while len(batch) < self.max_batch:
+                try:
+                    request = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    # Wait on the event rather than queue.get(): cancelling a
+                    # pending get() on timeout can drop an item (Python < 3.12)
+                    arrived.clear()
+                    try:
+                        await asyncio.wait_for(arrived.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    continue
+                if request is _STOP_BATCHING:
+                    stopping = True
+                    break
+                batch.append(request)
+            await self._submit(batch)
+
+    async def _submit(self, batch: List[tuple]) -> None:
+        """Run one transcribe_batch() call per (sample_rate, is_final) group."""
+        groups: Dict[Tuple[int, bool], List[tuple]] = {}
+        for request in batch:
+            groups.setdefault((request[1], request[2]), []).append(request)
+
+        for (sample_rate, is_final), requests in groups.items():
+            try:
+                results = await self.transcriber.transcribe_batch(
+                    [request[0] for request in requests], sample_rate, is_final
+                )
+            except Exception as error:
+                for request in requests:
+                    if not request[3].done():
+                        request[3].set_exception(error)
+                continue
+            for request, result in zip(requests, results):
+                if not request[3].done():
+                    request[3].set_result(result)
+
+    def supports_speaker_diarization(self) -> bool:
+        """Delegate to the wrapped transcriber."""
+        return self.transcriber.supports_speaker_diarization()
+
+    def get_model_info(self) -> dict:
+        """Get the wrapped model's info, annotated with batching settings."""
+        info = dict(self.transcriber.get_model_info())
+        info["batching"] = {
+            "batch_window_ms": self.batch_window_ms,
+            "max_batch": self.max_batch,
+        }
+        return info
@@ -0,0 +1,71 @@
+"""
+LocalAgreement-2 commit policy for streaming transcription.
+
+Streaming ASR models that re-decode a rolling audio window keep revising the
+end of their hypothesis as more audio arrives. LocalAgreement-2 (as used by
+Whisper-Streaming) treats a word as final once two successive decodes agree on
+it: the common prefix of consecutive hypotheses is committed, and the audio it
+covers can be dropped from the window so later decodes only re-process the
+unconfirmed tail.
+"""
+
+from typing import List
+
+from pacing.models.data_models import WordTiming
+
+
+def _normalize(word: str) -> str:
+    return word.strip().lower()
+
+
+class LocalAgreement2:
+    """
+    Commit words on which two consecutive hypotheses agree.
+
+    Each hypothesis is the word sequence decoded from the *unconfirmed* audio
+    (everything after the last committed word). Callers discard the audio up
+    to the last committed word's ``end`` after every commit, so the next
+    hypothesis starts where the uncommitted tail of the previous one did.
+
+    >>> la = LocalAgreement2()
+    >>> def words(*ws):
+    ...     return [WordTiming(word=w, start=i, end=i + 1) for i, w in enumerate(ws)]
+    >>> la.update(words("I", "feel"))
+    []
+    >>> [w.word for w in la.update(words("I", "feel", "fine"))]
+    ['I', 'feel']
+    >>> [w.word for w in la.update(words("fine", "today"))]
+    ['fine']
+    """
+
+    def __init__(self):
+        self._previous: List[WordTiming] = []
+
+    def update(self, hypothesis: List[WordTiming]) -> List[WordTiming]:
+        """
+        Compare a new hypothesis with the previous one and commit agreement.
+
+        Args:
+            hypothesis: Words decoded from the unconfirmed audio, in order
+
+        Returns:
+            List[WordTiming]: Newly committed words (taken from ``hypothesis``,
+            so their times refer to the audio that was just decoded)
+        """
+        n_agreed = 0
+        for old, new in zip(self._previous, hypothesis):
+            if _normalize(old.word) != _normalize(new.word):
+                break
+            n_agreed += 1
+
+        self._previous = hypothesis[n_agreed:]
+        return hypothesis[:n_agreed]
+
+    def flush(self) -> List[WordTiming]:
+        """Commit and return the pending tail (e.g., at the end of a stream)."""
+        pending, self._previous = self._previous, []
+        return pending
+
+    def reset(self) -> None:
+        """Forget the pending hypothesis (e.g., at the start of a session)."""
+        self._previous = []
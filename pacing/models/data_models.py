@@ -5,10 +5,17 @@ These Pydantic models define the structure of data flowing through the system,
 ensuring type safety and validation at runtime.
 """
 
+import hashlib
+import itertools
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
+from typing import Iterator, List, Optional, Dict, Any
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ConfidenceLevel(str, Enum):
@@ -19,6 +26,28 @@ class ConfidenceLevel(str, Enum):
     LOW = "low"
 
 
+# Lower bounds of MEDIUM and HIGH, and the levels they separate (lowest first);
+# the same thresholds as TranscriptionResult.confidence_level
+_CONFIDENCE_BOUNDS = np.array([0.70, 0.85])
+_CONFIDENCE_LEVELS = np.array(
+    [ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM, ConfidenceLevel.HIGH], dtype=object
+)
+
+
+class WordTiming(BaseModel):
+    """
+    A transcribed word and where it lies in the transcribed audio.
+
+    Times are in seconds from the start of the audio passed to the transcriber.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    word: str
+    start: float = Field(ge=0.0)
+    end: float = Field(ge=0.0)
+
+
 class TranscriptionResult(BaseModel):
     """
     Result from a transcription operation.
@@ -29,13 +58,43 @@ class TranscriptionResult(BaseModel):
         confidence_score: Acoustic confidence (0.0-1.0)
         speaker_id: Optional speaker identification
         is_partial: Whether this is a partial (streaming) result
+        words: Word-level timings, if the transcriber provides them
+
+    Results are immutable once built (they are shared by every agent); derive
+    an edited result with ``model_copy(update=...)``.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
     timestamp: datetime = Field(default_factory=datetime.now)
     confidence_score: float = Field(ge=0.0, le=1.0)
     speaker_id: Optional[str] = None
     is_partial: bool = False
+    words: Optional[List[WordTiming]] = None
+
+    @cached_property
+    def text_lower(self) -> str:
+        """The text lowercased, computed on first use and shared by all agents.
+
+        Cached in the instance ``__dict__``, which equality ignores as it only
+        compares fields (hence the ``pydantic>=2.6`` requirement).
+
+        >>> t = TranscriptionResult(text="Methadone DOSE", confidence_score=0.9)
+        >>> t.text_lower
+        'methadone dose'
+        >>> t.model_copy(update={"text": "Naloxone"}).text_lower
+        'naloxone'
+        """
+        return self.text.lower()
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "TranscriptionResult":
+        copied = super().model_copy(update=update, deep=deep)
+        if update and "text" in update:
+            copied.__dict__.pop("text_lower", None)
+        return copied
 
     @property
     def confidence_level(self) -> ConfidenceLevel:
@@ -53,6 +112,9 @@ class TranscriptionResult(BaseModel):
         >>> t3 = TranscriptionResult(text="test", confidence_score=0.5)
         >>> t3.confidence_level
         <ConfidenceLevel.LOW: 'low'>
+
+        To categorize many results at once, use bucket_levels on an array of
+        their scores instead of reading this property in a loop.
         """
         if self.confidence_score >= 0.85:
             return ConfidenceLevel.HIGH
@@ -61,6 +123,27 @@ class TranscriptionResult(BaseModel):
         else:
             return ConfidenceLevel.LOW
 
+    @classmethod
+    def bucket_levels(cls, scores: np.ndarray) -> np.ndarray:
+        """Categorize an array of confidence scores in one vectorized pass.
+
+        Args:
+            scores: Confidence scores (any shape)
+
+        Returns:
+            np.ndarray: ConfidenceLevel per score (object dtype, same shape),
+                matching confidence_level element-wise
+
+        >>> TranscriptionResult.bucket_levels(np.array([0.5, 0.70, 0.85, 0.9]))
+        ... # doctest: +NORMALIZE_WHITESPACE
+        array([<ConfidenceLevel.LOW: 'low'>, <ConfidenceLevel.MEDIUM: 'medium'>,
+               <ConfidenceLevel.HIGH: 'high'>, <ConfidenceLevel.HIGH: 'high'>],
+              dtype=object)
+        """
+        return _CONFIDENCE_LEVELS[
+            np.searchsorted(_CONFIDENCE_BOUNDS, scores, side="right")
+        ]
+
 
 class EventType(str, Enum):
     """Types of life events tracked in the patient graph."""
@@ -79,8 +162,11 @@ class Event(BaseModel):
     A life event in the patient's history.
 
     Events represent significant occurrences that may impact relapse risk.
+    Events are immutable; edit one with ``model_copy(update=...)``.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     event_id: str
     event_type: EventType
     description: str
@@ -119,6 +205,8 @@ class SubstanceUse(BaseModel):
     A substance use event or status change.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     use_id: str
     substance_type: SubstanceType
     status: SubstanceUseStatus
@@ -142,6 +230,8 @@ class Intervention(BaseModel):
     A clinical intervention in the patient's treatment plan.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     intervention_id: str
     intervention_type: InterventionType
     description: str
@@ -157,11 +247,121 @@ class GraphEdge(BaseModel):
     Edges can represent temporal or causal relationships.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     source_id: str
     target_id: str
     relationship_type: str  # e.g., "leads_to", "causes", "precedes"
     weight: float = 1.0
 
+    @field_validator("relationship_type")
+    @classmethod
+    def _intern_relationship_type(cls, value: str) -> str:
+        """Share one string object per label across all edges.
+
+        A graph has many edges but few labels, so interning saves memory and
+        makes label comparisons and dict lookups identity checks.
+        """
+        return sys.intern(value)
+
+
+# Integer codes for enums stored in PatientGraphColumns
+EVENT_TYPE_CODES = {t: i for i, t in enumerate(EventType)}
+SUBSTANCE_STATUS_CODES = {s: i for i, s in enumerate(SubstanceUseStatus)}
+_RELAPSE_CODE = SUBSTANCE_STATUS_CODES[SubstanceUseStatus.RELAPSE]
+SUBSTANCE_TYPE_CODES = {s: i for i, s in enumerate(SubstanceType)}
+INTERVENTION_TYPE_CODES = {t: i for i, t in enumerate(InterventionType)}
+
+NS_PER_DAY = 86_400 * 10**9
+# Missing timestamp in int64 nanosecond columns (numpy's NaT)
+MISSING_TIME_NS = np.iinfo(np.int64).min
+
+
+def _time_ns(dates: List[Optional[datetime]]) -> np.ndarray:
+    """Naive datetimes as int64 nanoseconds since 1970-01-01 (wall clock)."""
+    # numpy converts datetime objects in C; None becomes NaT (MISSING_TIME_NS)
+    return np.array(dates, dtype="datetime64[ns]").view(np.int64)
+
+
+def _ids(values: List[str]) -> np.ndarray:
+    """Node ids as an object array (maps column rows back to nodes)."""
+    ids = np.empty(len(values), dtype=object)
+    ids[:] = values
+    return ids
+
+
+def _codes(values: list, codes: Dict[Any, int]) -> np.ndarray:
+    """Enum members as their int8 codes."""
+    return np.array([codes[v] for v in values], dtype=np.int8)
+
+
+def _scores(values: List[Optional[float]]) -> np.ndarray:
+    """Optional scores as float32 (NaN where the score is missing)."""
+    return np.array(
+        [np.nan if v is None else v for v in values], dtype=np.float32
+    )
+
+
+@dataclass
+class PatientGraphColumns:
+    """
+    Column-oriented (struct-of-arrays) view of a PatientGraph's nodes.
+
+    Each array attribute has one entry per node of its kind, in the order of
+    the corresponding PatientGraph list. Times are int64 nanoseconds since
+    1970-01-01 on the same (naive) clock as the model's datetimes, so elapsed
+    time is an integer subtraction from ``reference_ns``; missing times are
+    MISSING_TIME_NS and missing scores are NaN. Enum columns hold the codes of
+    EVENT_TYPE_CODES, SUBSTANCE_TYPE_CODES, SUBSTANCE_STATUS_CODES and
+    INTERVENTION_TYPE_CODES; id columns map rows back to their nodes.
+    """
+
+    reference_ns: int  # "Now" for the purposes of this view
+    event_ids: np.ndarray  # object (str)
+    event_types: np.ndarray  # int8
+    event_impacts: np.ndarray  # float32
+    event_time_ns: np.ndarray  # int64
+    substance_use_ids: np.ndarray  # object (str)
+    substance_types: np.ndarray  # int8
+    substance_statuses: np.ndarray  # int8
+    substance_severities: np.ndarray  # float32
+    substance_time_ns: np.ndarray  # int64
+    intervention_ids: np.ndarray  # object (str)
+    intervention_types: np.ndarray  # int8
+    intervention_start_ns: np.ndarray  # int64
+    intervention_end_ns: np.ndarray  # int64
+    intervention_effectiveness: np.ndarray  # float32
+
+    def age_days(self, time_ns: np.ndarray) -> np.ndarray:
+        """Fractional days from each time to ``reference_ns`` (past is positive)."""
+        return (self.reference_ns - time_ns) / NS_PER_DAY
+
+    def impact_by_event_type(self) -> np.ndarray:
+        """Summed impact score per event type, indexed by EVENT_TYPE_CODES.
+
+        Events without an impact score contribute nothing.
+
+        >>> cols = PatientGraph(patient_id="p1", events=[
+        ...     Event(event_id=f"e{i}", event_type=EventType.TRAUMA,
+        ...           description="", date=datetime(2024, 1, 1), impact_score=s)
+        ...     for i, s in enumerate([-0.5, -0.25, None])
+        ... ]).to_soa()
+        >>> float(cols.impact_by_event_type()[EVENT_TYPE_CODES[EventType.TRAUMA]])
+        -0.75
+        """
+        return np.bincount(
+            self.event_types,
+            weights=np.nan_to_num(self.event_impacts),
+            minlength=len(EVENT_TYPE_CODES),
+        )
+
+    def days_since_last_relapse(self) -> float:
+        """Days from the latest relapse record to ``reference_ns`` (NaN if none)."""
+        relapses = self.substance_statuses == _RELAPSE_CODE
+        if not relapses.any():
+            return float("nan")
+        return float(self.age_days(self.substance_time_ns[relapses].max()))
+
 
 class PatientGraph(BaseModel):
     """
@@ -193,10 +393,120 @@ class PatientGraph(BaseModel):
         >>> "e1" in graph.get_all_node_ids()
         True
         """
-        return (
-            [e.event_id for e in self.events]
-            + [s.use_id for s in self.substance_use_records]
-            + [i.intervention_id for i in self.interventions]
+        return list(self.iter_all_node_ids())
+
+    def iter_all_node_ids(self) -> Iterator[str]:
+        """Iterate over all node IDs without building a list.
+
+        Yields events, then substance use records, then interventions (the
+        order of get_all_node_ids), so membership checks can stop early.
+
+        >>> graph = PatientGraph(patient_id="p123")
+        >>> next(graph.iter_all_node_ids(), None) is None
+        True
+        """
+        return itertools.chain(
+            (e.event_id for e in self.events),
+            (s.use_id for s in self.substance_use_records),
+            (i.intervention_id for i in self.interventions),
+        )
+
+    def content_hash(self) -> str:
+        """Get a stable digest of the graph's full content.
+
+        Graphs with identical content hash equally, so the digest can key
+        results of pure functions of the graph that outlive the graph objects
+        (e.g., persisted risk reports). It serializes the whole graph, so
+        within a process, keying on graph identity is much cheaper.
+
+        >>> PatientGraph(patient_id="p1").content_hash() == (
+        ...     PatientGraph(patient_id="p1").content_hash()
+        ... )
+        True
+        >>> PatientGraph(patient_id="p1").content_hash() == (
+        ...     PatientGraph(patient_id="p2").content_hash()
+        ... )
+        False
+        """
+        return hashlib.blake2b(
+            self.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+
+    def clone(self) -> "PatientGraph":
+        """Get a copy whose nodes and containers can be edited independently.
+
+        A fast alternative to ``model_copy(deep=True)`` that relies on the
+        field layout: nodes are frozen, so they are shared, except that events
+        are copied shallowly to give each its own metadata dict. The lists and
+        the graph's metadata dict are rebuilt. Values nested inside metadata
+        dicts are shared.
+
+        >>> graph = PatientGraph(patient_id="p1", metadata={"site": "a"})
+        >>> copied = graph.clone()
+        >>> copied.metadata["site"] = "b"
+        >>> copied == graph, graph.metadata
+        (False, {'site': 'a'})
+        """
+        return self.model_copy(
+            update={
+                "events": [
+                    e.model_copy(update={"metadata": dict(e.metadata)})
+                    for e in self.events
+                ],
+                "substance_use_records": list(self.substance_use_records),
+                "interventions": list(self.interventions),
+                "edges": list(self.edges),
+                "metadata": dict(self.metadata),
+            }
+        )
+
+    def to_soa(self, now: Optional[datetime] = None) -> PatientGraphColumns:
+        """Get the graph's nodes as numpy columns, for vectorized scoring.
+
+        The columns are built by a pass over every node on each call, so keep
+        the result when the same graph is analyzed repeatedly.
+
+        Args:
+            now: Reference time of the view (defaults to the current time)
+
+        Returns:
+            PatientGraphColumns: One array per node attribute
+
+        >>> graph = PatientGraph(patient_id="p1", events=[Event(
+        ...     event_id="e1", event_type=EventType.TRAUMA, description="test",
+        ...     date=datetime(2024, 1, 1), impact_score=-0.5,
+        ... )])
+        >>> cols = graph.to_soa(now=datetime(2024, 1, 11))
+        >>> cols.age_days(cols.event_time_ns).tolist(), cols.event_impacts.tolist()
+        ([10.0], [-0.5])
+        >>> len(cols.substance_statuses)
+        0
+        """
+        events = self.events
+        uses = self.substance_use_records
+        interventions = self.interventions
+        return PatientGraphColumns(
+            reference_ns=int(_time_ns([now or datetime.now()])[0]),
+            event_ids=_ids([e.event_id for e in events]),
+            event_types=_codes([e.event_type for e in events], EVENT_TYPE_CODES),
+            event_impacts=_scores([e.impact_score for e in events]),
+            event_time_ns=_time_ns([e.date for e in events]),
+            substance_use_ids=_ids([u.use_id for u in uses]),
+            substance_types=_codes(
+                [u.substance_type for u in uses], SUBSTANCE_TYPE_CODES
+            ),
+            substance_statuses=_codes([u.status for u in uses], SUBSTANCE_STATUS_CODES),
+            substance_severities=_scores([u.severity for u in uses]),
+            substance_time_ns=_time_ns([u.date for u in uses]),
+            intervention_ids=_ids([i.intervention_id for i in interventions]),
+            intervention_types=_codes(
+                [i.intervention_type for i in interventions], INTERVENTION_TYPE_CODES
+            ),
+            intervention_start_ns=_time_ns([i.start_date for i in interventions]),
+            intervention_end_ns=_time_ns([i.end_date for i in interventions]),
+            intervention_effectiveness=_scores(
+                [i.effectiveness_score for i in interventions]
+            ),
         )
 
 
@@ -260,6 +570,8 @@ class ExtractedEntity(BaseModel):
     Examples: medications mentioned, life events discussed, substance use reported.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     entity_type: str  # "medication", "life_event", "substance_use", etc.
     value: str
     confidence: float = Field(ge=0.0, le=1.0)
@@ -279,3 +591,46 @@ class SessionMetadata(BaseModel):
     start_time: datetime
     end_time: Optional[datetime] = None
     session_type: str = "counseling"  # counseling, intake, follow-up, etc.
+
+
+@dataclass(frozen=True, slots=True)
+class SessionContext:
+    """
+    Session context handed to agents along with every transcription.
+
+    Built once per session and shared by reference across all updates and
+    agents. Item access (``context["patient_id"]``, ``context.get(...)``) is
+    supported for dict-style consumers.
+
+    >>> meta = SessionMetadata(
+    ...     session_id="s1", patient_id="p1", clinician_id="c1",
+    ...     start_time=datetime(1970, 1, 2),
+    ... )
+    >>> context = SessionContext.from_metadata(meta)
+    >>> context["patient_id"], context.start_time_ns == NS_PER_DAY
+    ('p1', True)
+    """
+
+    session_id: str
+    patient_id: str
+    clinician_id: str
+    start_time_ns: int  # Same clock as PatientGraphColumns times
+
+    @classmethod
+    def from_metadata(cls, metadata: SessionMetadata) -> "SessionContext":
+        """Build the context for a session."""
+        return cls(
+            session_id=metadata.session_id,
+            patient_id=metadata.patient_id,
+            clinician_id=metadata.clinician_id,
+            start_time_ns=int(_time_ns([metadata.start_time])[0]),
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup with a default."""
+        return getattr(self, key) if key in self.__slots__ else default
@@ -6,16 +6,48 @@ the PACING platform with dependency injection.
 """
 
 import asyncio
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from datetime import datetime
 
-from pacing.core.audio_interfaces import IAudioProvider
+import numpy as np
+
+from pacing.core.audio_interfaces import IAudioProvider, float32_to_pcm16
 from pacing.core.transcription_interfaces import ITranscriber
 from pacing.core.agent_interfaces import ISidecarAgent
 from pacing.core.model_interfaces import IRiskModel, ISimulationModel
 from pacing.core.session_interfaces import ISessionStream
-from pacing.models.data_models import SessionMetadata, PatientGraph, TranscriptionResult
+from pacing.impl.transcription.local_agreement import LocalAgreement2
+from pacing.models.data_models import (
+    SessionContext,
+    SessionMetadata,
+    PatientGraph,
+    TranscriptionResult,
+    WordTiming,
+)
+
+
+# Tells an agent worker to exit once it reaches this item in its queue
+_STOP_AGENT_WORKER = object()
+
+# Marks the end of the audio stream in the capture queue
+_END_OF_AUDIO = object()
+
+# Ends every transcription stream subscribed to a session
+_END_OF_SESSION = object()
+
+# Chunks captured ahead of transcription (bounded, so capture cannot run away)
+_AUDIO_PREFETCH_CHUNKS = 4
 
 
 class OperatingMode(str, Enum):
@@ -36,35 +68,120 @@ class BasicSessionStream(ISessionStream):
 
     This implementation coordinates audio capture, transcription, and agent
     processing for a live clinical session.
+
+    Each registered agent gets its own bounded queue and worker task during a
+    session, so transcription cadence never waits on agent throughput. When an
+    agent falls behind and its queue is full, the oldest pending update is
+    dropped (and counted) to keep the agent close to real time.
+
+    The most recent audio is kept in a rolling window capped at
+    ``max_audio_buffer_sec``, so memory and any per-decode work over the window
+    depend on the window size, not on session length. The window is a circular
+    buffer allocated once per session: appending a chunk writes only that
+    chunk's samples and never reallocates.
+
+    With ``window_decoding``, each update re-decodes the unconfirmed part of
+    the window instead of the latest chunk, and words are committed with
+    LocalAgreement-2: once two consecutive decodes agree on them, they are
+    broadcast and the audio they cover is dropped from the window, so decodes
+    never redo confirmed audio. This needs a transcriber that reports word
+    timings (TranscriptionResult.words); without them, every decode is taken
+    as final and its audio dropped.
     """
 
-    def __init__(self, operating_mode: OperatingMode = OperatingMode.PROD_MODE):
+    def __init__(
+        self,
+        operating_mode: OperatingMode = OperatingMode.PROD_MODE,
+        agent_queue_size: int = 32,
+        max_audio_buffer_sec: float = 30.0,
+        window_decoding: bool = False,
+    ):
         """
         Initialize the session stream.
 
         Args:
             operating_mode: DEV_MODE or PROD_MODE (affects data retention)
+            agent_queue_size: Max pending transcriptions buffered per agent
+            max_audio_buffer_sec: Duration of the rolling audio window
+            window_decoding: Re-decode the unconfirmed window each update and
+                commit words with LocalAgreement-2
         """
         self.operating_mode = operating_mode
-        self._agents: List[ISidecarAgent] = []
+        self.agent_queue_size = agent_queue_size
+        self.max_audio_buffer_sec = max_audio_buffer_sec
+        self.window_decoding = window_decoding
+        self._agreement = LocalAgreement2()
+        self._last_hypothesis: Optional[TranscriptionResult] = None
+        self._reset_audio_ring(0)
+        # Keyed by id(agent) like _agent_queues; insertion order is broadcast order
+        self._agents: Dict[int, ISidecarAgent] = {}
+        self._agent_queues: Dict[int, asyncio.Queue] = {}
+        self._agent_tasks: List[asyncio.Task] = []
+        self._dropped_updates = 0
         self._is_active = False
+        # Bumped when activity or the agent roster changes (see state_version)
+        self._state_version = 0
         self._current_session: Optional[SessionMetadata] = None
+        self._session_context: Optional[SessionContext] = None
         self._audio_provider: Optional[IAudioProvider] = None
         self._transcriber: Optional[ITranscriber] = None
         self._transcription_buffer: List[TranscriptionResult] = []
+        # One queue per live get_transcription_stream() consumer
+        self._stream_queues: List[asyncio.Queue] = []
 
     def register_agent(self, agent: ISidecarAgent) -> None:
         """Register a sidecar agent."""
-        if agent not in self._agents:
-            self._agents.append(agent)
+        if id(agent) not in self._agents:
+            self._agents[id(agent)] = agent
+            self._state_version += 1
+            if self._is_active:
+                self._start_agent_worker(agent)
             print(f"[SessionStream] Registered agent: {agent.get_agent_name()}")
 
     def unregister_agent(self, agent: ISidecarAgent) -> None:
         """Unregister a sidecar agent."""
-        if agent in self._agents:
-            self._agents.remove(agent)
+        if self._agents.pop(id(agent), None) is not None:
+            self._state_version += 1
+            queue = self._agent_queues.pop(id(agent), None)
+            if queue is not None:
+                self._enqueue(queue, _STOP_AGENT_WORKER)
             print(f"[SessionStream] Unregistered agent: {agent.get_agent_name()}")
 
+    def _start_agent_worker(self, agent: ISidecarAgent) -> None:
+        """Allocate the agent's queue and spawn its consumer task."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.agent_queue_size)
+        self._agent_queues[id(agent)] = queue
+        self._agent_tasks.append(asyncio.create_task(self._agent_loop(agent, queue)))
+
+    def _enqueue(self, queue: asyncio.Queue, item: Any) -> None:
+        """Put without blocking, dropping the oldest pending item when full."""
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            self._dropped_updates += 1
+            queue.put_nowait(item)
+
+    async def _agent_loop(self, agent: ISidecarAgent, queue: asyncio.Queue) -> None:
+        """Feed queued transcriptions to one agent until told to stop."""
+        while True:
+            item = await queue.get()
+            if item is _STOP_AGENT_WORKER:
+                return
+            transcription, context = item
+            try:
+                await self._dispatch(agent, transcription, context)
+            except asyncio.TimeoutError:
+                print(
+                    f"[SessionStream] Agent {agent.get_agent_name()} timed out "
+                    f"after {agent.timeout_ms}ms"
+                )
+            except Exception as error:
+                print(
+                    f"[SessionStream] Agent {agent.get_agent_name()} failed: "
+                    f"{error!r}"
+                )
+
     async def start_session(
         self,
         session_metadata: SessionMetadata,
@@ -85,16 +202,21 @@ class BasicSessionStream(ISessionStream):
             )
 
         self._current_session = session_metadata
+        # Shared by every update of this session (built once, immutable)
+        self._session_context = SessionContext.from_metadata(session_metadata)
         self._audio_provider = audio_provider
         self._transcriber = transcriber
         self._is_active = True
+        self._state_version += 1
         self._transcription_buffer = []
+        self._dropped_updates = 0
 
-        # Notify all agents
-        for agent in self._agents:
-            agent.on_session_start(
-                session_metadata.session_id, session_metadata.model_dump()
-            )
+        # Notify all agents and start their workers. The metadata is dumped
+        # once; its values are immutable, so a shallow copy isolates agents
+        metadata = session_metadata.model_dump()
+        for agent in self._agents.values():
+            agent.on_session_start(session_metadata.session_id, dict(metadata))
+            self._start_agent_worker(agent)
 
         print(f"[SessionStream] Session started: {session_metadata.session_id}")
 
@@ -110,41 +232,190 @@ class BasicSessionStream(ISessionStream):
             return
 
         sample_rate = self._audio_provider.get_sample_rate()
+        self._reset_audio_ring(int(self.max_audio_buffer_sec * sample_rate))
+        self._agreement.reset()
+        self._last_hypothesis = None
+
+        # Capture runs in its own task so the next chunk is pulled from the
+        # provider while the current one is being transcribed
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=_AUDIO_PREFETCH_CHUNKS)
+        capture = asyncio.create_task(self._capture_audio(chunks))
+        try:
+            while (audio_chunk := await chunks.get()) is not _END_OF_AUDIO:
+                if not self._is_active:
+                    break  # Stopped (capture may have failed on a stopped stream)
+                if isinstance(audio_chunk, Exception):
+                    raise audio_chunk  # The provider failed
+
+                # Float providers are converted once, for the ring and transcriber
+                audio_chunk = float32_to_pcm16(audio_chunk)
+                self._append_audio(audio_chunk)
+
+                if self.window_decoding:
+                    transcription = await self._decode_window(sample_rate)
+                    if transcription is None:
+                        continue  # Nothing confirmed yet
+                else:
+                    # Transcribe the audio chunk
+                    transcription = await self._transcriber.transcribe_chunk(
+                        audio_chunk, sample_rate
+                    )
+
+                await self._publish_transcription(transcription)
+        finally:
+            capture.cancel()
+
+        # The unconfirmed tail is final once the audio ends
+        if self.window_decoding and self._is_active:
+            pending = self._agreement.flush()
+            if pending:
+                await self._publish_transcription(
+                    self._committed(self._last_hypothesis, pending)
+                )
+
+    async def _capture_audio(self, chunks: asyncio.Queue) -> None:
+        """Move provider chunks into the queue, then _END_OF_AUDIO (or the error)."""
+        try:
+            async for audio_chunk in self._audio_provider.get_audio_chunks_async():
+                await chunks.put(audio_chunk)
+        except Exception as error:
+            await chunks.put(error)
+        else:
+            await chunks.put(_END_OF_AUDIO)
+
+    async def _publish_transcription(self, transcription: TranscriptionResult) -> None:
+        """Store a transcription (DEV_MODE) and distribute it to agents."""
+        # Store in buffer (if DEV_MODE, otherwise ephemeral)
+        if self.operating_mode == OperatingMode.DEV_MODE:
+            self._transcription_buffer.append(transcription)
+
+        # Distribute to all agents and stream consumers
+        await self._broadcast_transcription(transcription)
+        for queue in self._stream_queues:
+            queue.put_nowait(transcription)
+
+    async def _decode_window(self, sample_rate: int) -> Optional[TranscriptionResult]:
+        """Re-decode the unconfirmed audio; return newly committed words, if any."""
+        hypothesis = await self._transcriber.transcribe_chunk(
+            self.get_audio_window(), sample_rate
+        )
+        if hypothesis.words is None:
+            # No timings to agree on: take the decode as final
+            self._discard_audio(self._ring_fill)
+            return hypothesis
+
+        self._last_hypothesis = hypothesis
+        committed = self._agreement.update(hypothesis.words)
+        if not committed:
+            return None
+
+        # Later decodes skip the confirmed audio
+        self._discard_audio(int(committed[-1].end * sample_rate))
+        return self._committed(hypothesis, committed)
+
+    @staticmethod
+    def _committed(
+        hypothesis: TranscriptionResult, words: List[WordTiming]
+    ) -> TranscriptionResult:
+        """The final transcription for the committed words of a hypothesis."""
+        return hypothesis.model_copy(
+            update={
+                "text": " ".join(w.word for w in words),
+                "words": words,
+                "is_partial": False,
+            }
+        )
 
-        async for audio_chunk in self._audio_provider.get_audio_chunks_async():
-            if not self._is_active:
-                break
+    def _reset_audio_ring(self, n_samples: int) -> None:
+        """Allocate an empty circular audio buffer holding ``n_samples``."""
+        # int16 is the audio wire format (see IAudioProvider)
+        self._audio_ring = np.zeros(n_samples, dtype=np.int16)
+        self._ring_write_idx = 0  # Where the next sample goes
+        self._ring_fill = 0  # How many valid samples end at _ring_write_idx
 
-            # Transcribe the audio chunk
-            transcription = await self._transcriber.transcribe_chunk(
-                audio_chunk, sample_rate
-            )
+    def _append_audio(self, chunk: np.ndarray) -> None:
+        """Write an int16 chunk into the ring, overwriting the oldest samples.
 
-            # Store in buffer (if DEV_MODE, otherwise ephemeral)
-            if self.operating_mode == OperatingMode.DEV_MODE:
-                self._transcription_buffer.append(transcription)
+        Callers convert float audio first (see float32_to_pcm16): a plain
+        assignment into the int16 ring would truncate it to silence.
 
-            # Distribute to all agents
-            await self._broadcast_transcription(transcription)
+        Raises:
+            TypeError: If the chunk is not int16
+        """
+        if chunk.dtype != np.int16:
+            raise TypeError(f"Expected int16 audio, got {chunk.dtype}")
+        ring = self._audio_ring
+        size = len(ring)
+        n = len(chunk)
+        if size == 0 or n == 0:
+            return
+        if n >= size:
+            ring[:] = chunk[-size:]
+            self._ring_write_idx = 0
+            self._ring_fill = size
+            return
+
+        start = self._ring_write_idx
+        end = start + n
+        if end <= size:
+            ring[start:end] = chunk
+        else:
+            split = size - start
+            ring[start:] = chunk[:split]
+            ring[: n - split] = chunk[split:]
+        self._ring_write_idx = end % size
+        self._ring_fill = min(self._ring_fill + n, size)
+
+    def _discard_audio(self, n_samples: int) -> None:
+        """Drop the oldest ``n_samples`` from the window."""
+        self._ring_fill = max(0, self._ring_fill - n_samples)
+
+    def get_audio_window(self) -> np.ndarray:
+        """
+        Get the most recent audio (at most ``max_audio_buffer_sec`` of it).
+
+        When the window is contiguous in the circular buffer it is shared
+        rather than copied: callers get a read-only view, so any number of
+        consumers cost no extra memory and cannot corrupt the audio seen by
+        others. Only a window that wraps around the end of the buffer is
+        unrolled into a new array. Views are overwritten as later chunks
+        arrive; call ``.copy()`` on the result to own the samples.
+
+        Returns:
+            np.ndarray: Read-only audio samples, oldest first
+        """
+        ring = self._audio_ring
+        fill = self._ring_fill
+        start = (self._ring_write_idx - fill) % len(ring) if len(ring) else 0
+        if start + fill <= len(ring):
+            window = ring[start : start + fill]
+        else:
+            window = np.concatenate((ring[start:], ring[: self._ring_write_idx]))
+        window.flags.writeable = False
+        return window
 
     async def _broadcast_transcription(
         self, transcription: TranscriptionResult
     ) -> None:
         """Broadcast a transcription to all registered agents."""
-        context = None
-        if self._current_session:
-            context = {
-                "session_id": self._current_session.session_id,
-                "patient_id": self._current_session.patient_id,
-                "clinician_id": self._current_session.clinician_id,
-            }
-
-        # Process agents in parallel
-        tasks = [
-            agent.on_transcription_update(transcription, context)
-            for agent in self._agents
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Hand off to each agent's queue; agents are processed concurrently by
+        # their own workers, so a slow agent never stalls transcription
+        item = (transcription, self._session_context)
+        for queue in self._agent_queues.values():
+            self._enqueue(queue, item)
+
+    @staticmethod
+    async def _dispatch(
+        agent: ISidecarAgent,
+        transcription: TranscriptionResult,
+        context: Optional[SessionContext],
+    ) -> None:
+        """Run one agent update, bounded by the agent's timeout_ms if set."""
+        update = agent.on_transcription_update(transcription, context)
+        if agent.timeout_ms is None:
+            await update
+        else:
+            await asyncio.wait_for(update, timeout=agent.timeout_ms / 1000.0)
 
     async def stop_session(self) -> None:
         """Stop the current session."""
@@ -152,14 +423,24 @@ class BasicSessionStream(ISessionStream):
             return
 
         self._is_active = False
+        self._state_version += 1
 
         # Stop audio capture
         if self._audio_provider:
             self._audio_provider.stop_stream()
 
+        # Release transcriber workers/connections; in-flight requests resolve
+        if self._transcriber:
+            await self._transcriber.aclose()
+
+        # Let agents finish their pending updates before the session ends
+        await self._drain_agent_workers()
+        for queue in self._stream_queues:
+            queue.put_nowait(_END_OF_SESSION)
+
         # Notify all agents
         if self._current_session:
-            for agent in self._agents:
+            for agent in self._agents.values():
                 agent.on_session_end(self._current_session.session_id)
 
             print(f"[SessionStream] Session ended: {self._current_session.session_id}")
@@ -167,18 +448,52 @@ class BasicSessionStream(ISessionStream):
         # Clear ephemeral data in PROD mode
         if self.operating_mode == OperatingMode.PROD_MODE:
             self._transcription_buffer = []
+            self._reset_audio_ring(0)
             print("[SessionStream] Ephemeral data cleared (PROD_MODE)")
 
         self._current_session = None
+        self._session_context = None
         self._audio_provider = None
         self._transcriber = None
 
-    async def get_transcription_stream(self):
-        """Get transcription stream (async generator)."""
-        # This is a simplified implementation
-        # In production, use asyncio.Queue for better flow control
-        for transcription in self._transcription_buffer:
-            yield transcription
+    async def _drain_agent_workers(self) -> None:
+        """Stop agent workers after they process everything already queued."""
+        for queue in self._agent_queues.values():
+            await queue.put(_STOP_AGENT_WORKER)
+        await asyncio.gather(*self._agent_tasks, return_exceptions=True)
+        self._agent_queues = {}
+        self._agent_tasks = []
+
+        if self._dropped_updates:
+            print(
+                f"[SessionStream] Dropped {self._dropped_updates} agent updates "
+                "(agents fell behind)"
+            )
+
+    async def get_transcription_stream(self) -> AsyncIterator[TranscriptionResult]:
+        """
+        Get transcription stream (async generator).
+
+        Yields the transcriptions already stored for the session (DEV_MODE),
+        then, while a session is active, each new transcription as it is
+        published, ending when the session stops. Each consumer gets its own
+        unbounded queue, so it must keep up with the session to bound memory.
+        """
+        backlog = list(self._transcription_buffer)
+        if not self._is_active:
+            for transcription in backlog:
+                yield transcription
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        self._stream_queues.append(queue)
+        try:
+            for transcription in backlog:
+                yield transcription
+            while (transcription := await queue.get()) is not _END_OF_SESSION:
+                yield transcription
+        finally:
+            self._stream_queues.remove(queue)
 
     @property
     def is_active(self) -> bool:
@@ -188,7 +503,56 @@ class BasicSessionStream(ISessionStream):
     @property
     def registered_agents(self) -> List[ISidecarAgent]:
         """Get registered agents."""
-        return self._agents.copy()
+        return list(self._agents.values())
+
+    @property
+    def state_version(self) -> int:
+        """Counter that changes whenever is_active or the agent roster changes."""
+        return self._state_version
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformStatus(Mapping[str, Any]):
+    """
+    Snapshot of the platform configuration and session state.
+
+    Instances are immutable and shared: PacingPlatform.get_platform_status()
+    returns the same object until the state it describes changes. A status is
+    a read-only Mapping of field name to value, so dict-style callers keep
+    working (``status["session_active"]``, ``.get()``, ``.keys()``,
+    ``**status``); use ``to_dict()`` where a real dict is needed (e.g.,
+    ``json.dumps``).
+
+    >>> status = PlatformStatus("dev", False, None, None, ("Guide",))
+    >>> status.get("operating_mode"), len(status)
+    ('dev', 5)
+    >>> status.to_dict()["registered_agents"]
+    ['Guide']
+    """
+
+    operating_mode: str
+    session_active: bool
+    transcriber: Optional[str]
+    risk_model: Optional[str]
+    registered_agents: Tuple[str, ...]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the status as a plain dict (agent names as a list).
+
+        This is the layout get_platform_status returned before PlatformStatus.
+        """
+        return {**self, "registered_agents": list(self.registered_agents)}
 
 
 class PacingPlatform:
@@ -225,7 +589,8 @@ class PacingPlatform:
         )
 
         audio = MyAudioProvider()
-        await platform.start_live_session(session, audio)
+        session_task = await platform.start_live_session(session, audio)
+        await session_task  # Runs until the audio ends
     """
 
     def __init__(
@@ -247,7 +612,12 @@ class PacingPlatform:
 
         # Default implementations (can be overridden via dependency injection)
         self._transcriber = transcriber
-        self._risk_model = risk_model
+        self._risk_model = None
+        self._status: Optional[PlatformStatus] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._status_key: Optional[tuple] = None
+        if risk_model is not None:
+            self._install_risk_model(risk_model)
 
         print(f"[PacingPlatform] Initialized in {operating_mode.value.upper()} mode")
 
@@ -274,9 +644,14 @@ class PacingPlatform:
         Args:
             model: Risk model implementation
         """
-        self._risk_model = model
+        self._install_risk_model(model)
         print(f"[PacingPlatform] Risk model set: {model.__class__.__name__}")
 
+    def _install_risk_model(self, model: IRiskModel) -> None:
+        """Prepare a risk model once and make it the active model."""
+        model.prepare()
+        self._risk_model = model
+
     def register_agent(self, agent: ISidecarAgent) -> None:
         """
         Register a sidecar agent.
@@ -297,17 +672,32 @@ class PacingPlatform:
 
     async def start_live_session(
         self, session_metadata: SessionMetadata, audio_provider: IAudioProvider
-    ) -> None:
+    ) -> asyncio.Task:
         """
-        Start a live clinical session.
+        Start a live clinical session in the background.
 
         Args:
             session_metadata: Session information
             audio_provider: Audio source
 
+        Returns:
+            asyncio.Task: Handle on the running session. Awaiting it joins the
+            session: it completes once the audio stream is exhausted (or the
+            session is stopped) and every agent has processed its pending
+            transcriptions.
+
         Raises:
-            ValueError: If transcriber not configured
+            RuntimeError: If a session is already running
+
+        Example:
+            session_task = await platform.start_live_session(session, audio)
+            await session_task  # Or: await platform.stop_live_session()
         """
+        if self._session_task is not None and not self._session_task.done():
+            raise RuntimeError(
+                "A session is already active. Stop it before starting a new one."
+            )
+
         if not self._transcriber:
             # Use default mock transcriber
             from pacing.impl.defaults.mock_transcriber import MockTranscriber
@@ -315,13 +705,37 @@ class PacingPlatform:
             self._transcriber = MockTranscriber()
             print("[PacingPlatform] Using default MockTranscriber")
 
-        await self.session_stream.start_session(
-            session_metadata, audio_provider, self._transcriber
+        self._session_task = asyncio.create_task(
+            self._run_session(session_metadata, audio_provider, self._transcriber)
         )
+        # Let the task run up to its first suspension, by which point the
+        # session is active, so an immediate stop_live_session() takes effect
+        await asyncio.sleep(0)
+        return self._session_task
+
+    async def _run_session(
+        self,
+        session_metadata: SessionMetadata,
+        audio_provider: IAudioProvider,
+        transcriber: ITranscriber,
+    ) -> None:
+        """Stream the session's audio to completion, then drain and end it."""
+        try:
+            await self.session_stream.start_session(
+                session_metadata, audio_provider, transcriber
+            )
+        finally:
+            # Also runs when the provider fails or the task is cancelled, so
+            # agent workers and stream consumers are always released. No-op
+            # if stop_live_session() already ended the session
+            await self.session_stream.stop_session()
 
     async def stop_live_session(self) -> None:
-        """Stop the current live session."""
+        """Stop the current live session and wait for it to wind down."""
         await self.session_stream.stop_session()
+        if self._session_task is not None:
+            session_task, self._session_task = self._session_task, None
+            await session_task
 
     def calculate_risk(
         self, patient_graph: PatientGraph, options: Optional[Dict[str, Any]] = None
@@ -343,7 +757,7 @@ class PacingPlatform:
             # Use default mock model
             from pacing.impl.defaults.mock_risk_model import MockBayesianModel
 
-            self._risk_model = MockBayesianModel()
+            self._install_risk_model(MockBayesianModel())
             print("[PacingPlatform] Using default MockBayesianModel")
 
         return self._risk_model.calculate_risk(patient_graph, options)
@@ -364,7 +778,7 @@ class PacingPlatform:
         if not self._risk_model:
             from pacing.impl.defaults.mock_risk_model import MockSimulationModel
 
-            self._risk_model = MockSimulationModel()
+            self._install_risk_model(MockSimulationModel())
             print("[PacingPlatform] Using default MockSimulationModel")
 
         if not isinstance(self._risk_model, ISimulationModel):
@@ -377,24 +791,37 @@ class PacingPlatform:
 
         return SimulationContext(patient_graph, self._risk_model)
 
-    def get_platform_status(self) -> dict:
+    def get_platform_status(self) -> PlatformStatus:
         """
         Get current platform status.
 
+        The status is rebuilt only when something it reports has changed;
+        otherwise the previous (immutable) snapshot is returned, so frequent
+        polling (e.g., a monitoring endpoint) does not allocate.
+
         Returns:
-            dict: Platform configuration and status
+            PlatformStatus: Platform configuration and status
         """
-        return {
-            "operating_mode": self.operating_mode.value,
-            "session_active": self.session_stream.is_active,
-            "transcriber": self._transcriber.__class__.__name__
-            if self._transcriber
-            else None,
-            "risk_model": self._risk_model.__class__.__name__
-            if self._risk_model
-            else None,
-            "registered_agents": [
-                agent.get_agent_name()
-                for agent in self.session_stream.registered_agents
-            ],
-        }
+        key = (
+            self.operating_mode,
+            self.session_stream.state_version,
+            self._transcriber,
+            self._risk_model,
+        )
+        if self._status is None or key != self._status_key:
+            self._status = PlatformStatus(
+                operating_mode=self.operating_mode.value,
+                session_active=self.session_stream.is_active,
+                transcriber=self._transcriber.__class__.__name__
+                if self._transcriber
+                else None,
+                risk_model=self._risk_model.__class__.__name__
+                if self._risk_model
+                else None,
+                registered_agents=tuple(
+                    agent.get_agent_name()
+                    for agent in self.session_stream.registered_agents
+                ),
+            )
+            self._status_key = key
+        return self._status
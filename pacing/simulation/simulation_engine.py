@@ -7,7 +7,19 @@ how changes in a patient's circumstances might affect relapse risk.
 
 import copy
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable, List
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 from enum import Enum
 
 from pacing.core.model_interfaces import ISimulationModel
@@ -21,6 +33,8 @@ from pacing.models.data_models import (
     SubstanceUseStatus,
 )
 
+_MutationHandler = Callable[["Mutation", PatientGraph, datetime], None]
+
 
 class MutationType(str, Enum):
     """Types of mutations that can be applied to a patient graph."""
@@ -46,6 +60,12 @@ class Mutation:
     - What if the patient experienced a traumatic event?
     """
 
+    __slots__ = ("mutation_type", "parameters", "description")
+
+    # Handler per mutation type (filled in below, once the handlers exist);
+    # subclasses can override entries with a copy of this dict
+    handlers: ClassVar[Dict[MutationType, _MutationHandler]]
+
     def __init__(
         self,
         mutation_type: MutationType,
@@ -64,80 +84,181 @@ class Mutation:
         self.parameters = parameters
         self.description = description or str(mutation_type)
 
-    def apply(self, graph: PatientGraph) -> PatientGraph:
+    def apply(
+        self, graph: PatientGraph, now: Optional[datetime] = None
+    ) -> PatientGraph:
         """
         Apply this mutation to a patient graph.
 
+        The input graph is never modified. The result is a shallow copy in
+        which only the lists and dicts this mutation writes are replaced, so
+        it shares every untouched node (and container) with the input; copy
+        it with ``clone()`` before editing nodes in place.
+
         Args:
             graph: The graph to modify
+            now: Date given to nodes the mutation creates (default: the
+                current time). Pass a fixed time to get equal graphs from
+                equal inputs.
 
         Returns:
             PatientGraph: A new graph with the mutation applied
         """
-        # Create a deep copy to avoid modifying the original
-        modified = copy.deepcopy(graph)
-
-        if self.mutation_type == MutationType.ADD_EVENT:
-            event = Event(**self.parameters)
-            modified.events.append(event)
-
-        elif self.mutation_type == MutationType.REMOVE_EVENT:
-            event_id = self.parameters.get("event_id")
-            modified.events = [e for e in modified.events if e.event_id != event_id]
-
-        elif self.mutation_type == MutationType.MODIFY_EVENT:
-            event_id = self.parameters.get("event_id")
-            for event in modified.events:
-                if event.event_id == event_id:
-                    for key, value in self.parameters.items():
-                        if key != "event_id" and hasattr(event, key):
-                            setattr(event, key, value)
-
-        elif self.mutation_type == MutationType.ADD_INTERVENTION:
-            intervention = Intervention(**self.parameters)
-            modified.interventions.append(intervention)
-
-        elif self.mutation_type == MutationType.REMOVE_INTERVENTION:
-            intervention_id = self.parameters.get("intervention_id")
-            modified.interventions = [
-                i
-                for i in modified.interventions
-                if i.intervention_id != intervention_id
-            ]
-
-        elif self.mutation_type == MutationType.MODIFY_HOUSING:
-            # Add housing stability as a positive life event
-            housing_event = Event(
-                event_id=f"sim_housing_{datetime.now().timestamp()}",
-                event_type=EventType.HOUSING_CHANGE,
-                description=self.parameters.get("description", "Housing stabilized"),
-                date=datetime.now(),
-                impact_score=self.parameters.get(
-                    "impact_score", 0.7
-                ),  # Positive impact
-            )
-            modified.events.append(housing_event)
-            modified.metadata["simulated_housing_status"] = self.parameters.get(
-                "status", "stable"
-            )
+        modified = graph.model_copy()
+        _own_containers(modified, self.in_place_writes)
+        self.apply_inplace(modified, now)
+        return modified
 
-        elif self.mutation_type == MutationType.MODIFY_EMPLOYMENT:
-            # Add employment change as a life event
-            employment_event = Event(
-                event_id=f"sim_employment_{datetime.now().timestamp()}",
-                event_type=EventType.JOB_CHANGE,
-                description=self.parameters.get(
-                    "description", "Employment status changed"
-                ),
-                date=datetime.now(),
-                impact_score=self.parameters.get("impact_score", 0.5),
-            )
-            modified.events.append(employment_event)
-            modified.metadata["simulated_employment_status"] = self.parameters.get(
-                "status", "employed"
-            )
+    @property
+    def in_place_writes(self) -> Tuple[str, ...]:
+        """Graph containers that apply_inplace modifies in place (not rebinds)."""
+        return _IN_PLACE_WRITES.get(self.mutation_type, ())
+
+    def apply_inplace(
+        self, graph: PatientGraph, now: Optional[datetime] = None
+    ) -> None:
+        """
+        Apply this mutation to a graph by modifying it.
+
+        Only the containers named by ``in_place_writes`` are changed in place;
+        others that the mutation edits are replaced on the graph. The caller
+        must own the former (e.g., not share them with a baseline graph).
+        Mutation types without a handler leave the graph unchanged.
+
+        Args:
+            graph: The graph to modify
+            now: Date given to created nodes (default: the current time)
+        """
+        handler = self.handlers.get(self.mutation_type)
+        if handler is not None:
+            handler(self, graph, datetime.now() if now is None else now)
+
+
+# Mutation handlers: each applies one mutation type to a graph it may modify
+# (see Mutation.apply_inplace)
+
+
+def _add_event(mutation: "Mutation", graph: PatientGraph, now: datetime) -> None:
+    graph.events.append(Event(**mutation.parameters))
+
+
+def _remove_event(mutation: "Mutation", graph: PatientGraph, now: datetime) -> None:
+    event_id = mutation.parameters.get("event_id")
+    kept = [e for e in graph.events if e.event_id != event_id]
+    # Rebind only if something matched, so the list stays shared otherwise
+    if len(kept) < len(graph.events):
+        graph.events = kept
+
+
+def _modify_event(mutation: "Mutation", graph: PatientGraph, now: datetime) -> None:
+    event_id = mutation.parameters.get("event_id")
+    if not any(e.event_id == event_id for e in graph.events):
+        return
+    # Events are frozen: swap in edited copies
+    update = {
+        key: value
+        for key, value in mutation.parameters.items()
+        if key != "event_id" and key in Event.model_fields
+    }
+    graph.events = [
+        event.model_copy(update=update) if event.event_id == event_id else event
+        for event in graph.events
+    ]
+
+
+def _add_intervention(mutation: "Mutation", graph: PatientGraph, now: datetime) -> None:
+    # A missing id or start date is filled in when applied
+    parameters = dict(mutation.parameters)
+    if parameters.get("intervention_id") is None:
+        parameters["intervention_id"] = _simulated_id(
+            "intervention", (i.intervention_id for i in graph.interventions)
+        )
+    if parameters.get("start_date") is None:
+        parameters["start_date"] = now
+    graph.interventions.append(Intervention(**parameters))
+
+
+def _remove_intervention(
+    mutation: "Mutation", graph: PatientGraph, now: datetime
+) -> None:
+    intervention_id = mutation.parameters.get("intervention_id")
+    kept = [i for i in graph.interventions if i.intervention_id != intervention_id]
+    if len(kept) < len(graph.interventions):
+        graph.interventions = kept
+
+
+def _modify_housing(mutation: "Mutation", graph: PatientGraph, now: datetime) -> None:
+    # Add housing stability as a positive life event
+    housing_event = Event(
+        event_id=_simulated_id("housing", (e.event_id for e in graph.events)),
+        event_type=EventType.HOUSING_CHANGE,
+        description=mutation.parameters.get("description", "Housing stabilized"),
+        date=now,
+        impact_score=mutation.parameters.get("impact_score", 0.7),  # Positive impact
+    )
+    graph.events.append(housing_event)
+    graph.metadata["simulated_housing_status"] = mutation.parameters.get(
+        "status", "stable"
+    )
+
+
+def _modify_employment(
+    mutation: "Mutation", graph: PatientGraph, now: datetime
+) -> None:
+    # Add employment change as a life event
+    employment_event = Event(
+        event_id=_simulated_id("employment", (e.event_id for e in graph.events)),
+        event_type=EventType.JOB_CHANGE,
+        description=mutation.parameters.get(
+            "description", "Employment status changed"
+        ),
+        date=now,
+        impact_score=mutation.parameters.get("impact_score", 0.5),
+    )
+    graph.events.append(employment_event)
+    graph.metadata["simulated_employment_status"] = mutation.parameters.get(
+        "status", "employed"
+    )
 
-        return modified
+
+def _simulated_id(kind: str, taken: Iterable[str]) -> str:
+    """
+    Id for a node created by a simulation: the first free ``sim_<kind>_<n>``.
+
+    The id depends only on the ids already in the graph, so applying a
+    mutation to equal graphs creates equal nodes (and equal content hashes,
+    which compare_scenarios and model caches key on).
+    """
+    taken = set(taken)
+    n = 0
+    while f"sim_{kind}_{n}" in taken:
+        n += 1
+    return f"sim_{kind}_{n}"
+
+
+Mutation.handlers = {
+    MutationType.ADD_EVENT: _add_event,
+    MutationType.REMOVE_EVENT: _remove_event,
+    MutationType.MODIFY_EVENT: _modify_event,
+    MutationType.ADD_INTERVENTION: _add_intervention,
+    MutationType.REMOVE_INTERVENTION: _remove_intervention,
+    MutationType.MODIFY_HOUSING: _modify_housing,
+    MutationType.MODIFY_EMPLOYMENT: _modify_employment,
+}
+
+# Containers each mutation type appends to or sets keys in (the rest rebind)
+_IN_PLACE_WRITES: Dict[MutationType, Tuple[str, ...]] = {
+    MutationType.ADD_EVENT: ("events",),
+    MutationType.ADD_INTERVENTION: ("interventions",),
+    MutationType.MODIFY_HOUSING: ("events", "metadata"),
+    MutationType.MODIFY_EMPLOYMENT: ("events", "metadata"),
+}
+
+
+def _own_containers(graph: PatientGraph, names: Iterable[str]) -> None:
+    """Replace the named list/dict attributes of a graph with shallow copies."""
+    for name in names:
+        setattr(graph, name, copy.copy(getattr(graph, name)))
 
 
 class SimulationContext:
@@ -178,17 +299,26 @@ class SimulationContext:
     - Suitable for clinical decision support and patient education
     """
 
-    def __init__(self, baseline_graph: PatientGraph, model: ISimulationModel):
+    def __init__(
+        self,
+        baseline_graph: PatientGraph,
+        model: ISimulationModel,
+        as_of: Optional[datetime] = None,
+    ):
         """
         Initialize the simulation context.
 
         Args:
             baseline_graph: The current/actual patient state
             model: Risk model that supports simulation
+            as_of: Date of the nodes that mutations create (default: now).
+                Fixed for the context, so running a scenario again builds an
+                equal graph.
         """
         self.baseline_graph = baseline_graph
         self.model = model
-        self.simulation_history: List[Dict[str, Any]] = []
+        self.as_of = datetime.now() if as_of is None else as_of
+        self.simulation_history: List[Mapping[str, Any]] = []
 
     def simulate_mutation(
         self, mutation: Mutation, options: Optional[Dict[str, Any]] = None
@@ -204,7 +334,7 @@ class SimulationContext:
             dict: Simulation results with risk comparison
         """
         # Apply mutation to create hypothetical scenario
-        modified_graph = mutation.apply(self.baseline_graph)
+        modified_graph = mutation.apply(self.baseline_graph, self.as_of)
 
         # Calculate risk delta
         result = self.model.calculate_risk_delta(
@@ -219,8 +349,7 @@ class SimulationContext:
         }
         result["timestamp"] = datetime.now()
 
-        # Store in history
-        self.simulation_history.append(result)
+        self._store_in_history(result)
 
         return result
 
@@ -240,17 +369,57 @@ class SimulationContext:
         Returns:
             dict: Simulation results with risk comparison
         """
-        # Apply all mutations sequentially
-        modified_graph = self.baseline_graph
-        for mutation in mutations:
-            modified_graph = mutation.apply(modified_graph)
+        modified_graph = self._apply_mutations(mutations)
 
         # Calculate risk delta
         result = self.model.calculate_risk_delta(
             self.baseline_graph, modified_graph, options
         )
 
-        # Add metadata
+        return self._record_result(result, mutations)
+
+    def _apply_mutations(
+        self,
+        mutations: List[Mutation],
+        prefix_graphs: Optional[Dict[Tuple[int, ...], PatientGraph]] = None,
+    ) -> PatientGraph:
+        """
+        Apply mutations sequentially to (a copy of) the baseline.
+
+        Args:
+            mutations: Mutations to apply, in order
+            prefix_graphs: Graphs already built for mutation prefixes, keyed by
+                the ids of the mutations applied. Reused where a prefix
+                matches, and extended with the new prefixes, so scenarios that
+                start with the same mutations share those graphs.
+
+        Returns:
+            PatientGraph: The baseline with all mutations applied
+        """
+        if prefix_graphs is None:
+            # One shallow copy for the whole sequence; each container is
+            # copied the first time a mutation writes to it in place
+            modified_graph = self.baseline_graph.model_copy()
+            owned: Set[str] = set()
+            for mutation in mutations:
+                _own_containers(modified_graph, set(mutation.in_place_writes) - owned)
+                owned.update(mutation.in_place_writes)
+                mutation.apply_inplace(modified_graph, self.as_of)
+            return modified_graph
+
+        modified_graph = self.baseline_graph
+        prefix: Tuple[int, ...] = ()
+        for mutation in mutations:
+            prefix += (id(mutation),)
+            if prefix not in prefix_graphs:
+                prefix_graphs[prefix] = mutation.apply(modified_graph, self.as_of)
+            modified_graph = prefix_graphs[prefix]
+        return modified_graph
+
+    def _record_result(
+        self, result: Dict[str, Any], mutations: List[Mutation]
+    ) -> Dict[str, Any]:
+        """Attach mutation metadata to a result and store it in history."""
         result["mutations"] = [
             {
                 "type": m.mutation_type,
@@ -261,14 +430,17 @@ class SimulationContext:
         ]
         result["timestamp"] = datetime.now()
 
-        # Store in history
-        self.simulation_history.append(result)
+        self._store_in_history(result)
 
         return result
 
+    def _store_in_history(self, result: Dict[str, Any]) -> None:
+        """Store a read-only snapshot of a result (callers keep the dict)."""
+        self.simulation_history.append(MappingProxyType(dict(result)))
+
     def compare_scenarios(
         self,
-        scenarios: Dict[str, List[Mutation]],
+        scenarios: Mapping[str, List[Mutation]],
         options: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Dict[str, Any]]:
         """
@@ -284,18 +456,39 @@ class SimulationContext:
             comparison = sim.compare_scenarios(scenarios)
 
         Args:
-            scenarios: Dict mapping scenario names to mutation lists
+            scenarios: Mapping of scenario names to mutation lists (not modified)
             options: Optional model configuration
 
         Returns:
             dict: Results for each scenario
         """
-        results = {}
+        # Scenarios starting with the same mutations (e.g., "MAT" and
+        # "MAT + Housing") apply them once, and scenarios with the same
+        # mutation sequence (or none, i.e., the baseline itself) get the same
+        # graph object, so each distinct graph is evaluated once
+        prefix_graphs: Dict[Tuple[int, ...], PatientGraph] = {}
+        unique_graphs: Dict[int, PatientGraph] = {}
+        scenario_graph_ids: Dict[str, int] = {}
+        for scenario_name, mutations in scenarios.items():
+            modified_graph = self._apply_mutations(mutations, prefix_graphs)
+            unique_graphs.setdefault(id(modified_graph), modified_graph)
+            scenario_graph_ids[scenario_name] = id(modified_graph)
+
+        # Score the baseline and every distinct scenario graph in one batch
+        deltas = dict(
+            zip(
+                unique_graphs,
+                self.model.calculate_risk_deltas(
+                    self.baseline_graph, list(unique_graphs.values()), options
+                ),
+            )
+        )
 
+        results = {}
         for scenario_name, mutations in scenarios.items():
-            result = self.simulate_multiple_mutations(mutations, options)
+            result = dict(deltas[scenario_graph_ids[scenario_name]])
             result["scenario_name"] = scenario_name
-            results[scenario_name] = result
+            results[scenario_name] = self._record_result(result, mutations)
 
         # Sort scenarios by predicted risk (best to worst)
         sorted_scenarios = sorted(
@@ -308,12 +501,15 @@ class SimulationContext:
             "best_scenario": sorted_scenarios[0][0] if sorted_scenarios else None,
         }
 
-    def get_simulation_history(self) -> List[Dict[str, Any]]:
+    def get_simulation_history(self) -> List[Mapping[str, Any]]:
         """
         Get the history of all simulations run in this context.
 
+        Entries are read-only snapshots taken when each simulation ran, so the
+        list can be handed out without copying them.
+
         Returns:
-            List[Dict[str, Any]]: List of simulation results
+            List[Mapping[str, Any]]: List of simulation results
         """
         return self.simulation_history.copy()
 
@@ -380,14 +576,15 @@ def create_employment_mutation(employed: bool = True) -> Mutation:
 
 
 def create_mat_intervention_mutation(medication: str = "buprenorphine") -> Mutation:
-    """Create a mutation for starting medication-assisted treatment (MAT)."""
+    """Create a mutation for starting medication-assisted treatment (MAT).
+
+    The intervention's id and start date are assigned when it is applied.
+    """
     return Mutation(
         MutationType.ADD_INTERVENTION,
         {
-            "intervention_id": f"sim_mat_{datetime.now().timestamp()}",
             "intervention_type": InterventionType.MEDICATION,
             "description": f"Medication-Assisted Treatment ({medication})",
-            "start_date": datetime.now(),
             "effectiveness_score": 0.75,
         },
         description=f"Start MAT ({medication})",
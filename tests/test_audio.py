@@ -0,0 +1,268 @@
+"""Tests for audio providers."""
+
+import asyncio
+import time
+
+import numpy as np
+
+from pacing.core.audio_interfaces import (
+    IAudioProvider,
+    float32_to_pcm16,
+    pcm16_to_float32,
+)
+from pacing.impl.audio.vad import VADFilteredAudioProvider
+from pacing.impl.defaults.mock_audio import MockAudioProvider, ScriptedAudioProvider
+
+
+class TestMockAudioProvider:
+    """Tests for MockAudioProvider."""
+
+    def test_async_stream_yields_int16_chunks(self):
+        """Test that the async iterator yields full int16 chunks, then ends."""
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=0.05)
+
+        async def run():
+            audio.start_stream()
+            return [chunk async for chunk in audio.get_audio_chunks_async()]
+
+        chunks = asyncio.run(run())
+        assert len(chunks) > 0
+        assert all(len(chunk) == audio._chunk_size for chunk in chunks)
+        assert all(chunk.dtype == np.int16 for chunk in chunks)
+
+    def test_slow_consumer_does_not_add_drift(self):
+        """Test that consumer time is absorbed by deadlines instead of added."""
+        audio = MockAudioProvider(chunk_duration_ms=20, total_duration_sec=0.2)
+        audio.start_stream()
+
+        start = time.monotonic()
+        for _ in audio.get_audio_chunks():
+            time.sleep(0.01)  # Half a chunk of consumer work
+        elapsed = time.monotonic() - start
+
+        # Fixed sleeps after each chunk would take ~1.5x the 0.2 s stream
+        assert elapsed < 0.27
+
+    def test_noise_chunks_are_read_only_views_of_one_pool(self):
+        """Test that chunks come from the pre-generated pool without copying."""
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=0.05)
+        audio.start_stream()
+
+        chunks = [audio._noise_chunk() for _ in range(3)]
+
+        assert all(np.shares_memory(c, audio._noise_pool) for c in chunks)
+        assert not any(c.flags.writeable for c in chunks)
+        assert not np.array_equal(chunks[0], chunks[1])
+
+
+class TestScriptedAudioProvider:
+    """Tests for ScriptedAudioProvider."""
+
+    def test_script_entries_become_int16_chunks(self):
+        """Test silence and placeholder noise chunks."""
+        audio = ScriptedAudioProvider(
+            [(0.0, "silence"), (0.0, "speech")], chunk_duration_ms=10
+        )
+        audio.start_stream()
+
+        silence, speech = list(audio.get_audio_chunks())
+
+        assert silence.dtype == speech.dtype == np.int16
+        assert len(silence) == len(speech) == 160
+        assert not silence.any() and speech.any()
+
+    def test_timestamps_are_offsets_from_start(self):
+        """Test that entries play at their timestamps, not after summed waits."""
+        audio = ScriptedAudioProvider(
+            [(0.0, "silence"), (0.05, "speech"), (0.1, "silence")]
+        )
+        audio.start_stream()
+
+        start = time.monotonic()
+        chunks = list(audio.get_audio_chunks())
+        elapsed = time.monotonic() - start
+
+        # Sleeping each timestamp in turn would take 0.15 s
+        assert 0.1 <= elapsed < 0.14
+        assert chunks[0] is chunks[2]
+
+
+class TestPcm16ToFloat32:
+    """Tests for the int16 -> float32 conversion used by transcribers."""
+
+    def test_scales_to_unit_range(self):
+        """Test that full-scale int16 maps onto [-1, 1)."""
+        pcm = np.array([-32768, 0, 32767], dtype=np.int16)
+
+        floats = pcm16_to_float32(pcm)
+
+        assert floats.dtype == np.float32
+        assert floats[0] == -1.0 and floats[1] == 0.0
+        assert 0.9999 < floats[2] < 1.0
+
+    def test_float_input_passes_through(self):
+        """Test that float32 audio is returned without copying."""
+        audio = np.zeros(8, dtype=np.float32)
+
+        assert pcm16_to_float32(audio) is audio
+
+
+class TestFloat32ToPcm16:
+    """Tests for the float -> int16 conversion applied to float providers."""
+
+    def test_inverts_pcm16_to_float32(self):
+        """Test that int16 survives a round trip through float32."""
+        pcm = np.array([-32768, -1, 0, 1, 16384, 32767], dtype=np.int16)
+
+        assert float32_to_pcm16(pcm16_to_float32(pcm)).tolist() == pcm.tolist()
+
+    def test_out_of_range_is_clipped(self):
+        """Test that samples beyond full scale saturate instead of wrapping."""
+        floats = np.array([-2.0, 1.5], dtype=np.float32)
+
+        assert float32_to_pcm16(floats).tolist() == [-32768, 32767]
+
+
+class _BlockingProvider(IAudioProvider):
+    """Provider with only a blocking iterator (uses the default async bridge)."""
+
+    def __init__(self, n_chunks: int = 5, delay_sec: float = 0.01):
+        self.n_chunks = n_chunks
+        self.delay_sec = delay_sec
+
+    def start_stream(self) -> None:
+        pass
+
+    def stop_stream(self) -> None:
+        pass
+
+    def get_audio_chunks(self):
+        for i in range(self.n_chunks):
+            time.sleep(self.delay_sec)
+            yield np.full(4, i, dtype=np.int16)
+
+    def get_sample_rate(self) -> int:
+        return 16000
+
+
+class TestDefaultAsyncBridge:
+    """Tests for the default IAudioProvider.get_audio_chunks_async."""
+
+    def test_yields_all_chunks_in_order(self):
+        """Test that the threaded bridge preserves chunk order."""
+        provider = _BlockingProvider(n_chunks=10, delay_sec=0.0)
+
+        async def run():
+            return [int(c[0]) async for c in provider.get_audio_chunks_async()]
+
+        assert asyncio.run(run()) == list(range(10))
+
+    def test_does_not_block_event_loop(self):
+        """Test that other tasks keep running while the provider blocks."""
+        provider = _BlockingProvider(n_chunks=5, delay_sec=0.02)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            async for _ in provider.get_audio_chunks_async():
+                pass
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) > 5
+
+    def test_early_break_stops_producer(self):
+        """Test that breaking out of the iterator does not hang."""
+        provider = _BlockingProvider(n_chunks=1000, delay_sec=0.0)
+
+        async def run():
+            received = 0
+            async for _ in provider.get_audio_chunks_async():
+                received += 1
+                if received == 3:
+                    break
+            return received
+
+        assert asyncio.run(asyncio.wait_for(run(), timeout=2.0)) == 3
+
+
+class _SequenceProvider(IAudioProvider):
+    """Provider replaying a fixed list of chunks."""
+
+    def __init__(self, chunks, sample_rate: int = 100):
+        self.chunks = chunks
+        self.sample_rate = sample_rate
+
+    def start_stream(self) -> None:
+        pass
+
+    def stop_stream(self) -> None:
+        pass
+
+    def get_audio_chunks(self):
+        yield from self.chunks
+
+    def get_sample_rate(self) -> int:
+        return self.sample_rate
+
+
+def _speech(n: int = 50) -> np.ndarray:
+    return np.full(n, 1000, dtype=np.int16)
+
+
+def _silence(n: int = 50) -> np.ndarray:
+    return np.zeros(n, dtype=np.int16)
+
+
+class TestVADFilteredAudioProvider:
+    """Tests for VADFilteredAudioProvider (sample rate 100 Hz, 0.5 s chunks)."""
+
+    def test_silence_is_dropped_and_speech_segmented_at_pauses(self):
+        """Test that pauses close segments once they reach the minimum length."""
+        chunks = [_speech(), _speech(), _silence(), _silence(), _speech()]
+        vad = VADFilteredAudioProvider(
+            _SequenceProvider(chunks), min_segment_sec=1.0, max_segment_sec=5.0
+        )
+
+        segments = list(vad.get_audio_chunks())
+
+        # 1.0 s closed by the pause, then the trailing 0.5 s flushed at the end
+        assert [len(s) for s in segments] == [100, 50]
+        assert all(np.all(s == 1000) for s in segments)
+
+    def test_short_speech_waits_for_minimum_length(self):
+        """Test that a pause before min_segment_sec does not close a segment."""
+        chunks = [_speech(), _silence(), _speech(), _speech(), _silence()]
+        vad = VADFilteredAudioProvider(
+            _SequenceProvider(chunks), min_segment_sec=1.5, max_segment_sec=5.0
+        )
+
+        assert [len(s) for s in vad.get_audio_chunks()] == [150]
+
+    def test_long_speech_is_force_split(self):
+        """Test that segments never exceed max_segment_sec."""
+        chunks = [_speech() for _ in range(5)]
+        vad = VADFilteredAudioProvider(
+            _SequenceProvider(chunks), min_segment_sec=0.5, max_segment_sec=1.0
+        )
+
+        assert [len(s) for s in vad.get_audio_chunks()] == [100, 100, 50]
+
+    def test_async_matches_sync(self):
+        """Test that the async path yields the same segments."""
+        chunks = [_speech(), _speech(), _silence(), _speech()]
+        vad = VADFilteredAudioProvider(
+            _SequenceProvider(chunks), min_segment_sec=1.0, max_segment_sec=5.0
+        )
+
+        async def run():
+            return [len(s) async for s in vad.get_audio_chunks_async()]
+
+        assert asyncio.run(run()) == [len(s) for s in vad.get_audio_chunks()]
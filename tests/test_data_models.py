@@ -2,12 +2,22 @@
 
 import pytest
 from datetime import datetime
+
+import numpy as np
+from pydantic import ValidationError
+
 from pacing.models.data_models import (
+    EVENT_TYPE_CODES,
+    INTERVENTION_TYPE_CODES,
+    MISSING_TIME_NS,
+    NS_PER_DAY,
+    SUBSTANCE_TYPE_CODES,
     TranscriptionResult,
     ConfidenceLevel,
     PatientGraph,
     Event,
     EventType,
+    GraphEdge,
     SubstanceUse,
     SubstanceType,
     SubstanceUseStatus,
@@ -64,6 +74,40 @@ class TestTranscriptionResult:
                 confidence_score=1.5,  # Invalid: > 1.0
             )
 
+    def test_text_lower_cached_and_invalidated(self):
+        """Test that text_lower is computed once and follows text changes."""
+        result = TranscriptionResult(text="Took METHADONE", confidence_score=0.9)
+
+        assert result.text_lower == "took methadone"
+        assert result.text_lower is result.text_lower
+        assert "text_lower" not in result.model_dump()
+        # Equality compares fields only, not cached values in __dict__
+        assert result == TranscriptionResult(**result.model_dump())
+
+        edited = result.model_copy(update={"text": "Took Naloxone"})
+        assert edited.text_lower == "took naloxone"
+        assert result.text_lower == "took methadone"
+
+    def test_results_are_immutable(self):
+        """Test that a shared result cannot be modified in place."""
+        result = TranscriptionResult(text="Took METHADONE", confidence_score=0.9)
+
+        with pytest.raises(ValidationError):
+            result.text = "Took Naloxone"
+
+    def test_bucket_levels_matches_confidence_level(self):
+        """Test that vectorized bucketing agrees with the per-result property."""
+        scores = np.array([0.0, 0.5, 0.6999, 0.70, 0.8, 0.85, 0.95, 1.0])
+
+        levels = TranscriptionResult.bucket_levels(scores)
+
+        expected = [
+            TranscriptionResult(text="x", confidence_score=s).confidence_level
+            for s in scores
+        ]
+        assert levels.tolist() == expected
+        assert TranscriptionResult.bucket_levels(scores.reshape(2, 4)).shape == (2, 4)
+
 
 class TestPatientGraph:
     """Tests for PatientGraph model."""
@@ -116,6 +160,175 @@ class TestPatientGraph:
         assert "use-1" in node_ids
         assert "intervention-1" in node_ids
         assert len(node_ids) == 3
+        assert list(graph.iter_all_node_ids()) == [
+            "event-1",
+            "use-1",
+            "intervention-1",
+        ]
+
+    def test_content_hash_tracks_content(self):
+        """Test that content_hash is equal for equal graphs and changes with edits."""
+        date = datetime(2024, 1, 1)
+        event = Event(
+            event_id="event-1",
+            event_type=EventType.JOB_CHANGE,
+            description="Got new job",
+            date=date,
+        )
+        graph = PatientGraph(patient_id="patient-123", events=[event])
+        same = PatientGraph(patient_id="patient-123", events=[event.model_copy()])
+        edited = PatientGraph(
+            patient_id="patient-123",
+            events=[event.model_copy(update={"impact_score": 0.5})],
+        )
+        assert graph.content_hash() == same.content_hash()
+        assert graph.content_hash() != edited.content_hash()
+
+    def test_clone_is_independent_and_equal(self):
+        """Test that clone matches a deep copy without sharing mutable nodes."""
+        graph = PatientGraph(
+            patient_id="patient-123",
+            events=[
+                Event(
+                    event_id="event-1",
+                    event_type=EventType.TRAUMA,
+                    description="Accident",
+                    date=datetime(2024, 5, 30),
+                    metadata={"reported_by": "patient"},
+                )
+            ],
+            interventions=[
+                Intervention(
+                    intervention_id="intervention-1",
+                    intervention_type=InterventionType.THERAPY,
+                    description="CBT sessions",
+                    start_date=datetime(2024, 5, 25),
+                )
+            ],
+            metadata={"source": "intake"},
+        )
+
+        clone = graph.clone()
+
+        assert clone == graph.model_copy(deep=True)
+        assert clone.content_hash() == graph.content_hash()
+        clone.events[0].metadata["reported_by"] = "clinician"
+        clone.interventions.append(clone.interventions[0])
+        assert graph.events[0].metadata == {"reported_by": "patient"}
+        assert len(graph.interventions) == 1
+        # Frozen nodes without metadata are shared
+        assert clone.interventions[0] is graph.interventions[0]
+        with pytest.raises(ValidationError):
+            clone.interventions[0].effectiveness_score = 0.9
+
+    def test_to_soa_columns(self):
+        """Test that to_soa lays out node attributes as aligned arrays."""
+        now = datetime(2024, 6, 1)
+        graph = PatientGraph(
+            patient_id="patient-123",
+            events=[
+                Event(
+                    event_id="event-1",
+                    event_type=EventType.TRAUMA,
+                    description="Accident",
+                    date=datetime(2024, 5, 30),
+                    impact_score=-0.8,
+                ),
+                Event(
+                    event_id="event-2",
+                    event_type=EventType.OTHER,
+                    description="Moved",
+                    date=datetime(2024, 5, 1),
+                ),
+            ],
+            interventions=[
+                Intervention(
+                    intervention_id="intervention-1",
+                    intervention_type=InterventionType.THERAPY,
+                    description="CBT sessions",
+                    start_date=datetime(2024, 5, 25),
+                )
+            ],
+            substance_use_records=[
+                SubstanceUse(
+                    use_id="use-1",
+                    substance_type=SubstanceType.OPIOIDS,
+                    status=SubstanceUseStatus.REMISSION,
+                    date=datetime(2024, 4, 1),
+                    severity=3,
+                )
+            ],
+        )
+
+        columns = graph.to_soa(now=now)
+
+        assert columns.age_days(columns.event_time_ns).tolist() == [2.0, 31.0]
+        assert columns.reference_ns - columns.event_time_ns[0] == 2 * NS_PER_DAY
+        assert columns.event_impacts[0] == pytest.approx(-0.8)
+        assert np.isnan(columns.event_impacts[1])
+        assert columns.event_types.tolist() == [
+            EVENT_TYPE_CODES[EventType.TRAUMA],
+            EVENT_TYPE_CODES[EventType.OTHER],
+        ]
+        assert columns.age_days(columns.intervention_start_ns).tolist() == [7.0]
+        assert columns.intervention_end_ns.tolist() == [MISSING_TIME_NS]
+        assert columns.event_ids.tolist() == ["event-1", "event-2"]
+        assert columns.intervention_ids.tolist() == ["intervention-1"]
+        assert columns.intervention_types.tolist() == [
+            INTERVENTION_TYPE_CODES[InterventionType.THERAPY]
+        ]
+        assert columns.substance_use_ids.tolist() == ["use-1"]
+        assert columns.substance_types.tolist() == [
+            SUBSTANCE_TYPE_CODES[SubstanceType.OPIOIDS]
+        ]
+        assert columns.substance_severities.tolist() == [3.0]
+
+    def test_columnar_aggregates(self):
+        """Test impact sums per event type and days since the last relapse."""
+        now = datetime(2024, 6, 1)
+
+        def use(i, status, day):
+            return SubstanceUse(
+                use_id=f"use-{i}",
+                substance_type=SubstanceType.ALCOHOL,
+                status=status,
+                date=datetime(2024, 5, day),
+            )
+
+        graph = PatientGraph(
+            patient_id="patient-123",
+            events=[
+                Event(
+                    event_id=f"event-{i}",
+                    event_type=event_type,
+                    description="",
+                    date=now,
+                    impact_score=score,
+                )
+                for i, (event_type, score) in enumerate(
+                    [
+                        (EventType.TRAUMA, -0.5),
+                        (EventType.TRAUMA, -0.25),
+                        (EventType.JOB_CHANGE, 0.5),
+                        (EventType.JOB_CHANGE, None),
+                    ]
+                )
+            ],
+            substance_use_records=[
+                use(1, SubstanceUseStatus.RELAPSE, 1),
+                use(2, SubstanceUseStatus.RELAPSE, 21),
+                use(3, SubstanceUseStatus.RECOVERY, 29),
+            ],
+        )
+
+        columns = graph.to_soa(now=now)
+        impacts = columns.impact_by_event_type()
+
+        assert impacts[EVENT_TYPE_CODES[EventType.TRAUMA]] == pytest.approx(-0.75)
+        assert impacts[EVENT_TYPE_CODES[EventType.JOB_CHANGE]] == pytest.approx(0.5)
+        assert impacts.sum() == pytest.approx(-0.25)
+        assert columns.days_since_last_relapse() == 11.0
+        assert np.isnan(PatientGraph(patient_id="p").to_soa().days_since_last_relapse())
 
 
 class TestEvent:
@@ -163,6 +376,21 @@ class TestSubstanceUse:
         assert use.severity == 3
 
 
+class TestGraphEdge:
+    """Tests for GraphEdge model."""
+
+    def test_relationship_labels_are_interned(self):
+        """Test that equal labels share one string object, including from JSON."""
+        edge = GraphEdge(
+            source_id="a", target_id="b", relationship_type="".join(["lea", "ds_to"])
+        )
+        loaded = GraphEdge.model_validate_json(
+            '{"source_id": "b", "target_id": "c", "relationship_type": "leads_to"}'
+        )
+
+        assert edge.relationship_type is loaded.relationship_type
+
+
 class TestRiskReport:
     """Tests for RiskReport model."""
 
@@ -1,7 +1,11 @@
 """Tests for mock risk models."""
 
+import random
+import time
+
 import pytest
 from datetime import datetime, timedelta
+from pacing.impl.defaults import mock_risk_model
 from pacing.impl.defaults.mock_risk_model import MockBayesianModel, MockSimulationModel
 from pacing.models.data_models import (
     PatientGraph,
@@ -15,6 +19,10 @@ from pacing.models.data_models import (
 )
 
 
+def _factor_names(report):
+    return [f.factor_name for f in report.risk_factors]
+
+
 class TestMockBayesianModel:
     """Tests for MockBayesianModel."""
 
@@ -209,6 +217,34 @@ class TestMockBayesianModel:
         factor_names = [f.factor_name for f in report.risk_factors]
         assert any("sobriety" in name.lower() for name in factor_names)
 
+    def test_ended_and_future_interventions_are_not_active(self):
+        """Test that only interventions spanning the present count as active."""
+        model = MockBayesianModel(base_risk=0.50)
+        now = datetime.now()
+        graph = PatientGraph(
+            patient_id="patient-123",
+            interventions=[
+                Intervention(
+                    intervention_id="ended",
+                    intervention_type=InterventionType.THERAPY,
+                    description="CBT",
+                    start_date=now - timedelta(days=60),
+                    end_date=now - timedelta(days=30),
+                ),
+                Intervention(
+                    intervention_id="planned",
+                    intervention_type=InterventionType.MEDICATION,
+                    description="MAT",
+                    start_date=now + timedelta(days=7),
+                ),
+            ],
+        )
+
+        report = model.calculate_risk(graph)
+
+        factor_names = [f.factor_name for f in report.risk_factors]
+        assert "Active Treatment" not in factor_names
+
 
 class TestMockSimulationModel:
     """Tests for MockSimulationModel."""
@@ -278,3 +314,363 @@ class TestMockSimulationModel:
         # Modified should have higher risk (positive delta)
         assert result["delta"] > 0.0
         assert result["modified_risk"] > result["baseline_risk"]
+
+    def test_calculate_risk_batch_matches_single_calls(self):
+        """Test that batch scoring agrees with per-graph calculate_risk."""
+        model = MockSimulationModel()
+        graphs = [
+            PatientGraph(patient_id="patient-123"),
+            PatientGraph(
+                patient_id="patient-123",
+                substance_use_records=[
+                    SubstanceUse(
+                        use_id="use-1",
+                        substance_type=SubstanceType.OPIOIDS,
+                        status=SubstanceUseStatus.ACTIVE_USE,
+                        date=datetime.now() - timedelta(days=2),
+                    )
+                ],
+            ),
+        ]
+
+        batch = model.calculate_risk_batch(graphs)
+
+        assert [r.risk_score for r in batch] == [
+            model.calculate_risk(g).risk_score for g in graphs
+        ]
+        assert [[f.factor_name for f in r.risk_factors] for r in batch] == [
+            [f.factor_name for f in model.calculate_risk(g).risk_factors]
+            for g in graphs
+        ]
+
+    def test_calculate_risk_deltas_matches_single_calls(self):
+        """Test that batched deltas agree with calculate_risk_delta."""
+        model = MockSimulationModel()
+        baseline = PatientGraph(patient_id="patient-123")
+        modified = [
+            baseline,
+            PatientGraph(
+                patient_id="patient-123",
+                interventions=[
+                    Intervention(
+                        intervention_id="int-1",
+                        intervention_type=InterventionType.MEDICATION,
+                        description="MAT",
+                        start_date=datetime.now(),
+                    )
+                ],
+            ),
+        ]
+
+        results = model.calculate_risk_deltas(baseline, modified)
+
+        assert [r["delta"] for r in results] == [
+            model.calculate_risk_delta(baseline, m)["delta"] for m in modified
+        ]
+
+    def test_one_clock_read_per_batch(self, monkeypatch):
+        """Test that all graphs and rules of a comparison share one 'now'."""
+        calls = []
+
+        class CountingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                calls.append(None)
+                return datetime.now(tz)
+
+        monkeypatch.setattr(mock_risk_model, "datetime", CountingDatetime)
+        model = MockSimulationModel()
+        graph = PatientGraph(patient_id="patient-123")
+
+        model.calculate_risk_deltas(graph, [graph, graph, graph])
+
+        assert len(calls) == 1
+
+    def test_repeated_graph_summarized_once_per_batch(self, summaries):
+        """Test that a graph appearing twice in a batch is summarized once."""
+        model = MockSimulationModel(cache_size=0)
+        baseline = PatientGraph(patient_id="baseline")
+        other = PatientGraph(patient_id="other")
+
+        results = model.calculate_risk_deltas(baseline, [baseline, other, baseline])
+
+        assert len(summaries) == 2 * 3  # Two graphs, three node lists each
+        assert [r["delta"] for r in results] == [0.0, 0.0, 0.0]
+
+
+@pytest.fixture
+def summaries(monkeypatch):
+    """Record the kind of every node list the model summarizes."""
+    calls = []
+    for kind, name in [
+        ("events", "_negative_event_dates"),
+        ("substance_use_records", "_substance_summary"),
+        ("interventions", "_intervention_bounds"),
+    ]:
+
+        def counting_summary(nodes, kind=kind, original=getattr(mock_risk_model, name)):
+            calls.append(kind)
+            return original(nodes)
+
+        monkeypatch.setattr(mock_risk_model, name, counting_summary)
+    return calls
+
+
+def _loop_features(graph, now):
+    """The rule inputs computed by a plain loop over the nodes (as in 85ec67f)."""
+    using = {SubstanceUseStatus.ACTIVE_USE, SubstanceUseStatus.RELAPSE}
+    negative_types = {EventType.TRAUMA, EventType.JOB_CHANGE, EventType.LEGAL_EVENT}
+    recent_use = any(
+        r.date >= now - timedelta(days=30) and r.status in using
+        for r in graph.substance_use_records
+    )
+    negative_events = sum(
+        e.date >= now - timedelta(days=90)
+        and (
+            e.event_type in negative_types
+            or bool(e.impact_score and e.impact_score < -0.3)
+        )
+        for e in graph.events
+    )
+    active = sum(
+        i.start_date <= now and (i.end_date is None or i.end_date >= now)
+        for i in graph.interventions
+    )
+    if not graph.substance_use_records:
+        sobriety = 999
+    else:
+        latest = max(graph.substance_use_records, key=lambda r: r.date)
+        sober = (SubstanceUseStatus.RECOVERY, SubstanceUseStatus.REMISSION)
+        sobriety = (now - latest.date).days if latest.status in sober else 0
+    return (int(recent_use), negative_events, active, sobriety)
+
+
+def _random_graph(rng, now, n):
+    """A graph whose dates often sit exactly on the rules' boundaries."""
+    offsets = [timedelta(0), timedelta(microseconds=1), timedelta(hours=5)]
+    anchors = [now, now - timedelta(days=30), now - timedelta(days=90)]
+
+    def date():
+        return rng.choice(anchors) + rng.choice([-1, 1]) * rng.choice(offsets)
+
+    return PatientGraph(
+        patient_id="p",
+        events=[
+            Event(
+                event_id=f"e{i}",
+                event_type=rng.choice(list(EventType)),
+                description="",
+                date=date(),
+                impact_score=rng.choice([None, 0.0, -0.3, -0.31, 0.5]),
+            )
+            for i in range(n)
+        ],
+        substance_use_records=[
+            SubstanceUse(
+                use_id=f"u{i}",
+                substance_type=SubstanceType.ALCOHOL,
+                status=rng.choice(list(SubstanceUseStatus)),
+                date=date(),
+            )
+            for i in range(rng.randrange(n + 1))
+        ],
+        interventions=[
+            Intervention(
+                intervention_id=f"i{i}",
+                intervention_type=InterventionType.THERAPY,
+                description="",
+                start_date=date(),
+                end_date=rng.choice([None, date()]),
+            )
+            for i in range(n)
+        ],
+    )
+
+
+class TestRuleFeatures:
+    """Tests for the time-independent rule inputs and their evaluation."""
+
+    def test_matches_a_plain_loop_over_the_nodes(self):
+        """Test the bisection rules against a loop, on boundary dates."""
+        rng = random.Random(0)
+        now = datetime(2024, 6, 1, 12, 0)
+        for _ in range(200):
+            graph = _random_graph(rng, now, rng.randrange(6))
+            inputs = mock_risk_model._rule_inputs(graph)
+            for moment in (now, now - timedelta(microseconds=1)):
+                assert mock_risk_model._rule_features(inputs, moment) == (
+                    _loop_features(graph, moment)
+                )
+
+    def test_latest_record_is_the_first_listed_among_ties(self):
+        """Test that equal latest dates resolve to the earliest listed."""
+        now = datetime(2024, 6, 1)
+        graph = PatientGraph(
+            patient_id="tie",
+            substance_use_records=[
+                SubstanceUse(
+                    use_id=f"u{i}",
+                    substance_type=SubstanceType.ALCOHOL,
+                    status=status,
+                    date=now - timedelta(days=200),
+                )
+                for i, status in enumerate(
+                    [SubstanceUseStatus.RECOVERY, SubstanceUseStatus.ACTIVE_USE]
+                )
+            ],
+        )
+
+        features = mock_risk_model._rule_features(
+            mock_risk_model._rule_inputs(graph), now
+        )
+
+        assert features == (0, 0, 0, 200)
+
+
+class TestSummaryCache:
+    """Tests for memoizing node list summaries by list identity."""
+
+    def test_baseline_reused_across_comparisons(self, summaries):
+        """Test that a repeated baseline is only summarized once."""
+        model = MockSimulationModel()
+        baseline = PatientGraph(patient_id="baseline")
+
+        for i in range(3):
+            model.calculate_risk_delta(baseline, PatientGraph(patient_id=f"m{i}"))
+
+        assert len(summaries) == (1 + 3) * 3
+
+    def test_scenario_summarizes_only_the_lists_it_replaced(self, summaries):
+        """Test that a copy sharing the baseline's lists reuses their summaries."""
+        model = MockSimulationModel()
+        baseline = PatientGraph(patient_id="baseline")
+        scenario = baseline.model_copy()
+        scenario.interventions = [
+            Intervention(
+                intervention_id="i1",
+                intervention_type=InterventionType.MEDICATION,
+                description="MAT",
+                start_date=datetime.now() - timedelta(days=1),
+            )
+        ]
+        model.calculate_risk(baseline)
+        summaries.clear()
+
+        delta = model.calculate_risk_delta(baseline, scenario)
+
+        assert summaries == ["interventions"]
+        assert delta["delta"] < 0
+
+    def test_content_change_is_a_cache_miss(self, summaries):
+        """Test that editing or rebinding a node list invalidates its entry."""
+        model = MockBayesianModel()
+        graph = PatientGraph(patient_id="p1")
+        before = model.calculate_risk(graph).risk_score
+        summaries.clear()
+
+        graph.substance_use_records.append(
+            SubstanceUse(
+                use_id="u1",
+                substance_type=SubstanceType.ALCOHOL,
+                status=SubstanceUseStatus.RELAPSE,
+                date=datetime.now() - timedelta(days=1),
+            )
+        )
+        after = model.calculate_risk(graph).risk_score
+        graph.substance_use_records = []
+        rebound = model.calculate_risk(graph).risk_score
+
+        assert summaries == ["substance_use_records", "substance_use_records"]
+        assert after > before and rebound == before
+
+    def test_cached_summaries_are_scored_at_the_current_time(self, monkeypatch):
+        """Test that a cache hit still uses the exact time of the call."""
+        start = datetime.now()
+        clock = iter([start, start + timedelta(hours=2)])
+
+        class SteppingDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(clock)
+
+        monkeypatch.setattr(mock_risk_model, "datetime", SteppingDatetime)
+        model = MockBayesianModel()
+        graph = PatientGraph(
+            patient_id="p1",
+            interventions=[
+                Intervention(
+                    intervention_id="i1",
+                    intervention_type=InterventionType.MEDICATION,
+                    description="MAT",
+                    start_date=start + timedelta(hours=1),
+                )
+            ],
+        )
+
+        planned = model.calculate_risk(graph)
+        started = model.calculate_risk(graph)
+
+        assert "Active Treatment" not in _factor_names(planned)
+        assert "Active Treatment" in _factor_names(started)
+
+    def test_later_today_is_still_the_future(self):
+        """Test that a node dated later today does not count as past."""
+        model = MockBayesianModel()
+        graph = PatientGraph(
+            patient_id="p1",
+            interventions=[
+                Intervention(
+                    intervention_id="i1",
+                    intervention_type=InterventionType.MEDICATION,
+                    description="MAT",
+                    start_date=datetime.now() + timedelta(minutes=5),
+                )
+            ],
+        )
+
+        report = model.calculate_risk(graph)
+
+        assert "Active Treatment" not in _factor_names(report)
+
+    def test_disabled_cache_summarizes_every_call(self, summaries):
+        """Test that cache_size=0 keeps nothing."""
+        model = MockBayesianModel(cache_size=0)
+        graph = PatientGraph(patient_id="p1")
+
+        model.calculate_risk(graph)
+        model.calculate_risk(graph)
+
+        assert len(summaries) == 2 * 3
+        assert len(model._summary_cache) == 0
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used entries are evicted."""
+        model = MockBayesianModel(cache_size=4)
+
+        model.calculate_risk_batch(
+            [PatientGraph(patient_id=f"p{i}") for i in range(5)]
+        )
+
+        assert len(model._summary_cache) == 4
+
+    def test_repeat_scoring_beats_a_loop_over_the_nodes(self):
+        """Test that re-scoring a large graph costs less than scanning it once."""
+        now = datetime.now()
+        graph = _random_graph(random.Random(0), now, 1000)
+        model = MockBayesianModel()
+        model.calculate_risk(graph)
+
+        def best_of(score):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(20):
+                    score()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        cached = best_of(lambda: model.calculate_risk(graph))
+        loop = best_of(lambda: _loop_features(graph, now))
+
+        # Typically 10x or more; the margin keeps the test stable on slow hosts
+        assert loop > 3 * cached
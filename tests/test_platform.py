@@ -0,0 +1,243 @@
+"""Tests for the PacingPlatform facade."""
+
+import asyncio
+import dataclasses
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pacing.core.agent_interfaces import ISidecarAgent
+from pacing.core.audio_interfaces import IAudioProvider
+from pacing.impl.defaults.mock_audio import MockAudioProvider
+from pacing.impl.defaults.mock_risk_model import MockBayesianModel
+from pacing.impl.defaults.mock_transcriber import MockTranscriber
+from pacing.models.data_models import PatientGraph, SessionMetadata
+from pacing.platform import OperatingMode, PacingPlatform
+
+
+class _PreparedModel(MockBayesianModel):
+    """Model counting how often it is prepared."""
+
+    def __init__(self):
+        super().__init__()
+        self.prepare_calls = 0
+
+    def prepare(self) -> None:
+        self.prepare_calls += 1
+
+
+class TestRiskModelInstallation:
+    """Tests for risk model registration."""
+
+    def test_model_prepared_once_when_set(self):
+        """Test that set_risk_model prepares the model once, not per call."""
+        platform = PacingPlatform()
+        model = _PreparedModel()
+        platform.set_risk_model(model)
+
+        for _ in range(3):
+            platform.calculate_risk(PatientGraph(patient_id="patient-123"))
+
+        assert model.prepare_calls == 1
+
+    def test_model_prepared_when_passed_to_constructor(self):
+        """Test that a constructor-injected model is prepared."""
+        model = _PreparedModel()
+        PacingPlatform(risk_model=model)
+
+        assert model.prepare_calls == 1
+
+
+class _NamedAgent(ISidecarAgent):
+    """Agent counting the transcriptions it receives."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.updates = 0
+        self.ended = []
+
+    async def on_transcription_update(self, transcription, context=None):
+        self.updates += 1
+
+    def on_session_end(self, session_id: str) -> None:
+        self.ended.append(session_id)
+
+    def get_agent_name(self) -> str:
+        return self.name
+
+
+class TestPlatformStatus:
+    """Tests for get_platform_status."""
+
+    def test_status_reused_until_state_changes(self):
+        """Test that polling returns one snapshot until something changes."""
+        platform = PacingPlatform()
+        first = platform.get_platform_status()
+
+        assert platform.get_platform_status() is first
+
+        platform.register_agent(_NamedAgent("Guide"))
+        updated = platform.get_platform_status()
+
+        assert updated is not first
+        assert updated.registered_agents == ("Guide",)
+        assert first.registered_agents == ()
+
+    def test_status_supports_item_access(self):
+        """Test dict-style access for existing callers."""
+        platform = PacingPlatform(operating_mode=OperatingMode.DEV_MODE)
+        status = platform.get_platform_status()
+
+        assert status["operating_mode"] == "dev"
+        assert status["session_active"] is False
+        with pytest.raises(KeyError):
+            status["missing"]
+
+    def test_status_is_a_read_only_mapping(self):
+        """Test dict-style APIs and the plain-dict export used by old callers."""
+        platform = PacingPlatform(operating_mode=OperatingMode.DEV_MODE)
+        platform.register_agent(_NamedAgent("Guide"))
+        status = platform.get_platform_status()
+
+        assert status.get("missing", "default") == "default"
+        assert set(status.keys()) == {
+            "operating_mode",
+            "session_active",
+            "transcriber",
+            "risk_model",
+            "registered_agents",
+        }
+        assert {**status}["registered_agents"] == ("Guide",)
+        assert json.loads(json.dumps(status.to_dict())) == {
+            "operating_mode": "dev",
+            "session_active": False,
+            "transcriber": None,
+            "risk_model": None,
+            "registered_agents": ["Guide"],
+        }
+
+    def test_status_is_immutable(self):
+        """Test that snapshots cannot be modified by callers."""
+        status = PacingPlatform().get_platform_status()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.session_active = True
+
+
+def _session() -> SessionMetadata:
+    return SessionMetadata(
+        session_id="session-1",
+        patient_id="patient-123",
+        clinician_id="clinician-1",
+        start_time=datetime.now(),
+    )
+
+
+class _FailingAudioProvider(IAudioProvider):
+    """Provider that yields a few chunks, then raises."""
+
+    def __init__(self, n_chunks: int = 2):
+        self.n_chunks = n_chunks
+
+    def start_stream(self) -> None:
+        pass
+
+    def stop_stream(self) -> None:
+        pass
+
+    def get_audio_chunks(self):
+        for _ in range(self.n_chunks):
+            yield np.zeros(160, dtype=np.int16)
+        raise OSError("device unplugged")
+
+    def get_sample_rate(self) -> int:
+        return 16000
+
+
+class TestLiveSession:
+    """Tests for start_live_session / stop_live_session."""
+
+    def _platform(self):
+        platform = PacingPlatform(transcriber=MockTranscriber(latency_ms=0))
+        agent = _NamedAgent("Counter")
+        platform.register_agent(agent)
+        return platform, agent
+
+    def test_awaiting_the_session_task_joins_the_session(self):
+        """Test that the returned task completes after audio and agents finish."""
+        platform, agent = self._platform()
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=0.05)
+
+        async def run():
+            session_task = await platform.start_live_session(_session(), audio)
+            assert not session_task.done()
+            await asyncio.wait_for(session_task, timeout=2.0)
+
+        asyncio.run(run())
+
+        assert agent.updates > 0
+        assert not platform.get_platform_status().session_active
+
+    def test_stop_live_session_ends_a_running_session(self):
+        """Test that stopping early completes the session task."""
+        platform, _ = self._platform()
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=60.0)
+
+        async def run():
+            session_task = await platform.start_live_session(_session(), audio)
+            await asyncio.sleep(0.05)
+            await asyncio.wait_for(platform.stop_live_session(), timeout=2.0)
+            return session_task
+
+        assert asyncio.run(run()).done()
+
+    def test_second_session_rejected_while_running(self):
+        """Test that only one live session runs at a time."""
+        platform, _ = self._platform()
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=60.0)
+
+        async def run():
+            await platform.start_live_session(_session(), audio)
+            with pytest.raises(RuntimeError):
+                await platform.start_live_session(_session(), audio)
+            await platform.stop_live_session()
+
+        asyncio.run(run())
+
+    def test_provider_failure_still_ends_the_session(self):
+        """Test that a provider error mid-session releases the session."""
+        platform, agent = self._platform()
+
+        async def run():
+            session_task = await platform.start_live_session(
+                _session(), _FailingAudioProvider(n_chunks=2)
+            )
+            with pytest.raises(OSError, match="unplugged"):
+                await asyncio.wait_for(session_task, timeout=2.0)
+            return platform.session_stream
+
+        stream = asyncio.run(run())
+
+        assert agent.updates == 2
+        assert agent.ended == ["session-1"]
+        assert not stream.is_active
+        assert stream._agent_tasks == [] and stream._agent_queues == {}
+
+    def test_cancelled_session_task_still_ends_the_session(self):
+        """Test that cancelling the session task runs the session teardown."""
+        platform, agent = self._platform()
+        audio = MockAudioProvider(chunk_duration_ms=10, total_duration_sec=60.0)
+
+        async def run():
+            session_task = await platform.start_live_session(_session(), audio)
+            await asyncio.sleep(0.05)
+            session_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await session_task
+
+        asyncio.run(run())
+
+        assert agent.ended == ["session-1"]
+        assert not platform.get_platform_status().session_active
@@ -0,0 +1,466 @@
+"""Tests for the session stream orchestrator."""
+
+import asyncio
+import time
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pacing.core.agent_interfaces import ISidecarAgent
+from pacing.core.audio_interfaces import IAudioProvider
+from pacing.impl.defaults.mock_transcriber import MockTranscriber
+from pacing.core.transcription_interfaces import ITranscriber
+from pacing.models.data_models import (
+    SessionContext,
+    SessionMetadata,
+    TranscriptionResult,
+    WordTiming,
+)
+from pacing.platform import BasicSessionStream, OperatingMode
+
+
+class _ListAudioProvider(IAudioProvider):
+    """Provider yielding a fixed number of small chunks."""
+
+    def __init__(self, n_chunks: int = 3):
+        self.n_chunks = n_chunks
+
+    def start_stream(self) -> None:
+        pass
+
+    def stop_stream(self) -> None:
+        pass
+
+    def get_audio_chunks(self):
+        for i in range(self.n_chunks):
+            yield np.full(160, i, dtype=np.int16)
+
+    def get_sample_rate(self) -> int:
+        return 16000
+
+
+class _RecordingAgent(ISidecarAgent):
+    """Agent that records every transcription it receives."""
+
+    def __init__(self, name: str = "Recorder", delay_sec: float = 0.0):
+        self.name = name
+        self.delay_sec = delay_sec
+        self.received = []
+
+    async def on_transcription_update(self, transcription, context=None):
+        if self.delay_sec:
+            await asyncio.sleep(self.delay_sec)
+        self.received.append(transcription)
+
+    def get_agent_name(self) -> str:
+        return self.name
+
+
+class _FailingAgent(_RecordingAgent):
+    """Agent that raises on every update."""
+
+    async def on_transcription_update(self, transcription, context=None):
+        raise RuntimeError("boom")
+
+
+def _session_metadata() -> SessionMetadata:
+    return SessionMetadata(
+        session_id="session-1",
+        patient_id="patient-123",
+        clinician_id="clinician-1",
+        start_time=datetime.now(),
+    )
+
+
+def _run_session(stream: BasicSessionStream, n_chunks: int = 3) -> None:
+    async def run():
+        await stream.start_session(
+            _session_metadata(),
+            _ListAudioProvider(n_chunks),
+            MockTranscriber(latency_ms=0),
+        )
+        await stream.stop_session()
+
+    asyncio.run(run())
+
+
+class TestBroadcast:
+    """Tests for transcription fan-out to agents."""
+
+    def test_all_agents_receive_every_transcription(self):
+        """Test that each registered agent sees each transcription."""
+        stream = BasicSessionStream(OperatingMode.DEV_MODE)
+        agents = [_RecordingAgent("A"), _RecordingAgent("B")]
+        for agent in agents:
+            stream.register_agent(agent)
+
+        _run_session(stream, n_chunks=3)
+
+        assert [len(agent.received) for agent in agents] == [3, 3]
+
+    def test_failing_agent_does_not_stop_others(self):
+        """Test that an exception in one agent is isolated."""
+        stream = BasicSessionStream()
+        healthy = _RecordingAgent("Healthy")
+        stream.register_agent(_FailingAgent("Failing"))
+        stream.register_agent(healthy)
+
+        _run_session(stream, n_chunks=2)
+
+        assert len(healthy.received) == 2
+
+    def test_slow_agent_is_bounded_by_timeout(self):
+        """Test that timeout_ms cancels updates that take too long."""
+        stream = BasicSessionStream()
+        slow = _RecordingAgent("Slow", delay_sec=1.0)
+        slow.timeout_ms = 10
+        fast = _RecordingAgent("Fast")
+        stream.register_agent(slow)
+        stream.register_agent(fast)
+
+        _run_session(stream, n_chunks=2)
+
+        assert slow.received == []
+        assert len(fast.received) == 2
+
+
+class TestAgentRegistry:
+    """Tests for registering and unregistering agents."""
+
+    def test_registration_is_idempotent_and_ordered(self):
+        """Test that duplicates are ignored and broadcast order is kept."""
+        stream = BasicSessionStream()
+        a, b, c = _RecordingAgent("A"), _RecordingAgent("B"), _RecordingAgent("C")
+        for agent in (a, b, a, c):
+            stream.register_agent(agent)
+
+        stream.unregister_agent(b)
+        stream.unregister_agent(b)
+
+        assert stream.registered_agents == [a, c]
+
+
+class TestAgentQueues:
+    """Tests for per-agent queue decoupling."""
+
+    def test_slow_agent_drops_oldest_updates_when_full(self):
+        """Test that a lagging agent keeps only the most recent updates."""
+        stream = BasicSessionStream(agent_queue_size=2)
+        slow = _RecordingAgent("Slow", delay_sec=0.05)
+        stream.register_agent(slow)
+
+        _run_session(stream, n_chunks=10)
+
+        # The worker holds one update in flight and two queued; the rest drop
+        assert 0 < len(slow.received) < 10
+        assert stream._dropped_updates > 0
+
+
+class _SlowCaptureProvider(_ListAudioProvider):
+    """Provider spending delay_sec producing each chunk, optionally failing."""
+
+    def __init__(self, n_chunks: int, delay_sec: float, fail_after=None):
+        super().__init__(n_chunks)
+        self.delay_sec = delay_sec
+        self.fail_after = fail_after
+
+    async def get_audio_chunks_async(self):
+        for i, chunk in enumerate(self.get_audio_chunks()):
+            if i == self.fail_after:
+                raise OSError("device unplugged")
+            await asyncio.sleep(self.delay_sec)
+            yield chunk
+
+
+class _ClosableTranscriber(MockTranscriber):
+    """Mock transcriber that counts aclose() calls."""
+
+    def __init__(self):
+        super().__init__(latency_ms=0)
+        self.closed = 0
+
+    async def aclose(self) -> None:
+        self.closed += 1
+
+
+class TestAudioCapture:
+    """Tests for capturing audio concurrently with transcription."""
+
+    def test_capture_overlaps_transcription(self):
+        """Test that the next chunk is captured while one is transcribed."""
+        stream = BasicSessionStream()
+        agent = _RecordingAgent()
+        stream.register_agent(agent)
+
+        async def run():
+            start = time.monotonic()
+            await stream.start_session(
+                _session_metadata(),
+                _SlowCaptureProvider(5, delay_sec=0.02),
+                MockTranscriber(latency_ms=20),
+            )
+            elapsed = time.monotonic() - start
+            await stream.stop_session()
+            return elapsed
+
+        elapsed = asyncio.run(run())
+
+        # Capturing then transcribing each chunk in turn would take 0.2 s
+        assert elapsed < 0.17
+        assert len(agent.received) == 5
+
+    def test_stop_session_closes_transcriber(self):
+        """Test that stopping a session releases the transcriber exactly once."""
+        stream = BasicSessionStream()
+        transcriber = _ClosableTranscriber()
+
+        async def run():
+            await stream.start_session(
+                _session_metadata(), _ListAudioProvider(2), transcriber
+            )
+            await stream.stop_session()
+            await stream.stop_session()
+
+        asyncio.run(run())
+
+        assert transcriber.closed == 1
+
+    def test_provider_error_propagates(self):
+        """Test that a failing provider ends the session with its error."""
+        stream = BasicSessionStream()
+        agent = _RecordingAgent()
+        stream.register_agent(agent)
+
+        async def run():
+            with pytest.raises(OSError, match="unplugged"):
+                await stream.start_session(
+                    _session_metadata(),
+                    _SlowCaptureProvider(5, delay_sec=0.0, fail_after=2),
+                    MockTranscriber(latency_ms=0),
+                )
+            await stream.stop_session()
+
+        asyncio.run(run())
+
+        assert len(agent.received) == 2
+
+
+class TestTranscriptionStream:
+    """Tests for get_transcription_stream."""
+
+    def test_live_consumer_sees_every_transcription(self):
+        """Test that a consumer streams a session as it runs, in any mode."""
+        stream = BasicSessionStream(OperatingMode.PROD_MODE)
+        transcriber = MockTranscriber(script=["a", "b", "c"], latency_ms=5)
+
+        async def run():
+            session = asyncio.create_task(
+                stream.start_session(
+                    _session_metadata(), _ListAudioProvider(3), transcriber
+                )
+            )
+            await asyncio.sleep(0)  # The session is active from its first step
+
+            async def consume():
+                return [t.text async for t in stream.get_transcription_stream()]
+
+            consumer = asyncio.create_task(consume())
+            await session
+            await stream.stop_session()
+            return await asyncio.wait_for(consumer, timeout=1.0)
+
+        assert asyncio.run(run()) == ["a", "b", "c"]
+        assert stream._stream_queues == []
+
+    def test_stored_transcriptions_replayed_after_session(self):
+        """Test that a DEV_MODE session's buffer is streamed once it ended."""
+        stream = BasicSessionStream(OperatingMode.DEV_MODE)
+        _run_session(stream, n_chunks=3)
+
+        async def consume():
+            return [t async for t in stream.get_transcription_stream()]
+
+        assert asyncio.run(consume()) == stream._transcription_buffer
+        assert len(stream._transcription_buffer) == 3
+
+
+class _FloatAudioProvider(_ListAudioProvider):
+    """Provider yielding float32 chunks at half scale."""
+
+    def get_audio_chunks(self):
+        for _ in range(self.n_chunks):
+            yield np.full(160, 0.5, dtype=np.float32)
+
+
+class TestAudioWindow:
+    """Tests for the rolling audio window."""
+
+    def test_window_is_capped_at_max_duration(self):
+        """Test that only the most recent max_audio_buffer_sec is kept."""
+        # 160-sample chunks at 16 kHz are 10 ms each; keep 25 ms
+        stream = BasicSessionStream(
+            OperatingMode.DEV_MODE, max_audio_buffer_sec=0.025
+        )
+
+        _run_session(stream, n_chunks=5)
+
+        window = stream.get_audio_window()
+        assert len(window) == 400
+        # Chunks hold their index: the last 2.5 of 5 chunks, oldest first
+        assert window.tolist() == [2] * 80 + [3] * 160 + [4] * 160
+
+    def test_window_cleared_in_prod_mode(self):
+        """Test that raw audio is ephemeral in PROD_MODE."""
+        stream = BasicSessionStream(OperatingMode.PROD_MODE)
+
+        _run_session(stream, n_chunks=3)
+
+        assert len(stream.get_audio_window()) == 0
+
+    def test_window_is_a_read_only_view(self):
+        """Test that the window is shared without copying and cannot be mutated."""
+        stream = BasicSessionStream(OperatingMode.DEV_MODE)
+
+        _run_session(stream, n_chunks=3)
+
+        window = stream.get_audio_window()
+        assert np.shares_memory(window, stream._audio_ring)
+        assert not window.flags.writeable
+
+    def test_oversized_chunk_keeps_its_most_recent_samples(self):
+        """Test that a chunk longer than the window overwrites all of it."""
+        stream = BasicSessionStream()
+
+        stream._reset_audio_ring(80)
+        stream._append_audio(np.arange(10, dtype=np.int16))
+        stream._append_audio(np.arange(200, dtype=np.int16))
+
+        assert stream.get_audio_window().tolist() == list(range(120, 200))
+
+    def test_float32_chunks_are_converted_to_pcm16(self):
+        """Test that float providers fill the window with scaled int16 audio."""
+        stream = BasicSessionStream(OperatingMode.DEV_MODE)
+        transcriber = MockTranscriber(latency_ms=0)
+        received = []
+        original = transcriber.transcribe_chunk
+
+        async def recording_transcribe(audio_chunk, sample_rate, is_final=False):
+            received.append(audio_chunk)
+            return await original(audio_chunk, sample_rate, is_final)
+
+        transcriber.transcribe_chunk = recording_transcribe
+
+        async def run():
+            await stream.start_session(
+                _session_metadata(), _FloatAudioProvider(2), transcriber
+            )
+            await stream.stop_session()
+
+        asyncio.run(run())
+
+        window = stream.get_audio_window()
+        assert window.dtype == np.int16
+        assert window.tolist() == [16384] * 320
+        assert all(chunk.dtype == np.int16 for chunk in received)
+
+    @pytest.mark.parametrize("dtype", [np.int32, np.float32])
+    def test_window_only_accepts_int16(self, dtype):
+        """Test that unconverted audio is rejected rather than truncated."""
+        stream = BasicSessionStream()
+        stream._reset_audio_ring(80)
+
+        with pytest.raises(TypeError):
+            stream._append_audio(np.zeros(10, dtype=dtype))
+
+
+class _ScriptedWindowTranscriber(ITranscriber):
+    """Transcriber replaying timed hypotheses and recording window sizes."""
+
+    def __init__(self, hypotheses):
+        self.hypotheses = list(hypotheses)
+        self.window_sizes = []
+
+    async def transcribe_chunk(self, audio_chunk, sample_rate, is_final=False):
+        self.window_sizes.append(len(audio_chunk))
+        words = [
+            WordTiming(word=w, start=s, end=e) for w, s, e in self.hypotheses.pop(0)
+        ]
+        return TranscriptionResult(
+            text=" ".join(w.word for w in words), confidence_score=0.9, words=words
+        )
+
+    def supports_speaker_diarization(self) -> bool:
+        return False
+
+
+class TestWindowDecoding:
+    """Tests for LocalAgreement-2 window decoding (10 ms chunks at 16 kHz)."""
+
+    def test_commits_agreed_words_and_skips_confirmed_audio(self):
+        """Test that only agreed words are broadcast and their audio dropped."""
+        stream = BasicSessionStream(window_decoding=True)
+        agent = _RecordingAgent()
+        stream.register_agent(agent)
+        transcriber = _ScriptedWindowTranscriber(
+            [
+                [("hello", 0.0, 0.005)],
+                [("hello", 0.0, 0.005), ("there", 0.005, 0.015)],
+                # Decoded from the audio after "hello" (the first 80 samples)
+                [("there", 0.0, 0.01), ("friend", 0.01, 0.02)],
+            ]
+        )
+
+        async def run():
+            await stream.start_session(
+                _session_metadata(), _ListAudioProvider(3), transcriber
+            )
+            await stream.stop_session()
+
+        asyncio.run(run())
+
+        assert transcriber.window_sizes == [160, 320, 400]
+        assert [t.text for t in agent.received] == ["hello", "there", "friend"]
+        assert all(not t.is_partial for t in agent.received)
+
+
+class _ContextRecordingAgent(_RecordingAgent):
+    """Agent that records the context passed with each update."""
+
+    def __init__(self, name: str = "ContextRecorder"):
+        super().__init__(name)
+        self.contexts = []
+
+    async def on_transcription_update(self, transcription, context=None):
+        self.contexts.append(context)
+
+
+class TestSessionContext:
+    """Tests for the per-session context handed to agents."""
+
+    def test_one_shared_context_per_session(self):
+        """Test that every agent and update receives the same context object."""
+        stream = BasicSessionStream()
+        agents = [_ContextRecordingAgent("A"), _ContextRecordingAgent("B")]
+        for agent in agents:
+            stream.register_agent(agent)
+
+        _run_session(stream, n_chunks=3)
+
+        contexts = agents[0].contexts + agents[1].contexts
+        assert len(contexts) == 6
+        assert all(context is contexts[0] for context in contexts)
+        assert isinstance(contexts[0], SessionContext)
+        assert contexts[0].patient_id == "patient-123"
+        assert contexts[0]["session_id"] == "session-1"
+
+    def test_context_is_immutable(self):
+        """Test that agents cannot modify the shared context."""
+        context = SessionContext.from_metadata(_session_metadata())
+
+        with pytest.raises(FrozenInstanceError):
+            context.patient_id = "other"
+        with pytest.raises(KeyError):
+            context["missing"]
+        assert context.get("missing", "default") == "default"
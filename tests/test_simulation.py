@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime
+from types import MappingProxyType
 from pacing.simulation.simulation_engine import (
     Mutation,
     MutationType,
@@ -19,6 +20,184 @@ from pacing.models.data_models import (
     InterventionType,
 )
 
+# Keeps this module on one worker under `pytest -n auto --dist=loadgroup`
+# (pytest-xdist), so the module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group(name="simulation")
+
+# Node dates for test graphs (no test depends on them being current)
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def mock_model():
+    """One model for the module (it is stateless apart from its caches)."""
+    return MockSimulationModel()
+
+
+@pytest.fixture
+def empty_graph():
+    """A fresh graph per test, since tests mutate it."""
+    return PatientGraph(patient_id="patient-123")
+
+
+@pytest.fixture
+def sim_ctx(mock_model, empty_graph):
+    """A fresh simulation context (with empty history) per test."""
+    return SimulationContext(empty_graph, mock_model)
+
+
+# Mutations are never changed by applying them, so tests can share these
+_HOUSING_MUTATION = Mutation(
+    mutation_type=MutationType.MODIFY_HOUSING,
+    parameters={"status": "stable", "impact_score": 0.7},
+    description="Stable housing",
+)
+_MAT_MUTATION = Mutation(
+    mutation_type=MutationType.ADD_INTERVENTION,
+    parameters={
+        "intervention_id": "int-1",
+        "intervention_type": InterventionType.MEDICATION,
+        "description": "MAT",
+        "start_date": _NOW,
+    },
+    description="Start MAT",
+)
+_EMPLOYMENT_MUTATION = Mutation(
+    mutation_type=MutationType.MODIFY_EMPLOYMENT,
+    parameters={"status": "employed", "impact_score": 0.6},
+    description="Employment",
+)
+_SCENARIOS = MappingProxyType(
+    {"Scenario A": [_HOUSING_MUTATION], "Scenario B": [_MAT_MUTATION]}
+)
+
+
+# Built once and validated once; each test edits its own clone
+_GRAPH_WITH_EVENT = PatientGraph(
+    patient_id="patient-123",
+    events=[
+        Event(
+            event_id="event-1",
+            event_type=EventType.OTHER,
+            description="Original description",
+            date=_NOW,
+            impact_score=0.0,
+        )
+    ],
+)
+
+
+def _graph_with_event() -> PatientGraph:
+    return _GRAPH_WITH_EVENT.clone()
+
+
+def _check_add_event(modified):
+    assert [e.event_id for e in modified.events] == ["event-1"]
+
+
+def _check_remove_event(modified):
+    assert modified.events == []
+
+
+def _check_modify_event(modified):
+    assert modified.events[0].description == "Updated description"
+    assert modified.events[0].impact_score == 0.8
+
+
+def _check_add_intervention(modified):
+    assert [i.intervention_id for i in modified.interventions] == ["int-1"]
+
+
+def _check_modify_housing(modified):
+    assert [e.event_type for e in modified.events] == [EventType.HOUSING_CHANGE]
+    assert modified.metadata["simulated_housing_status"] == "stable"
+
+
+def _check_modify_employment(modified):
+    assert [e.event_type for e in modified.events] == [EventType.JOB_CHANGE]
+    assert modified.metadata["simulated_employment_status"] == "employed"
+
+
+# (name, graph builder, mutation, check of the modified graph)
+_MUTATION_CASES = [
+    (
+        "add_event",
+        lambda: PatientGraph(patient_id="patient-123"),
+        Mutation(
+            mutation_type=MutationType.ADD_EVENT,
+            parameters={
+                "event_id": "event-1",
+                "event_type": EventType.HOUSING_CHANGE,
+                "description": "Moved",
+                "date": _NOW,
+            },
+        ),
+        _check_add_event,
+    ),
+    (
+        "remove_event",
+        _graph_with_event,
+        Mutation(
+            mutation_type=MutationType.REMOVE_EVENT,
+            parameters={"event_id": "event-1"},
+        ),
+        _check_remove_event,
+    ),
+    (
+        "modify_event",
+        _graph_with_event,
+        Mutation(
+            mutation_type=MutationType.MODIFY_EVENT,
+            parameters={
+                "event_id": "event-1",
+                "description": "Updated description",
+                "impact_score": 0.8,
+            },
+        ),
+        _check_modify_event,
+    ),
+    (
+        "add_intervention",
+        lambda: PatientGraph(patient_id="patient-123"),
+        Mutation(
+            mutation_type=MutationType.ADD_INTERVENTION,
+            parameters={
+                "intervention_id": "int-1",
+                "intervention_type": InterventionType.THERAPY,
+                "description": "CBT",
+                "start_date": _NOW,
+            },
+        ),
+        _check_add_intervention,
+    ),
+    (
+        "modify_housing",
+        lambda: PatientGraph(patient_id="patient-123"),
+        Mutation(
+            mutation_type=MutationType.MODIFY_HOUSING,
+            parameters={
+                "status": "stable",
+                "description": "Housing stabilized",
+                "impact_score": 0.7,
+            },
+        ),
+        _check_modify_housing,
+    ),
+    (
+        "modify_employment",
+        lambda: PatientGraph(patient_id="patient-123"),
+        Mutation(
+            mutation_type=MutationType.MODIFY_EMPLOYMENT,
+            parameters={
+                "status": "employed",
+                "description": "Got job",
+                "impact_score": 0.6,
+            },
+        ),
+        _check_modify_employment,
+    ),
+]
+
 
 class TestMutation:
     """Tests for Mutation class."""
@@ -31,192 +210,189 @@ class TestMutation:
                 "event_id": "event-1",
                 "event_type": EventType.HOUSING_CHANGE,
                 "description": "Moved to stable housing",
-                "date": datetime.now(),
+                "date": _NOW,
             },
             description="Housing stabilized",
         )
         assert mutation.mutation_type == MutationType.ADD_EVENT
         assert mutation.description == "Housing stabilized"
+        assert not hasattr(mutation, "__dict__")  # Slotted
 
-    def test_add_event_mutation(self):
-        """Test applying ADD_EVENT mutation."""
-        graph = PatientGraph(patient_id="patient-123")
-        assert len(graph.events) == 0
-
-        mutation = Mutation(
-            mutation_type=MutationType.ADD_EVENT,
-            parameters={
-                "event_id": "event-1",
-                "event_type": EventType.HOUSING_CHANGE,
-                "description": "Moved",
-                "date": datetime.now(),
-            },
-        )
+    @pytest.mark.parametrize("case", _MUTATION_CASES, ids=lambda case: case[0])
+    def test_mutation_apply(self, case):
+        """Test that apply edits a copy and leaves the original graph unchanged."""
+        _, build_graph, mutation, check = case
+        graph = build_graph()
+        original = graph.model_copy(deep=True)
 
         modified_graph = mutation.apply(graph)
 
-        # Original graph unchanged
-        assert len(graph.events) == 0
-        # Modified graph has new event
-        assert len(modified_graph.events) == 1
-        assert modified_graph.events[0].event_id == "event-1"
+        assert graph == original
+        check(modified_graph)
 
-    def test_remove_event_mutation(self):
-        """Test applying REMOVE_EVENT mutation."""
+    def test_remove_and_modify_by_id_in_sequence(self):
+        """Test that id lookups stay correct as mutations edit the lists."""
+        # Known-valid throwaway nodes: model_construct skips validation
         graph = PatientGraph(
             patient_id="patient-123",
             events=[
-                Event(
-                    event_id="event-1",
+                Event.model_construct(
+                    event_id=f"event-{i}",
                     event_type=EventType.OTHER,
                     description="Test event",
-                    date=datetime.now(),
+                    date=_NOW,
+                )
+                for i in range(3)
+            ],
+            interventions=[
+                Intervention.model_construct(
+                    intervention_id="intervention-1",
+                    intervention_type=InterventionType.THERAPY,
+                    description="CBT",
+                    start_date=_NOW,
                 )
             ],
         )
-        assert len(graph.events) == 1
-
-        mutation = Mutation(
-            mutation_type=MutationType.REMOVE_EVENT,
-            parameters={"event_id": "event-1"},
-        )
-
-        modified_graph = mutation.apply(graph)
-
-        # Original graph unchanged
-        assert len(graph.events) == 1
-        # Modified graph has event removed
-        assert len(modified_graph.events) == 0
+        mutations = [
+            Mutation(MutationType.REMOVE_EVENT, {"event_id": "event-0"}),
+            Mutation(
+                MutationType.MODIFY_EVENT,
+                {"event_id": "event-2", "description": "Edited"},
+            ),
+            Mutation(
+                MutationType.REMOVE_INTERVENTION,
+                {"intervention_id": "intervention-1"},
+            ),
+        ]
 
-    def test_modify_event_mutation(self):
-        """Test applying MODIFY_EVENT mutation."""
+        modified_graph = graph
+        for mutation in mutations:
+            modified_graph = mutation.apply(modified_graph)
+
+        assert [e.event_id for e in modified_graph.events] == ["event-1", "event-2"]
+        assert modified_graph.events[1].description == "Edited"
+        assert modified_graph.interventions == []
+        assert len(graph.events) == 3 and len(graph.interventions) == 1
+        assert graph.events[2].description == "Test event"
+
+    def test_remove_and_modify_apply_to_every_duplicate(self):
+        """Test that nodes sharing an id are all removed or all modified."""
+        events = [
+            Event.model_construct(
+                event_id=event_id,
+                event_type=EventType.OTHER,
+                description="Test event",
+                date=_NOW,
+            )
+            for event_id in ["dup", "event-1", "dup"]
+        ]
+        interventions = [
+            Intervention.model_construct(
+                intervention_id="dup",
+                intervention_type=InterventionType.THERAPY,
+                description="CBT",
+                start_date=_NOW,
+            )
+            for _ in range(2)
+        ]
         graph = PatientGraph(
-            patient_id="patient-123",
-            events=[
-                Event(
-                    event_id="event-1",
-                    event_type=EventType.OTHER,
-                    description="Original description",
-                    date=datetime.now(),
-                    impact_score=0.0,
-                )
-            ],
+            patient_id="patient-123", events=events, interventions=interventions
         )
 
-        mutation = Mutation(
-            mutation_type=MutationType.MODIFY_EVENT,
-            parameters={
-                "event_id": "event-1",
-                "description": "Updated description",
-                "impact_score": 0.8,
-            },
+        modified = Mutation(
+            MutationType.MODIFY_EVENT, {"event_id": "dup", "description": "Edited"}
+        ).apply(graph)
+        removed = Mutation(MutationType.REMOVE_EVENT, {"event_id": "dup"}).apply(
+            graph
         )
+        no_interventions = Mutation(
+            MutationType.REMOVE_INTERVENTION, {"intervention_id": "dup"}
+        ).apply(graph)
+
+        assert [e.description for e in modified.events] == [
+            "Edited",
+            "Test event",
+            "Edited",
+        ]
+        assert [e.event_id for e in removed.events] == ["event-1"]
+        assert no_interventions.interventions == []
+        assert graph.events == events and graph.interventions == interventions
 
-        modified_graph = mutation.apply(graph)
+    def test_absent_ids_leave_the_lists_shared(self):
+        """Test that removing or modifying a missing id copies nothing."""
+        graph = PatientGraph(patient_id="patient-123")
 
-        # Original unchanged
-        assert graph.events[0].description == "Original description"
-        assert graph.events[0].impact_score == 0.0
-        # Modified has updates
-        assert modified_graph.events[0].description == "Updated description"
-        assert modified_graph.events[0].impact_score == 0.8
+        results = [
+            Mutation(mutation_type, {key: "missing"}).apply(graph)
+            for mutation_type, key in [
+                (MutationType.REMOVE_EVENT, "event_id"),
+                (MutationType.MODIFY_EVENT, "event_id"),
+                (MutationType.REMOVE_INTERVENTION, "intervention_id"),
+            ]
+        ]
 
-    def test_add_intervention_mutation(self):
-        """Test applying ADD_INTERVENTION mutation."""
-        graph = PatientGraph(patient_id="patient-123")
-        assert len(graph.interventions) == 0
+        assert all(r.events is graph.events for r in results)
+        assert all(r.interventions is graph.interventions for r in results)
 
-        mutation = Mutation(
-            mutation_type=MutationType.ADD_INTERVENTION,
-            parameters={
-                "intervention_id": "int-1",
-                "intervention_type": InterventionType.THERAPY,
-                "description": "CBT",
-                "start_date": datetime.now(),
-            },
+    def test_mutation_copies_only_what_it_writes(self):
+        """Test that untouched containers are shared and the input is unchanged."""
+        graph = PatientGraph(
+            patient_id="patient-123",
+            interventions=[
+                Intervention(
+                    intervention_id="intervention-1",
+                    intervention_type=InterventionType.THERAPY,
+                    description="CBT",
+                    start_date=_NOW,
+                )
+            ],
+            metadata={"source": "intake"},
         )
 
-        modified_graph = mutation.apply(graph)
+        modified_graph = create_stable_housing_mutation().apply(graph)
 
-        assert len(graph.interventions) == 0
-        assert len(modified_graph.interventions) == 1
-        assert modified_graph.interventions[0].intervention_id == "int-1"
+        assert graph.events == [] and graph.metadata == {"source": "intake"}
+        assert modified_graph.metadata == {
+            "source": "intake",
+            "simulated_housing_status": "stable",
+        }
+        assert modified_graph.interventions is graph.interventions
+        assert modified_graph.substance_use_records is graph.substance_use_records
 
-    def test_modify_housing_mutation(self):
-        """Test applying MODIFY_HOUSING mutation."""
-        graph = PatientGraph(patient_id="patient-123")
+    def test_subclass_can_override_a_handler(self):
+        """Test that a Mutation subclass can replace one type's handler."""
 
-        mutation = Mutation(
-            mutation_type=MutationType.MODIFY_HOUSING,
-            parameters={
-                "status": "stable",
-                "description": "Housing stabilized",
-                "impact_score": 0.7,
-            },
-        )
-
-        modified_graph = mutation.apply(graph)
+        def tag_metadata(mutation, graph, now):
+            graph.metadata["tagged"] = mutation.parameters["tag"]
 
-        # Should add a housing change event
-        assert len(modified_graph.events) == 1
-        assert modified_graph.events[0].event_type == EventType.HOUSING_CHANGE
-        # Should update metadata
-        assert "simulated_housing_status" in modified_graph.metadata
-        assert modified_graph.metadata["simulated_housing_status"] == "stable"
+        class TaggingMutation(Mutation):
+            __slots__ = ()
+            handlers = {**Mutation.handlers, MutationType.ADD_EVENT: tag_metadata}
 
-    def test_modify_employment_mutation(self):
-        """Test applying MODIFY_EMPLOYMENT mutation."""
         graph = PatientGraph(patient_id="patient-123")
+        mutation = TaggingMutation(MutationType.ADD_EVENT, {"tag": "x"})
 
-        mutation = Mutation(
-            mutation_type=MutationType.MODIFY_EMPLOYMENT,
-            parameters={
-                "status": "employed",
-                "description": "Got job",
-                "impact_score": 0.6,
-            },
-        )
-
-        modified_graph = mutation.apply(graph)
+        mutation.apply_inplace(graph)
 
-        # Should add a job change event
-        assert len(modified_graph.events) == 1
-        assert modified_graph.events[0].event_type == EventType.JOB_CHANGE
-        # Should update metadata
-        assert "simulated_employment_status" in modified_graph.metadata
+        assert graph.metadata == {"tagged": "x"} and graph.events == []
+        assert MutationType.ADD_EVENT in Mutation.handlers
+        assert Mutation.handlers[MutationType.ADD_EVENT] is not tag_metadata
 
 
 class TestSimulationContext:
     """Tests for SimulationContext class."""
 
-    def test_simulation_context_creation(self):
+    def test_simulation_context_creation(self, mock_model, empty_graph):
         """Test creating a simulation context."""
-        graph = PatientGraph(patient_id="patient-123")
-        model = MockSimulationModel()
-        sim = SimulationContext(graph, model)
+        sim = SimulationContext(empty_graph, mock_model)
 
-        assert sim.baseline_graph == graph
-        assert sim.model == model
+        assert sim.baseline_graph == empty_graph
+        assert sim.model == mock_model
         assert len(sim.simulation_history) == 0
 
-    def test_simulate_mutation(self):
+    def test_simulate_mutation(self, sim_ctx):
         """Test simulating a single mutation."""
-        graph = PatientGraph(patient_id="patient-123")
-        model = MockSimulationModel()
-        sim = SimulationContext(graph, model)
-
-        mutation = Mutation(
-            mutation_type=MutationType.ADD_INTERVENTION,
-            parameters={
-                "intervention_id": "int-1",
-                "intervention_type": InterventionType.MEDICATION,
-                "description": "MAT",
-                "start_date": datetime.now(),
-            },
-            description="Start MAT",
-        )
-
-        result = sim.simulate_mutation(mutation)
+        result = sim_ctx.simulate_mutation(_MAT_MUTATION)
 
         # Should have risk comparison
         assert "baseline_risk" in result
@@ -226,28 +402,13 @@ class TestSimulationContext:
         assert "mutation" in result
         assert result["mutation"]["description"] == "Start MAT"
         # Should be in history
-        assert len(sim.simulation_history) == 1
+        assert len(sim_ctx.simulation_history) == 1
 
-    def test_simulate_multiple_mutations(self):
+    def test_simulate_multiple_mutations(self, sim_ctx):
         """Test simulating multiple mutations together."""
-        graph = PatientGraph(patient_id="patient-123")
-        model = MockSimulationModel()
-        sim = SimulationContext(graph, model)
-
-        mutations = [
-            Mutation(
-                mutation_type=MutationType.MODIFY_HOUSING,
-                parameters={"status": "stable", "impact_score": 0.7},
-                description="Stable housing",
-            ),
-            Mutation(
-                mutation_type=MutationType.MODIFY_EMPLOYMENT,
-                parameters={"status": "employed", "impact_score": 0.6},
-                description="Employment",
-            ),
-        ]
-
-        result = sim.simulate_multiple_mutations(mutations)
+        result = sim_ctx.simulate_multiple_mutations(
+            [_HOUSING_MUTATION, _EMPLOYMENT_MUTATION]
+        )
 
         # Should have combined effect
         assert "baseline_risk" in result
@@ -256,33 +417,34 @@ class TestSimulationContext:
         assert "mutations" in result
         assert len(result["mutations"]) == 2
 
-    def test_compare_scenarios(self):
-        """Test comparing multiple scenarios."""
-        graph = PatientGraph(patient_id="patient-123")
-        model = MockSimulationModel()
-        sim = SimulationContext(graph, model)
+    def test_mutation_sequence_leaves_baseline_unchanged(self, mock_model):
+        """Test that in-place application works on a copy of the baseline."""
+        graph = PatientGraph(patient_id="patient-123", metadata={"source": "intake"})
+        sim = SimulationContext(graph, mock_model)
+        mutations = [
+            create_stable_housing_mutation(),
+            create_employment_mutation(),
+            create_mat_intervention_mutation(),
+        ]
 
-        scenarios = {
-            "Scenario A": [
-                Mutation(
-                    mutation_type=MutationType.MODIFY_HOUSING,
-                    parameters={"status": "stable", "impact_score": 0.7},
-                )
-            ],
-            "Scenario B": [
-                Mutation(
-                    mutation_type=MutationType.ADD_INTERVENTION,
-                    parameters={
-                        "intervention_id": "int-1",
-                        "intervention_type": InterventionType.MEDICATION,
-                        "description": "MAT",
-                        "start_date": datetime.now(),
-                    },
-                )
-            ],
+        modified = sim._apply_mutations(mutations)
+
+        assert [e.event_type for e in modified.events] == [
+            EventType.HOUSING_CHANGE,
+            EventType.JOB_CHANGE,
+        ]
+        assert len(modified.interventions) == 1
+        assert set(modified.metadata) == {
+            "source",
+            "simulated_housing_status",
+            "simulated_employment_status",
         }
+        assert graph.events == [] and graph.interventions == []
+        assert graph.metadata == {"source": "intake"}
 
-        result = sim.compare_scenarios(scenarios)
+    def test_compare_scenarios(self, sim_ctx):
+        """Test comparing multiple scenarios."""
+        result = sim_ctx.compare_scenarios(_SCENARIOS)
 
         # Should have results for both scenarios
         assert "scenarios" in result
@@ -292,27 +454,158 @@ class TestSimulationContext:
         assert "ranked" in result
         assert "best_scenario" in result
 
-    def test_reset_baseline(self):
-        """Test resetting the baseline graph."""
-        graph1 = PatientGraph(patient_id="patient-123")
+    def test_compare_scenarios_shape(self, sim_ctx, monkeypatch):
+        """Test ranking and result layout with the model stubbed out."""
+        modified_risks = iter([0.2, 0.8, 0.5])
+
+        def stub_deltas(baseline, modified, options=None):
+            return [
+                {"baseline_risk": 0.5, "modified_risk": next(modified_risks)}
+                for _ in modified
+            ]
+
+        monkeypatch.setattr(sim_ctx.model, "calculate_risk_deltas", stub_deltas)
+
+        result = sim_ctx.compare_scenarios(
+            {
+                "Housing": [_HOUSING_MUTATION],
+                "MAT": [_MAT_MUTATION],
+                "Both": [_HOUSING_MUTATION, _MAT_MUTATION],
+            }
+        )
+
+        assert result["ranked"] == ["Housing", "Both", "MAT"]
+        assert result["best_scenario"] == "Housing"
+        both = result["scenarios"]["Both"]
+        assert both["scenario_name"] == "Both"
+        assert [m["description"] for m in both["mutations"]] == [
+            "Stable housing",
+            "Start MAT",
+        ]
+        assert len(sim_ctx.simulation_history) == 3
+
+    def test_compare_scenarios_evaluates_identical_graphs_once(self):
+        """Test that scenarios yielding the same graph share one evaluation."""
+        graph = PatientGraph(patient_id="patient-123")
         model = MockSimulationModel()
-        sim = SimulationContext(graph1, model)
+        batches = []
+        original = model.calculate_risk_deltas
 
-        # Run a simulation
-        mutation = Mutation(
-            mutation_type=MutationType.MODIFY_HOUSING,
-            parameters={"status": "stable", "impact_score": 0.7},
+        def counting_deltas(baseline, modified, options=None):
+            batches.append(len(modified))
+            return original(baseline, modified, options)
+
+        model.calculate_risk_deltas = counting_deltas
+        sim = SimulationContext(graph, model)
+
+        result = sim.compare_scenarios({"Baseline": [], "Also baseline": []})
+
+        assert batches == [1]
+        assert len(result["scenarios"]) == 2
+        assert len(sim.simulation_history) == 2
+
+    def test_repeated_scenario_is_reproducible(self, mock_model):
+        """Test that running a scenario again gives the same assessment."""
+        sim = SimulationContext(PatientGraph(patient_id="patient-123"), mock_model)
+
+        def scenario():
+            return [
+                create_stable_housing_mutation(),
+                create_mat_intervention_mutation(),
+            ]
+
+        first = sim.simulate_multiple_mutations(scenario())
+        second = sim.simulate_multiple_mutations(scenario())
+
+        assert second["modified_risk"] == first["modified_risk"]
+        assert first["modified_report"].risk_factors == (
+            second["modified_report"].risk_factors
+        )
+
+    def test_same_mutations_share_one_evaluation(self):
+        """Test that scenarios listing the same mutations share one evaluation."""
+        model = MockSimulationModel()
+        batches = []
+        original = model.calculate_risk_deltas
+
+        def counting_deltas(baseline, modified, options=None):
+            batches.append(len(modified))
+            return original(baseline, modified, options)
+
+        model.calculate_risk_deltas = counting_deltas
+        sim = SimulationContext(PatientGraph(patient_id="patient-123"), model)
+        mat = create_mat_intervention_mutation()
+
+        result = sim.compare_scenarios(
+            {
+                "MAT": [mat],
+                "MAT again": [mat],
+                "Another MAT": [create_mat_intervention_mutation()],
+            }
+        )
+
+        assert batches == [2]
+        risks = {r["modified_risk"] for r in result["scenarios"].values()}
+        assert len(risks) == 1
+
+    def test_compare_scenarios_applies_shared_prefixes_once(
+        self, mock_model, empty_graph
+    ):
+        """Test that scenarios starting with the same mutations reuse them."""
+        applied = []
+
+        class CountingMutation(Mutation):
+            def apply(self, graph, now=None):
+                applied.append(self.description)
+                return super().apply(graph, now)
+
+        mat, housing, job = (
+            CountingMutation(m.mutation_type, m.parameters, m.description)
+            for m in (
+                create_mat_intervention_mutation(),
+                create_stable_housing_mutation(),
+                create_employment_mutation(),
+            )
+        )
+        sim = SimulationContext(empty_graph, mock_model)
+
+        result = sim.compare_scenarios(
+            {"A": [mat], "B": [mat, housing], "C": [mat, housing, job]}
+        )
+
+        assert sorted(applied) == sorted(
+            [mat.description, housing.description, job.description]
         )
-        sim.simulate_mutation(mutation)
-        assert len(sim.simulation_history) == 1
+        assert len(result["scenarios"]["C"]["mutations"]) == 3
+
+    def test_reset_baseline(self, sim_ctx):
+        """Test resetting the baseline graph."""
+        # Run a simulation
+        sim_ctx.simulate_mutation(_HOUSING_MUTATION)
+        assert len(sim_ctx.simulation_history) == 1
 
         # Reset with new baseline
         graph2 = PatientGraph(patient_id="patient-456")
-        sim.reset_baseline(graph2)
+        sim_ctx.reset_baseline(graph2)
 
         # Should have new baseline and cleared history
-        assert sim.baseline_graph.patient_id == "patient-456"
-        assert len(sim.simulation_history) == 0
+        assert sim_ctx.baseline_graph.patient_id == "patient-456"
+        assert len(sim_ctx.simulation_history) == 0
+
+    def test_history_entries_are_read_only_snapshots(self, mock_model, empty_graph):
+        """Test that editing a returned result does not change the history."""
+        sim = SimulationContext(empty_graph, mock_model)
+        result = sim.simulate_mutation(create_stable_housing_mutation())
+        comparison = sim.compare_scenarios({"Housing": []})
+
+        result["delta"] = 1.0
+        (entry, scenario_entry) = sim.get_simulation_history()
+
+        assert entry["delta"] != 1.0
+        assert scenario_entry["scenario_name"] == "Housing"
+        assert comparison["scenarios"]["Housing"]["scenario_name"] == "Housing"
+        with pytest.raises(TypeError):
+            entry["delta"] = 1.0
 
 
 class TestConvenienceFunctions:
@@ -344,3 +637,19 @@ class TestConvenienceFunctions:
         assert mutation.mutation_type == MutationType.ADD_INTERVENTION
         assert "intervention_type" in mutation.parameters
         assert mutation.parameters["intervention_type"] == InterventionType.MEDICATION
+
+    def test_mat_mutation_assigns_id_and_start_when_applied(self):
+        """Test that ids and dates are filled in deterministically on apply."""
+        mutation = create_mat_intervention_mutation()
+        graph = PatientGraph(patient_id="patient-123")
+
+        first, again = mutation.apply(graph, _NOW), mutation.apply(graph, _NOW)
+        second = mutation.apply(first, _NOW)
+
+        assert "intervention_id" not in mutation.parameters
+        assert first == again and first.content_hash() == again.content_hash()
+        assert [i.intervention_id for i in second.interventions] == [
+            "sim_intervention_0",
+            "sim_intervention_1",
+        ]
+        assert all(i.start_date == _NOW for i in second.interventions)
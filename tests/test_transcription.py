@@ -0,0 +1,414 @@
+"""Tests for transcribers."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from pacing.core.transcription_interfaces import ITranscriber
+from pacing.impl.defaults.mock_transcriber import (
+    AdaptiveConfidenceTranscriber,
+    MockTranscriber,
+)
+from pacing.impl.transcription.batching import BatchedTranscriber
+from pacing.impl.transcription.local_agreement import LocalAgreement2
+from pacing.models.data_models import TranscriptionResult, WordTiming
+
+
+class _EchoTranscriber(ITranscriber):
+    """Transcriber that returns the first sample value as text."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batch_sizes = []
+        self.closed = False
+
+    async def transcribe_chunk(self, audio_chunk, sample_rate, is_final=False):
+        return TranscriptionResult(
+            text=str(int(audio_chunk[0])), confidence_score=1.0
+        )
+
+    async def transcribe_batch(self, audio_chunks, sample_rate, is_final=False):
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        self.batch_sizes.append(len(audio_chunks))
+        return await super().transcribe_batch(audio_chunks, sample_rate, is_final)
+
+    def supports_speaker_diarization(self) -> bool:
+        return False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _chunk(value: int) -> np.ndarray:
+    return np.full(4, value, dtype=np.int16)
+
+
+class TestBatchedTranscriber:
+    """Tests for BatchedTranscriber."""
+
+    def test_concurrent_requests_share_one_batch(self):
+        """Test that requests arriving together are submitted as one batch."""
+        inner = _EchoTranscriber()
+        batched = BatchedTranscriber(inner, batch_window_ms=20, max_batch=16)
+
+        async def run():
+            return await asyncio.gather(
+                *[batched.transcribe_chunk(_chunk(i), 16000) for i in range(5)]
+            )
+
+        results = asyncio.run(run())
+
+        assert [r.text for r in results] == ["0", "1", "2", "3", "4"]
+        assert inner.batch_sizes == [5]
+
+    def test_batches_are_capped_at_max_batch(self):
+        """Test that max_batch splits large bursts."""
+        inner = _EchoTranscriber()
+        batched = BatchedTranscriber(inner, batch_window_ms=20, max_batch=2)
+
+        async def run():
+            return await asyncio.gather(
+                *[batched.transcribe_chunk(_chunk(i), 16000) for i in range(5)]
+            )
+
+        asyncio.run(run())
+
+        assert inner.batch_sizes == [2, 2, 1]
+
+    def test_errors_propagate_to_callers(self):
+        """Test that a failing batch raises in every waiting caller."""
+        batched = BatchedTranscriber(_EchoTranscriber(fail=True))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(batched.transcribe_chunk(_chunk(1), 16000))
+
+    def test_late_request_joins_open_window(self):
+        """Test that a request arriving inside the window joins the batch."""
+        inner = _EchoTranscriber()
+        batched = BatchedTranscriber(inner, batch_window_ms=200, max_batch=16)
+
+        async def late():
+            await asyncio.sleep(0.02)
+            return await batched.transcribe_chunk(_chunk(2), 16000)
+
+        async def run():
+            return await asyncio.gather(
+                batched.transcribe_chunk(_chunk(1), 16000), late()
+            )
+
+        results = asyncio.run(run())
+
+        assert [r.text for r in results] == ["1", "2"]
+        assert inner.batch_sizes == [2]
+
+    def test_aclose_flushes_queue_and_stops_worker(self):
+        """Test that aclose() resolves queued requests, then ends the task."""
+        inner = _EchoTranscriber()
+        batched = BatchedTranscriber(inner, batch_window_ms=1000, max_batch=16)
+
+        async def run():
+            pending = [
+                asyncio.ensure_future(batched.transcribe_chunk(_chunk(i), 16000))
+                for i in range(3)
+            ]
+            await asyncio.sleep(0)  # let the requests reach the queue
+            worker = batched._worker
+            await asyncio.wait_for(batched.aclose(), timeout=0.5)
+            results = await asyncio.gather(*pending)
+            await batched.aclose()  # idempotent
+            restarted = await batched.transcribe_chunk(_chunk(7), 16000)
+            await batched.aclose()
+            return worker, results, restarted
+
+        worker, results, restarted = asyncio.run(run())
+
+        assert worker.done() and not worker.cancelled()
+        assert [r.text for r in results] == ["0", "1", "2"]
+        assert restarted.text == "7"
+        assert not inner.closed  # Only the batching worker is stopped
+        assert batched._worker is None
+
+
+class _LengthTranscriber(_EchoTranscriber):
+    """Transcriber recording each submitted chunk's length and is_final flag."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def transcribe_chunk(self, audio_chunk, sample_rate, is_final=False):
+        self.calls.append((len(audio_chunk), is_final))
+        return await super().transcribe_chunk(audio_chunk, sample_rate, is_final)
+
+
+async def _stream(n_chunks: int, pause_after: int = -1):
+    for i in range(n_chunks):
+        if i == pause_after:
+            await asyncio.sleep(0.1)
+        yield _chunk(i)
+
+
+class _TaskRecordingTranscriber(_EchoTranscriber):
+    """Echo transcriber noting which task ran each chunk."""
+
+    def __init__(self):
+        super().__init__()
+        self.tasks = []
+
+    async def transcribe_chunk(self, audio_chunk, sample_rate, is_final=False):
+        self.tasks.append(asyncio.current_task())
+        return await super().transcribe_chunk(audio_chunk, sample_rate, is_final)
+
+
+class TestTranscribeBatch:
+    """Tests for the default ITranscriber.transcribe_batch."""
+
+    def test_results_in_input_order(self):
+        """Test empty, single and multi-chunk batches."""
+        transcriber = _EchoTranscriber()
+
+        async def run(n):
+            chunks = [_chunk(i) for i in range(n)]
+            return [r.text for r in await transcriber.transcribe_batch(chunks, 16000)]
+
+        assert [asyncio.run(run(n)) for n in (0, 1, 3)] == [
+            [],
+            ["0"],
+            ["0", "1", "2"],
+        ]
+
+    def test_single_chunk_runs_in_callers_task(self):
+        """Test that a one-chunk batch is awaited directly, not gathered."""
+        transcriber = _TaskRecordingTranscriber()
+
+        async def run():
+            await transcriber.transcribe_batch([_chunk(0)], 16000)
+            return asyncio.current_task()
+
+        caller = asyncio.run(run())
+
+        assert transcriber.tasks == [caller]
+
+
+class TestTranscribeStreamBatched:
+    """Tests for ITranscriber.transcribe_stream_batched (4-sample chunks)."""
+
+    def test_chunks_coalesced_up_to_duration(self):
+        """Test that chunks are concatenated per batch, tail marked final."""
+        transcriber = _LengthTranscriber()
+
+        async def run():
+            # 12 samples at 1 kHz = 12 ms per batch: three chunks
+            stream = transcriber.transcribe_stream_batched(
+                _stream(7), 1000, max_batch_duration_ms=12
+            )
+            return [r.text async for r in stream]
+
+        texts = asyncio.run(run())
+
+        assert texts == ["0", "3", "6"]
+        assert transcriber.calls == [(12, False), (12, False), (4, True)]
+
+    def test_max_wait_flushes_partial_batch(self):
+        """Test that a stalled stream does not hold buffered audio."""
+        transcriber = _LengthTranscriber()
+
+        async def run():
+            stream = transcriber.transcribe_stream_batched(
+                _stream(4, pause_after=2),
+                1000,
+                max_batch_duration_ms=100,
+                max_wait_ms=20,
+            )
+            return [r.text async for r in stream]
+
+        texts = asyncio.run(run())
+
+        assert texts == ["0", "2"]
+        assert transcriber.calls == [(8, False), (8, True)]
+
+
+def _words(*words: str):
+    return [WordTiming(word=w, start=i, end=i + 1) for i, w in enumerate(words)]
+
+
+class TestLocalAgreement2:
+    """Tests for the LocalAgreement-2 commit policy."""
+
+    def test_commits_only_the_agreed_prefix(self):
+        """Test that words are committed once two hypotheses agree on them."""
+        agreement = LocalAgreement2()
+
+        assert agreement.update(_words("take", "the")) == []
+        committed = agreement.update(_words("take", "a", "walk"))
+
+        assert [w.word for w in committed] == ["take"]
+
+    def test_comparison_ignores_case_and_flush_returns_tail(self):
+        """Test that agreement is case-insensitive and flush drains the tail."""
+        agreement = LocalAgreement2()
+        agreement.update(_words("Hello", "there"))
+
+        committed = agreement.update(_words("hello", "there", "friend"))
+
+        assert [w.word for w in committed] == ["hello", "there"]
+        assert [w.word for w in agreement.flush()] == ["friend"]
+        assert agreement.flush() == []
+
+
+class TestAdaptiveConfidenceTranscriber:
+    """Tests for AdaptiveConfidenceTranscriber's text-based penalties."""
+
+    @pytest.mark.parametrize(
+        "text, factor",
+        [
+            ("I feel fine today", 1.0),
+            ("Started Suboxone last week", 0.85),
+            ("I never skipped it", 0.90),
+            ("No, I didn't.", 0.90),
+            ("Nothing I know of", 1.0),
+            ("Opioids are dangerous", 0.85),
+            ("Did not take methadone", 0.85 * 0.90),
+            (" ".join(["word"] * 16), 0.90),
+            (" ".join(["word"] * 15), 1.0),
+            ("I did not take " + " ".join(["methadone"] * 12), 0.90 * 0.85 * 0.90),
+        ],
+    )
+    def test_penalties(self, monkeypatch, text, factor):
+        """Test the length, difficult-term and negation multipliers."""
+        transcriber = AdaptiveConfidenceTranscriber(
+            script=[text], latency_ms=0, base_confidence=0.8, confidence_variance=0
+        )
+        # Never take the random low-confidence branch
+        monkeypatch.setattr(transcriber, "_next_random", lambda: 1.0)
+
+        result = asyncio.run(transcriber.transcribe_chunk(_chunk(0), 16000))
+
+        assert result.confidence_score == pytest.approx(0.8 * factor)
+
+    def test_adjusted_result_keeps_lowercased_text(self):
+        """Test that agents reuse the text_lower computed for the penalties."""
+        transcriber = AdaptiveConfidenceTranscriber(
+            script=["Took METHADONE"], latency_ms=0
+        )
+
+        result = asyncio.run(transcriber.transcribe_chunk(_chunk(0), 16000))
+
+        assert result.__dict__["text_lower"] == "took methadone"
+
+
+    def test_batch_matches_chunk_by_chunk(self):
+        """Test that vectorized batch scoring equals per-chunk scoring."""
+        script = [
+            "I feel fine today",
+            "Did not take methadone",
+            "",
+            " ".join(["word"] * 20),
+            "No, I didn't.",
+        ]
+
+        def transcriber():
+            return AdaptiveConfidenceTranscriber(script=script, latency_ms=0, seed=11)
+
+        async def one_by_one():
+            t = transcriber()
+            return [await t.transcribe_chunk(_chunk(0), 16000) for _ in script]
+
+        async def batched():
+            t = transcriber()
+            return await t.transcribe_batch([_chunk(0)] * len(script), 16000)
+
+        expected, results = asyncio.run(one_by_one()), asyncio.run(batched())
+
+        assert [r.text for r in results] == script
+        assert [r.confidence_score for r in results] == [
+            r.confidence_score for r in expected
+        ]
+
+
+class TestMockTranscriber:
+    """Tests for MockTranscriber."""
+
+    def test_seeded_confidences_are_reproducible_and_bounded(self):
+        """Test that a seed fixes the confidence sequence across instances."""
+
+        async def confidences(seed):
+            transcriber = MockTranscriber(script=["x"] * 50, latency_ms=0, seed=seed)
+            return [
+                (await transcriber.transcribe_chunk(_chunk(0), 16000)).confidence_score
+                for _ in range(50)
+            ]
+
+        first, second = asyncio.run(confidences(7)), asyncio.run(confidences(7))
+
+        assert first == second
+        assert all(0.5 <= c <= 0.95 for c in first)
+        assert any(c < 0.70 for c in first)  # The 15% low-confidence branch
+
+    def test_zero_latency_yields_only_when_asked(self):
+        """Test that latency_ms=0 skips the event loop unless yield_each_chunk."""
+
+        async def ticks_during(transcriber):
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await asyncio.sleep(0)  # Let the ticker start
+            before = ticks
+            for _ in range(5):
+                await transcriber.transcribe_chunk(_chunk(0), 16000)
+            task.cancel()
+            return ticks - before
+
+        assert asyncio.run(ticks_during(MockTranscriber(latency_ms=0))) == 0
+        yielding = MockTranscriber(latency_ms=0, yield_each_chunk=True)
+        assert asyncio.run(ticks_during(yielding)) == 5
+
+    def test_unvalidated_results_satisfy_the_model(self):
+        """Test that results built with model_construct would pass validation."""
+
+        async def results():
+            transcriber = AdaptiveConfidenceTranscriber(
+                script=["not the methadone dose"] * 200, latency_ms=0, seed=3
+            )
+            return [
+                await transcriber.transcribe_chunk(_chunk(0), 16000)
+                for _ in range(200)
+            ]
+
+        for result in asyncio.run(results()):
+            validated = TranscriptionResult.model_validate(result.model_dump())
+            assert validated == result
+
+    def test_script_exhausts_to_empty_text_and_resets(self):
+        """Test that lines play in order, then "" until reset_script."""
+        transcriber = MockTranscriber(script=["one", "two"], latency_ms=0)
+
+        async def texts(n):
+            return [
+                (await transcriber.transcribe_chunk(_chunk(0), 16000)).text
+                for _ in range(n)
+            ]
+
+        assert asyncio.run(texts(3)) == ["one", "two", ""]
+        transcriber.reset_script()
+        assert asyncio.run(texts(1)) == ["one"]
+
+    def test_assigning_a_script_restarts_playback(self):
+        """Test that a newly assigned script is played from its first line."""
+        transcriber = MockTranscriber(script=["one", "two"], latency_ms=0)
+
+        async def text():
+            return (await transcriber.transcribe_chunk(_chunk(0), 16000)).text
+
+        assert asyncio.run(text()) == "one"
+        transcriber.script = ["alpha", "beta"]
+        assert asyncio.run(text()) == "alpha"
+        assert transcriber.script == ["alpha", "beta"]
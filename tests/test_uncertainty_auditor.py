@@ -0,0 +1,292 @@
+"""Tests for the UncertaintyAuditor agent."""
+
+import asyncio
+import logging
+import random
+
+import pytest
+
+from pacing.impl.agents import uncertainty_auditor
+from pacing.impl.agents.keyword_matcher import KeywordMatcher
+from pacing.impl.agents.uncertainty_auditor import (
+    DEFAULT_MEDICAL_TERMS,
+    UncertaintyAuditor,
+)
+from pacing.models.data_models import TranscriptionResult
+
+
+def _audit(auditor: UncertaintyAuditor, text: str, confidence: float) -> None:
+    transcription = TranscriptionResult(text=text, confidence_score=confidence)
+    asyncio.run(auditor.on_transcription_update(transcription))
+
+
+class TestFlagging:
+    """Tests for the flagging criteria."""
+
+    @pytest.mark.parametrize(
+        "confidence, priority",
+        [(0.0, 5), (0.45, 5), (0.50, 3), (0.55, 3), (0.60, 2), (0.65, 2)],
+    )
+    def test_low_confidence_priority_bands(self, confidence, priority):
+        """Test that lower confidence yields higher review priority."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+
+        _audit(auditor, "I have been sleeping badly", confidence)
+
+        (item,) = auditor.get_review_queue()
+        assert item.priority == priority
+        assert item.reason.startswith("Low confidence score")
+
+    def test_medical_terms_flagged_despite_high_confidence(self):
+        """Test that medication mentions are flagged with a stable reason."""
+        auditor = UncertaintyAuditor()
+
+        _audit(auditor, "Methadone dose went up", 0.95)
+
+        (item,) = auditor.get_review_queue()
+        assert item.priority == 4
+        assert item.reason == "Contains medical terms: dose, methadone"
+
+    def test_confident_plain_and_empty_text_not_flagged(self):
+        """Test that confident non-medical and blank segments pass."""
+        auditor = UncertaintyAuditor()
+
+        _audit(auditor, "The weather was nice", 0.95)
+        _audit(auditor, "   ", 0.10)
+
+        assert auditor.get_review_queue() == ()
+        assert auditor.total_transcriptions_processed == 2
+
+    def test_medical_term_flagging_can_be_disabled(self):
+        """Test auto_flag_medical_terms=False."""
+        auditor = UncertaintyAuditor(auto_flag_medical_terms=False)
+
+        _audit(auditor, "Methadone dose went up", 0.95)
+
+        assert auditor.get_review_queue() == ()
+
+    def test_medical_term_flagging_can_be_toggled(self):
+        """Test switching auto_flag_medical_terms after construction."""
+        auditor = UncertaintyAuditor()
+
+        auditor.auto_flag_medical_terms = False
+        _audit(auditor, "Methadone dose went up", 0.95)
+        auditor.auto_flag_medical_terms = True
+        _audit(auditor, "Naloxone kit", 0.95)
+
+        assert auditor.auto_flag_medical_terms is True
+        assert [item.transcription.text for item in auditor.review_queue] == [
+            "Naloxone kit"
+        ]
+
+    def test_custom_medical_terms(self):
+        """Test that custom terms replace the defaults, case-insensitively."""
+        auditor = UncertaintyAuditor(medical_terms=["Naltrexone", "patch"])
+
+        _audit(auditor, "Started naltrexone yesterday", 0.95)
+        _audit(auditor, "Methadone dose went up", 0.95)
+
+        (item,) = auditor.get_review_queue()
+        assert item.reason == "Contains medical terms: naltrexone"
+
+    def test_overlapping_terms_all_reported(self):
+        """Test that terms occurring inside other terms are still listed."""
+        auditor = UncertaintyAuditor(medical_terms=["dose", "overdose"])
+
+        _audit(auditor, "Worried about an overdose", 0.95)
+
+        (item,) = auditor.get_review_queue()
+        assert item.reason == "Contains medical terms: dose, overdose"
+
+
+class TestKeywordMatcher:
+    """Tests for the single-pass keyword matcher."""
+
+    def test_find_all_reports_nested_and_overlapping_keywords(self):
+        """Test that keywords inside, prefixing, or overlapping others are found."""
+        matcher = KeywordMatcher(["dose", "dosage", "overdose", "sage", "age"])
+
+        assert matcher.find_all("overdose dosage") == {
+            "dose",
+            "overdose",
+            "dosage",
+            "sage",
+            "age",
+        }
+
+    def test_find_all_matches_naive_scan(self):
+        """Test agreement with one substring test per keyword."""
+        matcher = KeywordMatcher(DEFAULT_MEDICAL_TERMS)
+        text = "took 8 mg buprenorphine, then a milligram dosage of naloxone"
+
+        assert matcher.find_all(text) == {
+            term for term in DEFAULT_MEDICAL_TERMS if term in text
+        }
+
+    def test_shared_prefixes_are_factored(self):
+        """Test that keywords sharing a prefix compile into one trie branch."""
+        matcher = KeywordMatcher(["dose", "dosage", "dosed"])
+
+        assert matcher._scanner.pattern == "dos(?:age|e(?:d)?)"
+
+    def test_find_all_matches_naive_scan_on_random_text(self):
+        """Test the trie pattern against per-keyword scans on random strings."""
+        rng = random.Random(0)
+        keywords = {
+            "".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(20)
+        }
+        matcher = KeywordMatcher(keywords)
+
+        for _ in range(200):
+            text = "".join(rng.choices("abcd", k=rng.randint(0, 12)))
+            expected = {k for k in keywords if k in text}
+            assert matcher.find_all(text) == expected
+            assert matcher.contains(text) == bool(expected)
+
+    def test_empty_keyword_set_never_matches(self):
+        """Test that no keywords (or only empty ones) match nothing."""
+        matcher = KeywordMatcher(["", ""])
+
+        assert not matcher.contains("anything")
+        assert matcher.find_all("anything") == frozenset()
+
+
+class TestReviewQueue:
+    """Tests for review queue ordering and maintenance."""
+
+    def test_queue_ordered_by_priority_then_arrival(self):
+        """Test highest priority first, oldest first within a priority."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+        for text, confidence in [
+            ("a", 0.65),
+            ("b", 0.45),
+            ("c", 0.55),
+            ("d", 0.45),
+            ("e", 0.65),
+        ]:
+            _audit(auditor, text, confidence)
+
+        queue = auditor.get_review_queue()
+
+        assert [item.transcription.text for item in queue] == list("bdcae")
+        assert auditor.review_queue == queue
+
+    def test_clear_reviewed_items_keeps_order(self):
+        """Test that clearing reviewed items leaves the rest correctly ordered."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+        for text, confidence in [("a", 0.65), ("b", 0.45), ("c", 0.55)]:
+            _audit(auditor, text, confidence)
+        reviewed = auditor.get_review_queue()[0]
+
+        assert auditor.mark_reviewed(reviewed.item_id, "checked")
+        assert auditor.clear_reviewed_items() == 1
+        assert [item.transcription.text for item in auditor.review_queue] == [
+            "c",
+            "a",
+        ]
+        assert auditor.get_statistics()["total_in_queue"] == 2
+
+    def test_queue_view_shared_until_changed(self):
+        """Test that polling returns the same tuple until an item is added."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+        _audit(auditor, "a", 0.65)
+
+        first = auditor.get_review_queue()
+        assert auditor.get_review_queue() is first
+        snapshot = auditor.get_review_queue_snapshot()
+        snapshot.clear()
+
+        _audit(auditor, "b", 0.45)
+        second = auditor.get_review_queue()
+
+        assert second is not first
+        assert [item.transcription.text for item in second] == ["b", "a"]
+        assert len(first) == 1
+
+    def test_iter_unreviewed_items(self):
+        """Test that the generator skips reviewed items."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+        for text in "abc":
+            _audit(auditor, text, 0.65)
+        auditor.mark_reviewed(auditor.get_review_queue()[1].item_id)
+
+        unreviewed = auditor.iter_unreviewed_items()
+
+        assert [item.transcription.text for item in unreviewed] == ["a", "c"]
+        assert auditor.get_statistics()["reviewed"] == 1
+
+
+class TestTelemetry:
+    """Tests for per-flag telemetry."""
+
+    def test_flags_are_logged_not_printed(self, caplog, capsys):
+        """Test that flagging goes to the module logger at DEBUG level."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70, max_queue_size=1)
+
+        with caplog.at_level(logging.DEBUG, logger=uncertainty_auditor.__name__):
+            _audit(auditor, "a", 0.45)
+            _audit(auditor, "b", 0.45)
+
+        assert capsys.readouterr().out == ""
+        levels = [record.levelno for record in caplog.records]
+        assert levels.count(logging.DEBUG) == 2
+        assert levels.count(logging.WARNING) == 1
+        assert "Flagged: 'a'" in caplog.records[0].getMessage()
+
+
+class TestItemIds:
+    """Tests for review item identifiers."""
+
+    def test_ids_prefixed_by_session_and_unique_across_sessions(self):
+        """Test that the counter keeps ids unique when sessions change."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+
+        _audit(auditor, "a", 0.45)
+        auditor.on_session_start("s1", {})
+        _audit(auditor, "b", 0.45)
+        auditor.on_session_end("s1")
+        auditor.on_session_start("s2", {})
+        _audit(auditor, "c", 0.45)
+
+        ids = {item.transcription.text: item.item_id for item in auditor.review_queue}
+        assert ids == {"a": "nosession-0", "b": "s1-1", "c": "s2-2"}
+
+
+class TestQueueStatistics:
+    """Tests for queue statistics and the queue-size warning."""
+
+    def test_statistics_follow_queue_and_review_changes(self):
+        """Test that counts reflect every queue and review change."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70)
+        _audit(auditor, "a", 0.45)
+        _audit(auditor, "b", 0.65)
+
+        stats = auditor.get_statistics()
+        assert stats["priority_distribution"] == {5: 1, 2: 1}
+        stats["priority_distribution"].clear()  # Callers get their own copy
+
+        auditor.mark_reviewed(auditor.review_queue[0].item_id)
+        assert auditor.get_statistics()["reviewed"] == 1
+
+        _audit(auditor, "c", 0.45)
+        stats = auditor.get_statistics()
+        assert stats["priority_distribution"] == {5: 2, 2: 1}
+        assert (stats["unreviewed"], stats["reviewed"]) == (2, 1)
+
+        auditor.get_unreviewed_items()[0].reviewed = True  # Not via mark_reviewed
+        assert auditor.get_statistics()["reviewed"] == 2
+
+    def test_queue_size_warning_once_per_excursion(self, caplog):
+        """Test that the warning is not repeated until the queue shrinks."""
+        auditor = UncertaintyAuditor(confidence_threshold=0.70, max_queue_size=1)
+
+        with caplog.at_level(logging.WARNING, logger=uncertainty_auditor.__name__):
+            for text in "abc":
+                _audit(auditor, text, 0.45)
+            for item in auditor.review_queue:
+                auditor.mark_reviewed(item.item_id)
+            auditor.clear_reviewed_items()
+            for text in "de":
+                _audit(auditor, text, 0.45)
+
+        assert len(caplog.records) == 2